@@ -1,6 +1,12 @@
 import os
+import re
 import csv
 import zipfile
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
 from pathlib import Path
 from flask import Flask, request, render_template, send_file, flash, redirect, url_for
 from werkzeug.utils import secure_filename
@@ -25,6 +31,15 @@ UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'pdf'}
 MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
 
+# Checkbox glyphs that come through PDF text extraction as black boxes
+_CHECKBOX_STRIP = str.maketrans('', '', '\uf0d7•●☐☑✓')
+
+# Non-digit characters allowed in a phone number
+_PHONE_ALLOWED = frozenset('+-() .xX')
+
+# Four-digit 19xx/20xx year inside a date of birth string
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
 
@@ -118,7 +133,7 @@ def is_valid_phone_number(value: str) -> bool:
         return False
     
     # Remove common phone number formatting characters
-    cleaned = ''.join(c for c in value if c.isdigit() or c in ['+', '-', '(', ')', ' ', '.', 'x', 'X'])
+    cleaned = ''.join(c for c in value if c.isdigit() or c in _PHONE_ALLOWED)
     
     # Must contain digits
     digits_only = ''.join(c for c in cleaned if c.isdigit())
@@ -150,9 +165,6 @@ def format_date_dd_mm_yyyy(date_str):
     if not date_str:
         return ""
     
-    import re
-    from datetime import datetime
-    
     # Try to parse common date formats
     date_formats = [
         '%Y-%m-%d',      # 2023-12-25
@@ -248,7 +260,7 @@ def build_output_row(row):
         email_address = email_address.split(';')[0].strip()
     
     # Build display name from first name + surname
-    display_name = " ".join([p for p in [first_name, surname] if p]).strip()
+    display_name = " ".join(filter(None, (first_name, surname))).strip()
     
     # Use only home phone (work phone is not included)
     phone_number = home_phone if home_phone else ""
@@ -464,6 +476,81 @@ def parse_pdf_to_row(pdf_path: str) -> dict:
     
     return data
 
+def build_plan_file_stem(pdf_data: dict) -> str:
+    """Build the "[First Name] [Last Name] [Year] - [ID]" part of the plan filenames"""
+    first_name = pdf_data.get('First name (Details of the Client)', '').strip()
+    surname = pdf_data.get('Surname (Details of the Client)', '').strip()
+    dob_str = pdf_data.get('Date of birth (Details of the Client)', '').strip()
+    ndis_number = pdf_data.get('NDIS number (Details of the Client)', '').strip()
+    
+    # Extract year from date of birth
+    year = None
+    if dob_str:
+        year_match = _YEAR_RE.search(dob_str)
+        if year_match:
+            year = year_match.group(0)
+    
+    # If no year from DOB, use current year
+    if not year:
+        year = datetime.now().strftime('%Y')
+    
+    # Extract ID from NDIS number (first 6 digits) or generate one
+    client_id = ''
+    if ndis_number:
+        digits = re.sub(r'\D', '', ndis_number)
+        if len(digits) >= 6:
+            client_id = digits[:6]
+        elif len(digits) > 0:
+            client_id = digits.ljust(6, '0')
+    
+    # If no ID from NDIS, generate a simple ID from timestamp
+    if not client_id:
+        client_id = datetime.now().strftime('%H%M%S')
+    
+    name_part = f"{first_name} {surname}".strip() if (first_name or surname) else "test test"
+    return f"{name_part} {year} - {client_id}"
+
+# Document render pool, shared by all requests and created on first use. Workers are
+# spawned rather than forked, as forking a threaded server can copy locks held by
+# other request threads.
+_RENDER_POOL = None
+_RENDER_POOL_LOCK = threading.Lock()
+
+def _get_render_pool():
+    global _RENDER_POOL
+    with _RENDER_POOL_LOCK:
+        if _RENDER_POOL is None:
+            _RENDER_POOL = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                               mp_context=multiprocessing.get_context('spawn'))
+        return _RENDER_POOL
+
+def _discard_render_pool(pool):
+    """Drop a broken pool so the next request starts a fresh one"""
+    global _RENDER_POOL
+    with _RENDER_POOL_LOCK:
+        if _RENDER_POOL is pool:
+            _RENDER_POOL = None
+    pool.shutdown(wait=False)
+
+def render_documents(jobs):
+    """Run (function, args) document jobs, across worker processes when there are several"""
+    if len(jobs) < 2 or (os.cpu_count() or 1) < 2:
+        # A pool only adds overhead for one job or on a single CPU. The document
+        # builders share no mutable state, so concurrent requests can render inline.
+        for function, args in jobs:
+            function(*args)
+        return
+    
+    pool = _get_render_pool()
+    try:
+        futures = [pool.submit(function, *args) for function, args in jobs]
+        # result() re-raises any worker error here, as the inline calls did
+        for future in futures:
+            future.result()
+    except BrokenProcessPool:
+        _discard_render_pool(pool)
+        raise
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -834,7 +921,7 @@ def upload_file():
             active_users = None
             team_value = pdf_data.get('Neighbourhood Care representative team', '')
             # Clean up checkbox characters
-            team_value = team_value.replace('\uf0d7', '').replace('•', '').replace('●', '').replace('☐', '').replace('☑', '').replace('✓', '').strip()
+            team_value = team_value.translate(_CHECKBOX_STRIP).strip()
             
             # Pre-load CSV files if any document needs them
             if generate_service_agreement or generate_service_estimate:
@@ -877,6 +964,9 @@ def upload_file():
             # Get contact name once (used by multiple documents)
             contact_name = request.form.get('contact_name', '').strip()
             
+            # PDFs are rendered together by render_documents once they're all queued
+            pdf_jobs = []
+            
             # Generate Service Agreement PDF if requested
             if generate_service_agreement:
                 # Import the service agreement generation function
@@ -884,7 +974,8 @@ def upload_file():
                 sa_filename = f"service_agreement_{unique_filename}.pdf"
                 sa_path = os.path.join(app.config['UPLOAD_FOLDER'], sa_filename)
                 # Pass source PDF path for signature extraction and pre-loaded data
-                create_service_agreement_from_data(pdf_data, sa_path, contact_name, filepath, ndis_items, active_users)
+                pdf_jobs.append((create_service_agreement_from_data,
+                                 (pdf_data, sa_path, contact_name, filepath, ndis_items, active_users)))
                 output_files.append(('pdf', sa_path, 'Service Agreement.pdf'))
             
             # Generate Emergency & Disaster Plan PDF if requested
@@ -893,7 +984,7 @@ def upload_file():
                 from create_final_tables import create_emergency_disaster_plan_from_data
                 edp_filename = f"emergency_disaster_plan_{unique_filename}.pdf"
                 edp_path = os.path.join(app.config['UPLOAD_FOLDER'], edp_filename)
-                create_emergency_disaster_plan_from_data(pdf_data, edp_path, contact_name, active_users)
+                pdf_jobs.append((create_emergency_disaster_plan_from_data, (pdf_data, edp_path, contact_name, active_users)))
                 output_files.append(('pdf', edp_path, 'Emergency & Disaster Plan.pdf'))
             
             # Generate Service Estimate CSV if requested
@@ -911,88 +1002,37 @@ def upload_file():
                 from create_final_tables import create_risk_assessment_from_data
                 ra_filename = f"risk_assessment_{unique_filename}.pdf"
                 ra_path = os.path.join(app.config['UPLOAD_FOLDER'], ra_filename)
-                create_risk_assessment_from_data(pdf_data, ra_path, contact_name, active_users)
+                pdf_jobs.append((create_risk_assessment_from_data, (pdf_data, ra_path, contact_name, active_users)))
                 output_files.append(('pdf', ra_path, 'Risk Assessment.pdf'))
             
+            # The support and medication plan filenames share one client stem, built once per upload
+            if generate_support_plan or generate_medication_plan:
+                plan_file_stem = build_plan_file_stem(pdf_data)
+            
             # Generate Support Plan DOCX if requested
             if generate_support_plan:
                 # Import the support plan generation function
                 from create_final_tables import create_support_plan_from_data
-                from datetime import datetime
-                import re
-                
-                # Extract client information for filename
-                first_name = pdf_data.get('First name (Details of the Client)', '').strip()
-                surname = pdf_data.get('Surname (Details of the Client)', '').strip()
-                dob_str = pdf_data.get('Date of birth (Details of the Client)', '').strip()
-                ndis_number = pdf_data.get('NDIS number (Details of the Client)', '').strip()
-                
-                # Extract year from date of birth
-                year = None
-                if dob_str:
-                    year_match = re.search(r'\b(19|20)\d{2}\b', dob_str)
-                    if year_match:
-                        year = year_match.group(0)
-                
-                # If no year from DOB, use current year
-                if not year:
-                    year = datetime.now().strftime('%Y')
-                
-                # Extract ID from NDIS number (first 6 digits) or generate one
-                client_id = ''
-                if ndis_number:
-                    digits = re.sub(r'\D', '', ndis_number)
-                    if len(digits) >= 6:
-                        client_id = digits[:6]
-                    elif len(digits) > 0:
-                        client_id = digits.ljust(6, '0')
-                
-                # If no ID from NDIS, generate a simple ID from timestamp
-                if not client_id:
-                    client_id = datetime.now().strftime('%H%M%S')
                 
                 # Build filename: "Support Plan - [First Name] [Last Name] [Year] - [ID].docx"
-                name_part = f"{first_name} {surname}".strip() if (first_name or surname) else "test test"
-                sp_filename = f"Support Plan - {name_part} {year} - {client_id}.pdf"
+                sp_filename = f"Support Plan - {plan_file_stem}.pdf"
                 sp_path = os.path.join(app.config['UPLOAD_FOLDER'], sp_filename)
-                create_support_plan_from_data(pdf_data, sp_path, contact_name, active_users)
+                pdf_jobs.append((create_support_plan_from_data, (pdf_data, sp_path, contact_name, active_users)))
                 output_files.append(('pdf', sp_path, sp_filename))
             
             # Generate Medication Assistance Plan DOCX if requested
             if generate_medication_plan:
                 from create_final_tables import create_medication_assistance_plan_from_data
-                from datetime import datetime
-                import re
-                
-                first_name = pdf_data.get('First name (Details of the Client)', '').strip()
-                surname = pdf_data.get('Surname (Details of the Client)', '').strip()
-                dob_str = pdf_data.get('Date of birth (Details of the Client)', '').strip()
-                ndis_number = pdf_data.get('NDIS number (Details of the Client)', '').strip()
                 
-                year = None
-                if dob_str:
-                    year_match = re.search(r'\b(19|20)\d{2}\b', dob_str)
-                    if year_match:
-                        year = year_match.group(0)
-                if not year:
-                    year = datetime.now().strftime('%Y')
-                
-                client_id = ''
-                if ndis_number:
-                    digits = re.sub(r'\D', '', ndis_number)
-                    if len(digits) >= 6:
-                        client_id = digits[:6]
-                    elif len(digits) > 0:
-                        client_id = digits.ljust(6, '0')
-                if not client_id:
-                    client_id = datetime.now().strftime('%H%M%S')
-                
-                name_part = f"{first_name} {surname}".strip() if (first_name or surname) else "test test"
-                mp_filename = f"Medication Assistance Plan - {name_part} {year} - {client_id}.pdf"
+                mp_filename = f"Medication Assistance Plan - {plan_file_stem}.pdf"
                 mp_path = os.path.join(app.config['UPLOAD_FOLDER'], mp_filename)
-                create_medication_assistance_plan_from_data(pdf_data, mp_path, contact_name, active_users)
+                pdf_jobs.append((create_medication_assistance_plan_from_data, (pdf_data, mp_path, contact_name, active_users)))
                 output_files.append(('pdf', mp_path, mp_filename))
             
+            # The service agreement reads signatures from the upload, so this has to
+            # finish before it is removed
+            render_documents(pdf_jobs)
+            
             # Clean up input file
             os.remove(filepath)
             
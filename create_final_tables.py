@@ -5,15 +5,31 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
+from reportlab.lib.utils import ImageReader
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
 from reportlab.pdfgen import canvas
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 import csv
+import calendar
 import os
 import re
+import sys
 import io
+import zlib
+import hashlib
 import tempfile
+import traceback
+import logging
+import operator
+from datetime import datetime
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# Full tracebacks for handled errors are opt-in (SIG_DEBUG=1); formatting them
+# reads source files for every frame
+_DEBUG = os.environ.get("SIG_DEBUG") == "1"
 
 # Font registration - lazy loaded to avoid slow startup
 _VERDANA_FONT = None
@@ -152,12 +168,699 @@ except Exception:
 
 # Define custom colors
 BLUE_COLOR = colors.HexColor('#316DB2')
+GRAY_COLOR = colors.HexColor('#d9d9d9')
+
+# Service agreement paragraph styles - built once and shared by every document
+_SAMPLE_STYLES = getSampleStyleSheet()
+
+SA_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_SAMPLE_STYLES['Title'],
+    fontSize=18,
+    textColor=BLUE_COLOR,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leftIndent=0
+)
+
+SA_NORMAL_STYLE = ParagraphStyle(
+    'CustomNormal',
+    parent=_SAMPLE_STYLES['Normal'],
+    fontSize=11,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leading=14,
+    leftIndent=0
+)
+
+# Style with no space after for immediate following text
+SA_NORMAL_NO_SPACE_STYLE = ParagraphStyle(
+    'CustomNormalNoSpace',
+    parent=_SAMPLE_STYLES['Normal'],
+    fontSize=11,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leading=14,
+    leftIndent=0
+)
+
+# Style for headings that should have no space after
+SA_HEADING_NO_SPACE_STYLE = ParagraphStyle(
+    'CustomHeadingNoSpace',
+    parent=_SAMPLE_STYLES['Heading2'],
+    fontSize=14,
+    textColor=BLUE_COLOR,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leftIndent=0
+)
+
+# Style for black headings with no space after
+SA_BLACK_HEADING_NO_SPACE_STYLE = ParagraphStyle(
+    'BlackHeadingNoSpace',
+    parent=_SAMPLE_STYLES['Heading2'],
+    fontSize=14,
+    textColor=colors.black,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leftIndent=0
+)
+
+# Style for bold headings (questions) with no space after
+SA_BOLD_HEADING_NO_SPACE_STYLE = ParagraphStyle(
+    'BoldHeadingNoSpace',
+    parent=_SAMPLE_STYLES['Normal'],
+    fontSize=11,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leading=14,
+    leftIndent=0
+)
+
+SA_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_SAMPLE_STYLES['Heading2'],
+    fontSize=14,
+    textColor=BLUE_COLOR,
+    alignment=TA_LEFT,
+    spaceAfter=12,
+    leftIndent=0
+)
+
+SA_BLACK_HEADING_STYLE = ParagraphStyle(
+    'BlackHeading',
+    parent=_SAMPLE_STYLES['Heading2'],
+    fontSize=14,
+    textColor=colors.black,
+    alignment=TA_LEFT,
+    spaceAfter=12,
+    leftIndent=0
+)
+
+SA_TABLE_TEXT_STYLE = ParagraphStyle(
+    'TableText',
+    wordWrap='CJK',  # Enable word wrapping
+    parent=_SAMPLE_STYLES['Normal'],
+    fontSize=8,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leading=10,
+    leftIndent=0
+)
+
+SA_BULLET_STYLE = ParagraphStyle(
+    'BulletStyle',
+    parent=_SAMPLE_STYLES['Normal'],
+    fontSize=11,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leftIndent=20,
+    bulletIndent=10,
+    leading=14
+)
+
+# "What makes up your service" heading
+SA_WHAT_MAKES_UP_HEADING_STYLE = ParagraphStyle(
+    'WhatMakesUpHeading',
+    parent=_SAMPLE_STYLES['Heading2'],
+    fontSize=14,
+    textColor=BLUE_COLOR,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leftIndent=0
+)
+
+# "Schedule of Supports" heading
+SA_SCHEDULE_HEADING_STYLE = ParagraphStyle(
+    'ScheduleHeading',
+    parent=_SAMPLE_STYLES['Heading2'],
+    fontSize=14,
+    textColor=BLUE_COLOR,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leftIndent=0
+)
+
+# "Core and Capacity Building" heading
+SA_CORE_CAPACITY_HEADING_STYLE = ParagraphStyle(
+    'CoreCapacityHeading',
+    parent=_SAMPLE_STYLES['Heading2'],
+    fontSize=14,
+    textColor=colors.black,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leftIndent=0
+)
+
+# White bold text style for table label cells
+SA_WHITE_BOLD_TABLE_TEXT_STYLE = ParagraphStyle(
+    'WhiteBoldTableText',
+    parent=_SAMPLE_STYLES['Normal'],
+    fontSize=8,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leading=10,
+    leftIndent=0,
+    textColor=colors.white,
+    fontName='Helvetica-Bold'
+)
+
+# "Support Items" heading
+SA_SUPPORT_ITEMS_HEADING_STYLE = ParagraphStyle(
+    'SupportItemsHeading',
+    parent=_SAMPLE_STYLES['Heading2'],
+    fontSize=14,
+    textColor=colors.black,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leftIndent=0
+)
+
+# "Consents" heading
+SA_CONSENTS_HEADING_STYLE = ParagraphStyle(
+    'ConsentsHeading',
+    parent=_SAMPLE_STYLES['Heading2'],
+    fontSize=14,
+    textColor=BLUE_COLOR,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leftIndent=0
+)
+
+# "Agreements, Promises and Terms of Service" heading
+SA_AGREEMENTS_HEADING_STYLE = ParagraphStyle(
+    'AgreementsHeading',
+    parent=_SAMPLE_STYLES['Heading2'],
+    fontSize=14,
+    textColor=BLUE_COLOR,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leftIndent=0
+)
+
+# "Signatures" heading
+SA_SIGNATURES_HEADING_STYLE = ParagraphStyle(
+    'SignaturesHeading',
+    parent=_SAMPLE_STYLES['Heading2'],
+    fontSize=14,
+    textColor=BLUE_COLOR,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leftIndent=0
+)
+
+# Static service agreement text, shared by every document
+_SA_INTRO_PARAGRAPHS = [
+    "Thank you for choosing Neighbourhood Care. We look forward to working with you to help you achieve your goals.",
+    "This document is a written agreement between you and Neighbourhood Care that outlines the supports we will provide and how they will be delivered.",
+    "<b>Please make sure you have read and understood our Agreements, Promises and Terms of Service before completing this document.</b>",
+    "If you are unsure about any part of this document please speak to your Neighbourhood Care representative.",
+    "This Service Agreement must then be signed for us to start delivering services.",
+]
+
+_SA_SERVICE_BULLETS = [
+    "Transporting you during a shift (this is a $1 cost per km and is billed out of your core budget).",
+    "Communication by phone or email or in a face to face meeting with key people in your network - when this is not part of your rostered shift.",
+    "Travel for support workers or therapists when they are coming directly from the office or from another participant or travelling back to the office at the end of the shift.",
+    "Preparing some reports that are required for the NDIS such as creating your Support Plan.",
+    "Costs for when we are supporting you in the community such as parking, public transport and so forth.",
+    "For <i>new</i> participants, receiving Core supports, the one off Establishment fee is applied."
+]
+
+# Consent statements double as the form field names holding each answer
+_SA_CONSENTS = [
+    'I agree to receive services from Neighbourhood Care.',
+    'I consent for Neighbourhood Care to create an NDIS portal service booking on my behalf if my budget/s are Agency Managed.',
+    'I understand that if at any time I (The Participant) require emergency medical assistance, Neighbourhood Care staff will call an ambulance to attend, and that I (The Participant) will be liable for any expenses incurred for Ambulance attendance.',
+    'I agree that Neighbourhood Care staff may administer simple first aid to me (The Participant), if the need arises.',
+    'I consent for Neighbourhood Care to discuss relevant information about my case with other providers involved in my care and support, for example GP, support coordinator.',
+    'I agree not to smoke inside the home whilst Neighbourhood Care staff are present.',
+    'I understand that an Emergency Response Plan will be developed with me by Neighbourhood Care to help keep me safe in the event of an emergency.',
+    'I consent for Neighbourhood Care for I (The Participant) to be photographed/recorded for therapeutic and/or training purposes.',
+    'I give authority for my details or information to be shared with an external auditor who will assess Neighbourhood Care against the NDIS Quality and Safeguards Framework.'
+]
+
+# "Agreements, Promises and Terms of Service" through the GST notice - identical
+# for every participant
+_SA_NC_AGREEMENTS = [
+    "Review your care and service plan every 6 months with you.",
+    "Maintain a service that works for you, so times of appointments meet your needs and we are in tune with each other. We call this Attunement.",
+    "At all times communicate openly and honestly in a timely manner.",
+    "At all times treat you with dignity and respect and being mindful of any cultural differences.",
+    "Be open and transparent about managing complaints or disagreements and provide you the opportunity to provide feedback to us and to the NDIS.",
+    "Ensure your privacy and any information is held in confidence and not shared without your permission.",
+    "Work together at every step on your journey towards reaching your goals.",
+    "Operate within the National Disability Insurance Scheme Act 2013 and associated Business Rules."
+]
+
+_SA_PARTICIPANT_AGREEMENTS = [
+    "Inform Neighbourhood Care about how you wish your supports to be provided and how they should be offered to meet your needs.",
+    "Treat Neighbourhood Care staff with courtesy and respect in the same way you want to be treated.",
+    "Talk to Neighbourhood Care if you have any concerns about Plan Management or Financial Administration being provided.",
+    "Give your care and support team the required notice if you need to end this Service Agreement. There is a notice period of 4 weeks to end this service.",
+    "Advise your care and support team immediately if your plan is suspended or replaced by a new NDIS Plan or where you stop being an active participant in the NDIS."
+]
+
+_SA_PRIVACY_BULLETS = [
+    "How we use your personal information",
+    "Why some personal information may be given to other organisations from time to time",
+    "How you can access the personal information we have about you on our system",
+    "How you can complain about a privacy breach, and how Neighbourhood Care deals with the complaint.",
+    "How you can get your personal information corrected if it is wrong."
+]
+
+_SA_FOR_YOUR_INFO_TEXT = 'For your information: "A supply of supports under this Service Agreement is a supply of one or more reasonable and necessary supports specified in the statement of supports included, under subsection 33(2) of the National Disability Insurance Scheme Act 2013 (NDIS Act), in the participant\'s NDIS Plan currently in effect under section 37 of the NDIS Act."'
+
+# Agreements section as (text, style) pairs, with None marking a one-line gap
+_SA_AGREEMENTS_SECTION = [
+    ("<b>Agreements, Promises and Terms of Service</b>", SA_AGREEMENTS_HEADING_STYLE),
+
+    ("Our Agreements, Promises and Terms of Service outline how we deliver services. It outlines our rights and responsibilities as a service provider, and the rights and responsibilities of the people we provide services to.", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+
+    ("<b>What can you expect from Neighbourhood Care?</b>", SA_BOLD_HEADING_NO_SPACE_STYLE),
+    ("We agree to:", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+
+    *[(f"• {item}", SA_BULLET_STYLE) for item in _SA_NC_AGREEMENTS],
+
+    None,
+
+    ("<b>What is expected of you as an NDIS participant?</b>", SA_NORMAL_STYLE),
+    ("You agree to:", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+
+    *[(f"• {item}", SA_BULLET_STYLE) for item in _SA_PARTICIPANT_AGREEMENTS],
+
+    None,
+
+    ("<b>Cancellations</b>", SA_NORMAL_STYLE),
+    ("If a make-up shift with that support worker cannot be scheduled, the NDIS considers this a Short Notice Cancellation, and Neighbourhood Care may charge 100% of the agreed hourly rate.", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+
+    ("<b>How will services be provided to you?</b>", SA_BOLD_HEADING_NO_SPACE_STYLE),
+    ("Services will be provided at your place of residence and in other locations as deemed necessary and suitable by you, your family, the Support Coordinator and the Neighbourhood Care Team charged with your safety whilst in the service.", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+
+    ("<b>When will services be provided?</b>", SA_BOLD_HEADING_NO_SPACE_STYLE),
+    ("All services will be provided in attunement to your needs and subject to availability by others who may have an impact to your availability.", SA_NORMAL_NO_SPACE_STYLE),
+    ("From the commencement of the service agreement: Direct support provided as per the support and/or Therapy support plan, subject to change/increase, upon confirmation with you and/or your family.", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+
+    ("<b>How long will services be provided?</b>", SA_BOLD_HEADING_NO_SPACE_STYLE),
+    ("Services will be provided for the length of the service agreement plan unless otherwise ceased at the discretion by by you or your team, in accordance with Neighbourhood Care's Policy and Procedures.", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+
+    ("<b>How to make changes?</b>", SA_BOLD_HEADING_NO_SPACE_STYLE),
+    ("If changes to the supports or their delivery are required, you and your Neighbourhood Care team (the parties) agree to discuss and review this Service Agreement. The Parties agree that any changes to this Service Agreement will be in writing, signed, and dated by the Parties.", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+
+    ("<b>How to end the Agreement?</b>", SA_BOLD_HEADING_NO_SPACE_STYLE),
+    ("Should either Party wish to end this Service Agreement they must give 4 weeks written notice to their care and support team. If either Party seriously breaches this Service Agreement the requirement of notice will be waived.", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+
+    ("<b>Pricing Changes</b>", SA_BOLD_HEADING_NO_SPACE_STYLE),
+    ("Neighbourhood Care's services are charged in accordance with the NDIS Pricing Arrangements and Price Limits Guide. The prices set out in this Service Agreement will change in accordance with updates to the NDIS Pricing Arrangements and Price Limits Guide. This typically updates on the 1st of July each year but may be updated at other times.", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+
+    ("<b>What to do if there is a problem?</b>", SA_BOLD_HEADING_NO_SPACE_STYLE),
+    ("If there is a problem with anything related to your service or this agreement, you can contact:", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+    ("Your Neighbourhood Care contact person (please refer to the front page of your Service Agreement) or 1800 292 273.", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+    ("Alternatively, you can email your concern or query to: ask@nhcare.com.au.", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+    ("If you don't feel that your problem was resolved please speak to your support coordinator, Local Area Coordinator or you can just contact the National Disability Insurance Agency (NDIA)", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+
+    ("<b>Collection of your personal information</b>", SA_BOLD_HEADING_NO_SPACE_STYLE),
+    ("Neighbourhood Care will use your information to support your involvement in the NDIS.", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+    ("Neighbourhood Care will NOT use any of your personal information for any other purpose or disclose your personal information to any other organisations or individuals (including overseas recipients) unless authorised by law or you provide consent for us to do so.", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+    ("You can also ask to see what personal information (if any) we hold about you at any time and you can seek correction if the information is incorrect.", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+    ("<b>Neighbourhood Care's privacy policy describes:</b>", SA_NORMAL_NO_SPACE_STYLE),
+
+    *[(f"• {item}", SA_BULLET_STYLE) for item in _SA_PRIVACY_BULLETS],
+
+    None,
+    ("You can find the policy by enquiring at Neighbourhood Care.", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+    ("Please note that Neighbourhood Care is required to release information about service users (without identifying you by full name or address) to the Australian Institute of Health and Welfare, to enable statistics about disability services and their clients to be compiled. This information will be kept confidential. This information is used for statistical purposes only and will not be used to affect your entitlements or your access to services. You have the right to access your own files and to update or correct information included in the Disability Services National Minimum Data Set collection.", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+
+    ("<b>Goods and Services Tax</b>", SA_NORMAL_STYLE),
+    ("Most services provided under the NDIS will not include GST. However, GST will apply to some services. Neighbourhood Care will apply GST when it is required.", SA_NORMAL_NO_SPACE_STYLE),
+    None,
+
+    # For your information text (comes before Signatures heading)
+    (_SA_FOR_YOUR_INFO_TEXT, SA_NORMAL_NO_SPACE_STYLE),
+    None
+]
+
+# Establishment fee: single row, blue label cell
+_SA_ESTABLISHMENT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, 0), BLUE_COLOR),
+    ('TEXTCOLOR', (0, 0), (0, 0), colors.white),
+    ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
+    ('BACKGROUND', (1, 0), (1, 0), colors.white),
+    ('TEXTCOLOR', (1, 0), (1, 0), colors.black),
+    ('FONTNAME', (1, 0), (1, 0), 'Helvetica'),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')
+])
+
+# Core / capacity building budgets: blue label column
+_SA_CORE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, 0), BLUE_COLOR),
+    ('TEXTCOLOR', (0, 0), (0, 0), colors.white),
+    ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
+    ('BACKGROUND', (1, 0), (1, 0), colors.white),
+    ('TEXTCOLOR', (1, 0), (1, 0), colors.black),
+    ('FONTNAME', (1, 0), (1, 0), 'Helvetica'),
+    ('BACKGROUND', (0, 1), (0, 1), BLUE_COLOR),
+    ('TEXTCOLOR', (0, 1), (0, 1), colors.white),
+    ('FONTNAME', (0, 1), (0, 1), 'Helvetica-Bold'),
+    ('BACKGROUND', (1, 1), (1, 1), colors.white),
+    ('TEXTCOLOR', (1, 1), (1, 1), colors.black),
+    ('FONTNAME', (1, 1), (1, 1), 'Helvetica'),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP')
+])
+
+# Header row of the support items table; plain strings so the table style supplies the font
+_SUPPORT_HEADER_ROW = ('Category', 'Name', 'Number', 'Unit', 'Price')
+
+# Support items: blue header row
+_SA_SUPPORT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), BLUE_COLOR),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP')
+])
+
+# Consents: blue statement column, answer on the right
+_SA_CONSENT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), BLUE_COLOR),
+    ('TEXTCOLOR', (0, 0), (0, -1), colors.white),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('BACKGROUND', (1, 0), (1, -1), colors.white),
+    ('TEXTCOLOR', (1, 0), (1, -1), colors.black),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTSIZE', (0, 0), (-1, -1), 7),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP')
+])
+
+# Plain two column label/value tables (participant, signatory, plan manager, key contact)
+_APPENDIX_COLWIDTHS = (2.5*inch, 3*inch)
+_SA_TWO_COL_APPENDIX_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), colors.white),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP')
+])
+
+# Emergency & disaster plan styles - built once and shared by every document
+ED_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_SAMPLE_STYLES['Title'],
+    fontSize=16,
+    textColor=BLUE_COLOR,
+    alignment=TA_LEFT,
+    spaceAfter=12,
+    leftIndent=0
+)
+
+ED_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_SAMPLE_STYLES['Heading2'],
+    fontSize=16,
+    textColor=BLUE_COLOR,
+    alignment=TA_LEFT,
+    spaceAfter=8,
+    spaceBefore=12,
+    leftIndent=0
+)
+
+ED_NORMAL_STYLE = ParagraphStyle(
+    'CustomNormal',
+    parent=_SAMPLE_STYLES['Normal'],
+    fontSize=11,
+    alignment=TA_LEFT,
+    spaceAfter=6,
+    leading=14,
+    leftIndent=0
+)
+
+ED_ITALIC_HEADING_STYLE = ParagraphStyle('ItalicHeading', parent=ED_NORMAL_STYLE, fontSize=11, textColor=colors.black)
+
+ED_TABLE_TEXT_STYLE = ParagraphStyle(
+    'TableText',
+    parent=_SAMPLE_STYLES['Normal'],
+    fontSize=11,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leading=12,
+    leftIndent=0
+)
+
+# White text for cells on a blue background
+ED_WHITE_TABLE_TEXT_STYLE = ParagraphStyle('TableHeader', parent=ED_TABLE_TEXT_STYLE, fontSize=11, textColor=colors.white)
+ED_WHITE_CENTERED_TABLE_TEXT_STYLE = ParagraphStyle('TableHeading', parent=ED_TABLE_TEXT_STYLE, fontSize=11, textColor=colors.white, alignment=TA_CENTER)
+
+# General information: blue heading row spanning both columns
+_ED_GENERAL_INFO_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), BLUE_COLOR),  # Heading row
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 1), (1, -1), 'LEFT'),
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 1), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('SPAN', (0, 0), (-1, 0))  # Span heading across all columns
+])
+
+# Key emergency contacts: blue heading and column header rows
+_ED_EMERGENCY_CONTACTS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), BLUE_COLOR),  # Heading row
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('BACKGROUND', (0, 1), (-1, 1), BLUE_COLOR),  # Header row
+    ('TEXTCOLOR', (0, 1), (-1, 1), colors.white),
+    ('BACKGROUND', (0, 2), (-1, -1), colors.white),  # All data rows (including empty ones)
+    ('TEXTCOLOR', (0, 2), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('ALIGN', (0, 1), (-1, 1), 'CENTER'),
+    ('ALIGN', (0, 2), (-1, -1), 'LEFT'),  # All data rows left-aligned
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('SPAN', (0, 0), (-1, 0))  # Span heading across all columns
+])
+
+# My important contacts: blue heading row, bold labels
+_ED_IMPORTANT_CONTACTS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), BLUE_COLOR),  # Heading row
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (0, 0), 'CENTER'),
+    ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 1), (1, -1), 'LEFT'),
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 1), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('SPAN', (0, 0), (-1, 0))  # Span heading across all columns
+])
+
+# Community risks checklist
+_ED_RISKS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), colors.white),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP')
+])
+
+# How the emergency affects you: blue header row, gray label column
+_ED_EMERGENCY_AFFECT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), BLUE_COLOR),  # Header row
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('BACKGROUND', (0, 1), (0, -1), GRAY_COLOR),  # Left column (except header) - gray background
+    ('BACKGROUND', (1, 1), (1, -1), colors.white),  # Right column - white
+    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 1), (1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),  # Header row bold
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),  # Left column bold
+    ('FONTNAME', (1, 1), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP')
+])
+
+# Plan sections: gray checklist column beside the notes column
+_ED_SECTIONS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, 0), BLUE_COLOR),  # First row first column - blue
+    ('TEXTCOLOR', (0, 0), (0, 0), colors.white),
+    ('BACKGROUND', (1, 0), (1, 0), colors.white),  # First row second column
+    ('BACKGROUND', (0, 1), (0, -1), GRAY_COLOR),  # Left column (except first row) - gray
+    ('BACKGROUND', (1, 1), (1, -1), colors.white),  # Right column - white
+    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),  # All left column bold
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP')
+])
+
+# Sign-off: blue label cells in the first and third columns
+_ED_SIGN_OFF_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, 0), BLUE_COLOR),  # Client's Name
+    ('BACKGROUND', (2, 0), (2, 0), BLUE_COLOR),  # Team member's name
+    ('BACKGROUND', (0, 1), (0, 1), BLUE_COLOR),  # Signature (left)
+    ('BACKGROUND', (2, 1), (2, 1), BLUE_COLOR),  # Signature (right)
+    ('BACKGROUND', (0, 2), (0, 2), BLUE_COLOR),  # Date (left)
+    ('BACKGROUND', (2, 2), (2, 2), BLUE_COLOR),  # Date (right)
+    ('TEXTCOLOR', (0, 0), (0, 0), colors.white),
+    ('TEXTCOLOR', (2, 0), (2, 0), colors.white),
+    ('TEXTCOLOR', (0, 1), (0, 1), colors.white),
+    ('TEXTCOLOR', (2, 1), (2, 1), colors.white),
+    ('TEXTCOLOR', (0, 2), (0, 2), colors.white),
+    ('TEXTCOLOR', (2, 2), (2, 2), colors.white),
+    ('BACKGROUND', (1, 0), (1, -1), colors.white),  # Data columns - white
+    ('BACKGROUND', (3, 0), (3, -1), colors.white),
+    ('TEXTCOLOR', (1, 0), (1, -1), colors.black),
+    ('TEXTCOLOR', (3, 0), (3, -1), colors.black),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+    ('ALIGN', (2, 0), (2, -1), 'LEFT'),
+    ('ALIGN', (3, 0), (3, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTNAME', (3, 0), (3, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP')
+])
+
+# Static emergency plan table text, shared by every document; the Tables and any
+# Paragraph cells are created per document
+_ED_IMPORTANT_CONTACTS_ROWS = (
+    ('Advocate', ''),
+    ('Power of Attorney/Guardian', ''),
+    ('Solicitor', ''),
+    ('Insurer (home)', ''),
+    ('Insurer (vehicle)', ''),
+    ('Childcare/School Contact', ''),
+    ('Workplace/Volunteer Contact', ''),
+    ('Doctor', ''),
+    ('Specialist Practitioner', ''),
+    ('Private Health Cover', ''),
+)
+
+_ED_RISKS = (
+    'Heatwave', 'Storm', 'Cyclone', 'Bushfire', 'Flood', 'Earthquake',
+    'Landslide', 'Tsunami', 'Assault', 'Power outage', 'Gas outage',
+    'Health emergency', 'House fire', 'Burglary/break-in'
+)
+
+# Use plain ASCII brackets for the checkbox - unicode boxes may render as black squares
+_ED_RISKS_DATA = tuple((risk, '[ ]') for risk in _ED_RISKS)
+
+# Bold label for each emergency type's row
+_ED_EMERGENCY_TYPE_LABELS = tuple(f"<b>{risk}</b>" for risk in _ED_RISKS)
+
+# Sign-off table labels; the signature and date rows are left empty to fill in by hand
+_ED_SIGN_OFF_CLIENT_LABEL = "<b>Client's Name</b>"
+_ED_SIGN_OFF_TEAM_MEMBER_LABEL = "<b>Team member's name</b>"
+_ED_SIGN_OFF_ROW_LABELS = ("<b>Signature</b>", "<b>Date</b>")
+
+# NDIS support catalogue with item numbers, units and state prices
+_NDIS_ITEMS_CSV = 'outputs/other/NDIS Support Items - NDIS Support Items.csv'
 
 def load_ndis_support_items():
     """Load NDIS support items from CSV file and return as a dictionary for lookup"""
     ndis_items = {}
     try:
-        with open('outputs/other/NDIS Support Items - NDIS Support Items.csv', 'r', encoding='utf-8') as file:
+        with open(_NDIS_ITEMS_CSV, 'r', encoding='utf-8') as file:
             reader = csv.DictReader(file)
             for row in reader:
                 # Use support item name as key for lookup
@@ -182,6 +885,81 @@ def load_ndis_support_items():
     
     return ndis_items
 
+@lru_cache(maxsize=1)
+def _load_ndis_item_names():
+    """Map lowercased NDIS item names to the full names; failed reads raise and are retried on the next call"""
+    ndis_item_names = {}
+    with open(_NDIS_ITEMS_CSV, 'r', encoding='utf-8') as file:
+        # Only one column is needed, so index plain rows instead of building a dict per row
+        reader = csv.reader(file)
+        name_index = next(reader).index('Support Item Name')
+        for row in reader:
+            if not row:
+                continue  # blank line, skipped by DictReader too
+            item_name = row[name_index].strip()
+            # Store mapping from normalized name to full name
+            normalized_name = item_name.lower().strip()
+            ndis_item_names[normalized_name] = item_name
+    return ndis_item_names
+
+# Substring length indexed by _ndis_name_index
+_NDIS_GRAM = 4
+
+@lru_cache(maxsize=1)
+def _ndis_name_index():
+    """
+    Index the lowercased NDIS item names by 4-gram for _match_ndis_item_name.
+    
+    Returns:
+        tuple: ((lowercased name, full name) pairs in file order, {4-gram: name indexes},
+                {leading 4-gram: name indexes}, indexes of names shorter than a 4-gram)
+    """
+    entries = list(_load_ndis_item_names().items())
+    grams = {}
+    leading_grams = {}
+    short = []
+    for index, (name_lower, _) in enumerate(entries):
+        if len(name_lower) < _NDIS_GRAM:
+            short.append(index)
+            continue
+        leading_grams.setdefault(name_lower[:_NDIS_GRAM], []).append(index)
+        for start in range(len(name_lower) - _NDIS_GRAM + 1):
+            grams.setdefault(name_lower[start:start + _NDIS_GRAM], set()).add(index)
+    return entries, grams, leading_grams, short
+
+def _match_ndis_item_name(name_index, item_name_lower):
+    """
+    Full name of the first NDIS item (in file order) whose lowercased name contains
+    item_name_lower or is contained in it, or None
+    """
+    entries, grams, leading_grams, short = name_index
+    item_grams = {item_name_lower[start:start + _NDIS_GRAM]
+                  for start in range(len(item_name_lower) - _NDIS_GRAM + 1)}
+    if item_grams:
+        # A name containing the item contains all of its 4-grams, so the rarest one
+        # gives every candidate
+        candidates = set(min((grams.get(gram, ()) for gram in item_grams), key=len))
+    else:
+        # Too short to have a 4-gram - any name could contain it
+        candidates = set(range(len(entries)))
+    # A name contained in the item starts with one of the item's 4-grams
+    for gram in item_grams:
+        candidates.update(leading_grams.get(gram, ()))
+    candidates.update(short)
+    
+    for index in sorted(candidates):
+        name_lower, name_full = entries[index]
+        if item_name_lower in name_lower or name_lower in item_name_lower:
+            return name_full
+    return None
+
+# Lowercased answers treated as a yes
+_YES_VALUES = frozenset({'yes', 'y'})
+
+# Team names (lowercased) for each state's price list
+_WA_TEAMS = frozenset({'fremantle', 'belmont', 'metro-x', 'rockingham', 'wanneroo'})
+_QLD_TEAMS = frozenset({'brisbane', 'beaudesert', 'ipswich', 'gold coast'})
+
 def get_price_state(team_value):
     """
     Determine which state's prices to use based on the team.
@@ -197,35 +975,65 @@ def get_price_state(team_value):
     
     team_value_clean = team_value.strip().lower()
     
-    # WA teams
-    wa_teams = ['fremantle', 'belmont', 'metro-x', 'rockingham', 'wanneroo']
-    if team_value_clean in wa_teams:
+    if team_value_clean in _WA_TEAMS:
         return 'WA'
     
-    # QLD teams
-    qld_teams = ['brisbane', 'beaudesert', 'ipswich', 'gold coast']
-    if team_value_clean in qld_teams:
+    if team_value_clean in _QLD_TEAMS:
         return 'QLD'
     
     # Default to WA if team doesn't match
     return 'WA'
 
+# Lowercased support item name -> original key, rebuilt only when a different
+# catalogue dict is passed in
+_NDIS_LOWER_INDEX = (None, 0, {})
+
+def _ndis_lower_index(ndis_items):
+    """Return the lowercased-name index for ndis_items, building it on first use"""
+    global _NDIS_LOWER_INDEX
+    cached_items, cached_len, index = _NDIS_LOWER_INDEX
+    if cached_items is not ndis_items or cached_len != len(ndis_items):
+        index = {}
+        for key in ndis_items:
+            index.setdefault(key.lower(), key)
+        _NDIS_LOWER_INDEX = (ndis_items, len(ndis_items), index)
+    return index
+
+def find_support_item_key(ndis_items, item_name):
+    """Return the NDIS catalogue key matching item_name, or None if there is no match"""
+    if item_name in ndis_items:
+        return item_name
+    # Partial matching for common support items, against pre-lowered names
+    item_name_lower = item_name.lower()
+    for key_lower, key in _ndis_lower_index(ndis_items).items():
+        if item_name_lower in key_lower or key_lower in item_name_lower:
+            return key
+    return None
+
+# Support items table details for a name with no catalogue match
+_NOT_FOUND_DETAILS = {
+    'number': '[Not Found]',
+    'unit': '[Not Found]',
+    'wa_price': '[Not Found]',
+    'qld_price': '[Not Found]'
+}
+
+# Placeholder details lookup_support_item returns for an unknown item
+_PLACEHOLDER_DETAILS = {
+    'number': '[Not Found]',
+    'unit': 'Hour',
+    'wa_price': '$0.00',
+    'qld_price': '$0.00'
+}
+
 def lookup_support_item(ndis_items, item_name):
     """Look up a support item by name and return its details"""
-    if item_name in ndis_items:
-        return ndis_items[item_name]
+    key = find_support_item_key(ndis_items, item_name)
+    if key is not None:
+        return ndis_items[key]
     else:
-        # Try partial matching for common support items
-        for key, value in ndis_items.items():
-            if item_name.lower() in key.lower() or key.lower() in item_name.lower():
-                return value
         # Return placeholder if not found
-        return {
-            'number': '[Not Found]',
-            'unit': 'Hour',
-            'wa_price': '$0.00',
-            'qld_price': '$0.00'
-        }
+        return dict(_PLACEHOLDER_DETAILS)
 
 def get_establishment_fee(csv_data, ndis_items, team_value=None):
     """
@@ -260,7 +1068,7 @@ def get_establishment_fee(csv_data, ndis_items, team_value=None):
     for field in new_client_fields:
         value = csv_data.get(field, '').strip()
         # Clean up checkbox characters and other special characters
-        value = value.replace('\uf0d7', '').replace('•', '').replace('●', '').replace('☐', '').replace('☑', '').replace('✓', '').strip()
+        value = _clean_checkboxes(value)
         # Match JavaScript: exact "Yes" check (case-sensitive in JS, but we'll be flexible)
         if value == "Yes" or normalize_key(value) == 'yes':
             is_new_client = True
@@ -286,7 +1094,7 @@ def get_establishment_fee(csv_data, ndis_items, team_value=None):
     for field in hours_support_fields:
         value = csv_data.get(field, '').strip()
         # Clean up checkbox characters and other special characters
-        value = value.replace('\uf0d7', '').replace('•', '').replace('●', '').replace('☐', '').replace('☑', '').replace('✓', '').strip()
+        value = _clean_checkboxes(value)
         # Match JavaScript: exact "Yes" check (case-sensitive in JS, but we'll be flexible)
         if value == "Yes" or normalize_key(value) == 'yes':
             is_receiving_20_hours = True
@@ -351,33 +1159,21 @@ def load_active_users(team_value=None):
                    Other teams use Active_Users_1761707021.csv
     
     Returns:
-        Dictionary of active users keyed by name
+        Dictionary of active users keyed by name (shared between calls - treat as read-only)
     """
-    active_users = {}
-    
     # Determine which CSV file to use based on team
-    qld_teams = ['beaudesert', 'brisbane', 'gold coast', 'ipswich']
     team_lower = team_value.strip().lower() if team_value else ''
     
-    if team_lower in qld_teams:
+    if team_lower in _QLD_TEAMS:
         csv_filename = 'outputs/other/Active_Users_1763520740.csv'
         print(f"DEBUG: Using QLD active users CSV for team: {team_value}")
     else:
         csv_filename = 'outputs/other/Active_Users_1761707021.csv'
         print(f"DEBUG: Using default active users CSV for team: {team_value or 'unknown'}")
     
+    active_users = {}
     try:
-        with open(csv_filename, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                # Use name as key for lookup
-                user_name = row['name'].strip()
-                active_users[user_name] = {
-                    'name': row['name'].strip(),
-                    'mobile': row['mobile'].strip(),
-                    'email': row['email'].strip(),
-                    'team': (row.get('area') or row.get('role') or '').strip()
-                }
+        active_users = _read_active_users(csv_filename)
         print(f"DEBUG: Loaded {len(active_users)} active users from {csv_filename}")
     except FileNotFoundError:
         print(f"Active Users CSV file not found: {csv_filename}. Using placeholder data.")
@@ -386,14 +1182,46 @@ def load_active_users(team_value=None):
     
     return active_users
 
+@lru_cache(maxsize=16)
+def _read_active_users(csv_filename):
+    """Parse an active users CSV once; failed reads raise and are retried on the next call"""
+    active_users = {}
+    with open(csv_filename, 'r', encoding='utf-8') as file:
+        reader = csv.DictReader(file)
+        for row in reader:
+            # Use name as key for lookup
+            user_name = row['name'].strip()
+            active_users[user_name] = {
+                'name': row['name'].strip(),
+                'mobile': row['mobile'].strip(),
+                'email': row['email'].strip(),
+                'team': (row.get('area') or row.get('role') or '').strip()
+            }
+    return active_users
+
+# (active_users, len, {lowercased name: user}) for the last user dict searched
+_USER_LOWER_INDEX = (None, 0, {})
+
+def _user_lower_index(active_users):
+    """Return the lowercased-name index for active_users, building it on first use"""
+    global _USER_LOWER_INDEX
+    cached_users, cached_len, index = _USER_LOWER_INDEX
+    if cached_users is not active_users or cached_len != len(active_users):
+        index = {}
+        for key, value in active_users.items():
+            index.setdefault(key.lower(), value)
+        _USER_LOWER_INDEX = (active_users, len(active_users), index)
+    return index
+
 def lookup_user_data(active_users, respondent_name):
     """Look up user data by respondent name and return contact details"""
     if respondent_name in active_users:
         return active_users[respondent_name]
     else:
-        # Try partial matching
-        for key, value in active_users.items():
-            if respondent_name.lower() in key.lower() or key.lower() in respondent_name.lower():
+        # Try partial matching, against pre-lowered names
+        respondent_lower = respondent_name.lower()
+        for key_lower, value in _user_lower_index(active_users).items():
+            if respondent_lower in key_lower or key_lower in respondent_lower:
                 return value
         # Return placeholder if not found
         return {
@@ -402,8 +1230,9 @@ def lookup_user_data(active_users, respondent_name):
             'email': '[Not Found]'
         }
 
+@lru_cache(maxsize=16384)
 def normalize_key(key: str) -> str:
-    """Normalize a key for comparison"""
+    """Normalize a key for comparison (memoized - labels and lines repeat a lot)"""
     return str(key or "").strip().lower()
 
 def extract_pdf_fields_pdfreader(pdf_path: str) -> dict:
@@ -436,7 +1265,106 @@ def extract_pdf_text_pdfplumber(pdf_path: str) -> str:
     except Exception:
         return ""
 
+# Bullet/checkbox glyphs that appear on their own line in extracted PDF text
+_CHECKBOX_CHARS = frozenset('•●○☐☑✓')
+
+# Deletion table for checkbox characters that render as black boxes in the output
+_CHECKBOX_STRIP = str.maketrans('', '', '\uf0d7•●☐☑✓')
+
+# Phone numbers additionally drop the ';' and ',' separators
+_PHONE_STRIP = str.maketrans('', '', '\uf0d7•●☐☑✓;,')
+
+# Anything but printable ASCII, and ';' - dropped from the emergency plan phone cell
+_PHONE_DROP_RE = re.compile(r'[^\x20-\x3a\x3c-\x7e]+')
+
+def _clean_checkboxes(value):
+    """Strip checkbox characters and surrounding whitespace in a single pass"""
+    # The checkbox characters are all non-ASCII, so plain ASCII text (the usual
+    # case) only needs stripping
+    if value.isascii():
+        return value.strip()
+    return value.translate(_CHECKBOX_STRIP).strip()
+
+def _join_nonempty(*parts):
+    """Join the non-empty name parts with single spaces"""
+    return ' '.join(filter(None, parts))
+
+def _first_nonempty(data, *keys):
+    """Return the first stripped non-empty value among keys, or ''"""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            value = value.strip()
+            if value:
+                return value
+    return ''
+
+def _intern_keys(data):
+    """Return a copy of data with interned keys so field lookups hit cached hashes"""
+    return {sys.intern(k): v for k, v in data.items()}
+
+# Client fields read by every document builder
+_KEY_FIRST_NAME = sys.intern('First name (Details of the Client)')
+_KEY_SURNAME = sys.intern('Surname (Details of the Client)')
+_KEY_DOB = sys.intern('Date of birth (Details of the Client)')
+_KEY_PERSON_SIGNING = sys.intern('Person signing the agreement')
+
+# Support item labels and their CSV field names, indexed by item number
+_SUPPORT_ITEM_LABELS = tuple(f'Support item ({i})' for i in range(32))
+_SUPPORT_ITEM_KEYS = tuple(sys.intern(f'{label} (Support Items Required)') for label in _SUPPORT_ITEM_LABELS)
+
+# Four-digit 19xx/20xx year inside a date of birth string
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
+# Text-extraction specs for parse_pdf_to_data: (CSV field name, label patterns, section).
+# A section of None searches the whole document for the label instead of one section.
+PDF_TEXT_FIELD_SPECS = [
+    ('First name (Details of the Client)', ('First name', 'First name (Details of the Client)'), "details"),
+    ('Middle name (Details of the Client)', ('Middle name', 'Middle name (Details of the Client)'), "details"),
+    ('Surname (Details of the Client)', ('Surname', 'Surname (Details of the Client)', 'Family name', 'Last name'), "details"),
+    ('NDIS number (Details of the Client)', ('NDIS number', 'NDIS number (Details of the Client)'), "details"),
+    ('Date of birth (Details of the Client)', ('Date of birth', 'Date of birth (Details of the Client)', 'DOB'), "details"),
+    ('Gender (Details of the Client)', ('Gender', 'Gender (Details of the Client)'), "details"),
+    ('Home address (Contact Details of the Client)', ('Home address', 'Home address (Contact Details of the Client)', 'Address'), "contact"),
+    ('Home phone (Contact Details of the Client)', ('Home phone', 'Home phone (Contact Details of the Client)'), "contact"),
+    ('Work phone (Contact Details of the Client)', ('Work phone', 'Work phone (Contact Details of the Client)'), "contact"),
+    ('Mobile phone (Contact Details of the Client)', ('Mobile phone', 'Mobile phone (Contact Details of the Client)'), "contact"),
+    ('Is the primary carer also the emergency contact for the participant?', ('Is the primary carer also the emergency contact',), None),
+    ('Home phone (Emergency contact)', ('Home phone',), "emergency"),
+    ('Mobile phone (Emergency contact)', ('Mobile phone',), "emergency"),
+    ('Work phone (Emergency contact)', ('Work phone',), "emergency"),
+    ('Preferred method of contact', ('Preferred method of contact', 'Preferred contact method'), None),
+    ('Total core budget to allocate to Neighbourhood Care', ('Total core budget', 'core budget'), None),
+    ('Total capacity building budget to allocate to Neighbourhood Care', ('Total capacity building budget', 'capacity building budget'), None),
+    ('Plan start date', ('Plan start date', 'Plan start'), None),
+    ('Plan end date', ('Plan end date', 'Plan end'), None),
+    ('Service start date', ('Service start date', 'Service start'), None),
+    ('Service end date', ('Service end date', 'Service end'), None),
+    ('First name (Person Signing the Agreement)', ('First name (Person Signing the Agreement)',), None),
+    ('Surname (Person Signing the Agreement)', ('Surname (Person Signing the Agreement)',), None),
+    ('Relationship to client (Person Signing the Agreement)', ('Relationship to client (Person Signing the Agreement)', 'Relationship'), None),
+    ('Home address (Person Signing the Agreement)', ('Home address (Person Signing the Agreement)',), None),
+    ('First name (Primary carer)', ('First name',), "primary_carer"),
+    ('Surname (Primary carer)', ('Surname',), "primary_carer"),
+    ('Relationship to client (Primary carer)', ('Relationship to client (Primary carer)',), None),
+    ('Home address (Primary carer)', ('Home address (Primary carer)',), None),
+    ('Plan management type', ('Plan management type', 'Plan management'), None),
+    ('Plan manager name', ('Plan manager name',), None),
+    ('Plan manager postal address', ('Plan manager postal address', 'Plan manager address'), None),
+    ('Plan manager phone number', ('Plan manager phone', 'Plan manager phone number'), None),
+    ('Plan manager email address', ('Plan manager email',), None),
+    ('Respondent', ('Respondent', 'Neighbourhood Care representative'), None),
+    ('Neighbourhood Care representative team', ('Neighbourhood Care representative team', 'Team'), None),
+    # Establishment fee related fields
+    ('Is this client new to Neighbourhood Care?', ('Is this client new to Neighbourhood Care?', 'Is this client new', 'Is this a new client'), None),
+    ('Is Neighbourhood Care delivering 20 or more hours of support per month?', ('Is Neighbourhood Care delivering 20 or more hours of support per month?', 'Is Neighbourhood Care delivering 20', '20 or more hours of support'), None),
+]
+
 def parse_pdf_to_data(pdf_path: str) -> dict:
+    """Return _extract_pdf_data's result for pdf_path with its keys interned"""
+    return _intern_keys(_extract_pdf_data(pdf_path))
+
+def _extract_pdf_data(pdf_path: str) -> dict:
     """Parse PDF and extract data, mapping to CSV field names"""
     data = {}
     
@@ -518,7 +1446,7 @@ def parse_pdf_to_data(pdf_path: str) -> dict:
         person_signing = find_in_fields("person signing the agreement", "who is signing", "signatory")
         # Clean up checkbox characters
         if person_signing:
-            person_signing = person_signing.replace('\uf0d7', '').replace('•', '').replace('●', '').replace('☐', '').replace('☑', '').replace('✓', '').strip()
+            person_signing = _clean_checkboxes(person_signing)
         data['Person signing the agreement'] = person_signing
         data['First name (Person Signing the Agreement)'] = find_in_fields("first name (person signing the agreement)", "first name (person signing", "person signing first name", "signatory first name")
         data['Surname (Person Signing the Agreement)'] = find_in_fields("surname (person signing the agreement)", "surname (person signing", "person signing surname", "person signing last name", "signatory surname", "signatory last name")
@@ -543,10 +1471,19 @@ def parse_pdf_to_data(pdf_path: str) -> dict:
     if text:
         lines = [l.strip() for l in text.splitlines() if l.strip()]
         
+        # Normalize every line once and index the distinct values, so label lookups
+        # only scan unique lines instead of re-normalizing the whole document per query
+        normalized_lines = [normalize_key(l) for l in lines]
+        line_index = {}
+        for i, nl in enumerate(normalized_lines):
+            line_index.setdefault(nl, []).append(i)
+        distinct_lines = list(line_index)
+        n = len(lines)
+        
         # Identify section boundaries
         section_starts = []
         for i, line in enumerate(lines):
-            line_lower = normalize_key(line)
+            line_lower = normalized_lines[i]
             line_clean = line.strip()
             
             # Only match actual section headers - they should be standalone lines without parentheses
@@ -590,30 +1527,31 @@ def parse_pdf_to_data(pdf_path: str) -> dict:
                             section_end = next_start_idx
                             break
                     if section_end is None:
-                        section_end = len(lines) if lines else 0
+                        section_end = n
                     break
             
             if section_start is None or section_end is None:
                 return ""
             
-            # Ensure both are integers
-            section_start = int(section_start) if section_start is not None else 0
-            section_end = int(section_end) if section_end is not None else len(lines) if lines else 0
+            # Normalize the patterns once rather than per line
+            patterns = []
+            for pattern in label_patterns:
+                pattern_lower = normalize_key(pattern)
+                pattern_clean = pattern_lower.replace("(details of the client)", "").replace("(contact details of the client)", "").strip()
+                patterns.append((pattern_lower, pattern_clean))
             
+            _lines = lines
+            _normalized_lines = normalized_lines
             collected_values = []
             
             # Only search within this section
             for i in range(section_start, section_end):
-                line = lines[i]
-                line_lower = normalize_key(line)
+                line = _lines[i]
+                line_lower = _normalized_lines[i]
+                line_clean = line_lower.replace("(details of the client)", "").replace("(contact details of the client)", "").strip()
                 
-                for pattern in label_patterns:
-                    pattern_lower = normalize_key(pattern)
-                    
+                for pattern_lower, pattern_clean in patterns:
                     # Simple match - check if pattern matches the line
-                    line_clean = line_lower.replace("(details of the client)", "").replace("(contact details of the client)", "").strip()
-                    pattern_clean = pattern_lower.replace("(details of the client)", "").replace("(contact details of the client)", "").strip()
-                    
                     matches = (
                         pattern_lower == line_lower or
                         pattern_clean == line_clean or
@@ -637,14 +1575,13 @@ def parse_pdf_to_data(pdf_path: str) -> dict:
                                        'home address', 'home phone', 'work phone', 'mobile phone', 'email address',
                                        'preferred name', 'key code', 'postal address', 'preferred method of contact',
                                        'relationship to client']
-                        section_end_safe = section_end if section_end is not None and isinstance(section_end, int) else (len(lines) if lines else i + 5)
-                        for j in range(i + 1, min(i + 5, section_end_safe)):
-                            next_line = lines[j].strip()
-                            if not next_line or next_line in ['•', '●', '○', '☐', '☑', '✓']:
+                        for j in range(i + 1, min(i + 5, section_end)):
+                            next_line = _lines[j].strip()
+                            if not next_line or (len(next_line) == 1 and next_line in _CHECKBOX_CHARS):
                                 continue
                             
                             # Skip if it's another field label
-                            next_line_lower = normalize_key(next_line)
+                            next_line_lower = _normalized_lines[j]
                             is_field_label = False
                             for fl in field_labels:
                                 if fl == next_line_lower or (fl in next_line_lower and len(next_line) < 50 and '(' not in next_line):
@@ -675,10 +1612,18 @@ def parse_pdf_to_data(pdf_path: str) -> dict:
         
         # Helper function for fields that aren't in specific sections - SIMPLIFIED
         def find_value_after_label(label_patterns, start_idx=0):
-            for i in range(start_idx, len(lines) if lines else 0):
-                line_lower = normalize_key(lines[i])
-                for pattern in label_patterns:
-                    pattern_lower = normalize_key(pattern)
+            patterns_lower = [normalize_key(pattern) for pattern in label_patterns]
+            # Candidate lines are those whose normalized text contains any pattern
+            candidate_idxs = sorted(
+                i
+                for nl in distinct_lines
+                if any(pattern_lower in nl for pattern_lower in patterns_lower)
+                for i in line_index[nl]
+                if i >= start_idx
+            )
+            for i in candidate_idxs:
+                line_lower = normalized_lines[i]
+                for pattern_lower in patterns_lower:
                     # Match if pattern is in the line (but not if the line IS the pattern - that's the label)
                     if pattern_lower in line_lower:
                         # Look for value on same line after colon
@@ -687,36 +1632,22 @@ def parse_pdf_to_data(pdf_path: str) -> dict:
                             if len(parts) > 1 and parts[1].strip():
                                 return parts[1].strip()
                         # Skip the label line itself and get the next non-empty line - that's the value
-                        for j in range(i + 1, min(i + 3, len(lines) if lines else i + 3)):
+                        for j in range(i + 1, min(i + 3, n)):
                             next_line = lines[j].strip()
-                            if next_line and next_line not in ['•', '●', '○', '☐', '☑', '✓']:
+                            if next_line and not (len(next_line) == 1 and next_line in _CHECKBOX_CHARS):
                                 # Make sure we're not returning the label itself
-                                next_line_lower = normalize_key(next_line)
+                                next_line_lower = normalized_lines[j]
                                 if next_line_lower != pattern_lower:
                                     return next_line
             return ""
     
         # Extract data using section-aware text parsing - only fill in missing fields
-        if not data.get('First name (Details of the Client)'):
-            data['First name (Details of the Client)'] = find_value_in_section(['First name', 'First name (Details of the Client)'], "details")
-        if not data.get('Middle name (Details of the Client)'):
-            data['Middle name (Details of the Client)'] = find_value_in_section(['Middle name', 'Middle name (Details of the Client)'], "details")
-        if not data.get('Surname (Details of the Client)'):
-            data['Surname (Details of the Client)'] = find_value_in_section(['Surname', 'Surname (Details of the Client)', 'Family name', 'Last name'], "details")
-        if not data.get('NDIS number (Details of the Client)'):
-            data['NDIS number (Details of the Client)'] = find_value_in_section(['NDIS number', 'NDIS number (Details of the Client)'], "details")
-        if not data.get('Date of birth (Details of the Client)'):
-            data['Date of birth (Details of the Client)'] = find_value_in_section(['Date of birth', 'Date of birth (Details of the Client)', 'DOB'], "details")
-        if not data.get('Gender (Details of the Client)'):
-            data['Gender (Details of the Client)'] = find_value_in_section(['Gender', 'Gender (Details of the Client)'], "details")
-        if not data.get('Home address (Contact Details of the Client)'):
-            data['Home address (Contact Details of the Client)'] = find_value_in_section(['Home address', 'Home address (Contact Details of the Client)', 'Address'], "contact")
-        if not data.get('Home phone (Contact Details of the Client)'):
-            data['Home phone (Contact Details of the Client)'] = find_value_in_section(['Home phone', 'Home phone (Contact Details of the Client)'], "contact")
-        if not data.get('Work phone (Contact Details of the Client)'):
-            data['Work phone (Contact Details of the Client)'] = find_value_in_section(['Work phone', 'Work phone (Contact Details of the Client)'], "contact")
-        if not data.get('Mobile phone (Contact Details of the Client)'):
-            data['Mobile phone (Contact Details of the Client)'] = find_value_in_section(['Mobile phone', 'Mobile phone (Contact Details of the Client)'], "contact")
+        for key, label_patterns, section_type in PDF_TEXT_FIELD_SPECS:
+            if not data.get(key):
+                if section_type:
+                    data[key] = find_value_in_section(list(label_patterns), section_type)
+                else:
+                    data[key] = find_value_after_label(list(label_patterns))
         if not data.get('Email address (Contact Details of the Client)'):
             data['Email address (Contact Details of the Client)'] = find_value_in_section(['Email address', 'Email address (Contact Details of the Client)', 'Email'], "contact", collect_multiple=True)
     
@@ -733,15 +1664,6 @@ def parse_pdf_to_data(pdf_path: str) -> dict:
                 data['Surname (Emergency contact)'] = emergency_surname
             else:
                 data['Surname (Emergency contact)'] = find_value_after_label(['Surname (Emergency contact)'])
-        if not data.get('Is the primary carer also the emergency contact for the participant?'):
-            data['Is the primary carer also the emergency contact for the participant?'] = find_value_after_label(['Is the primary carer also the emergency contact'])
-        # Extract emergency contact phone and relationship fields
-        if not data.get('Home phone (Emergency contact)'):
-            data['Home phone (Emergency contact)'] = find_value_in_section(['Home phone'], "emergency")
-        if not data.get('Mobile phone (Emergency contact)'):
-            data['Mobile phone (Emergency contact)'] = find_value_in_section(['Mobile phone'], "emergency")
-        if not data.get('Work phone (Emergency contact)'):
-            data['Work phone (Emergency contact)'] = find_value_in_section(['Work phone'], "emergency")
         if not data.get('Relationship to client (Emergency contact)'):
             # ONLY search in the emergency section for "Relationship to client"
             # If not found, leave it empty - no fallback searches
@@ -750,78 +1672,25 @@ def parse_pdf_to_data(pdf_path: str) -> dict:
                 data['Relationship to client (Emergency contact)'] = relationship
             # If not found, leave it empty - don't do fallback searches
         
-        # Extract other fields that might be in the PDF
-        if not data.get('Preferred method of contact'):
-            data['Preferred method of contact'] = find_value_after_label(['Preferred method of contact', 'Preferred contact method'])
-        if not data.get('Total core budget to allocate to Neighbourhood Care'):
-            data['Total core budget to allocate to Neighbourhood Care'] = find_value_after_label(['Total core budget', 'core budget'])
-        if not data.get('Total capacity building budget to allocate to Neighbourhood Care'):
-            data['Total capacity building budget to allocate to Neighbourhood Care'] = find_value_after_label(['Total capacity building budget', 'capacity building budget'])
-        if not data.get('Plan start date'):
-            data['Plan start date'] = find_value_after_label(['Plan start date', 'Plan start'])
-        if not data.get('Plan end date'):
-            data['Plan end date'] = find_value_after_label(['Plan end date', 'Plan end'])
-        if not data.get('Service start date'):
-            data['Service start date'] = find_value_after_label(['Service start date', 'Service start'])
-        if not data.get('Service end date'):
-            data['Service end date'] = find_value_after_label(['Service end date', 'Service end'])
         # Always try text extraction for Person signing the agreement (form fields might return the label)
         person_signing_text = find_value_after_label(['Person signing the agreement', 'Who is signing'])
         if person_signing_text and person_signing_text.lower() != 'person signing the agreement':
             # Clean up checkbox characters
-            person_signing_text = person_signing_text.replace('\uf0d7', '').replace('•', '').replace('●', '').replace('☐', '').replace('☑', '').replace('✓', '').strip()
+            person_signing_text = _clean_checkboxes(person_signing_text)
             if person_signing_text:
                 data['Person signing the agreement'] = person_signing_text
-        if not data.get('First name (Person Signing the Agreement)'):
-            data['First name (Person Signing the Agreement)'] = find_value_after_label(['First name (Person Signing the Agreement)'])
-        if not data.get('Surname (Person Signing the Agreement)'):
-            data['Surname (Person Signing the Agreement)'] = find_value_after_label(['Surname (Person Signing the Agreement)'])
-        if not data.get('Relationship to client (Person Signing the Agreement)'):
-            data['Relationship to client (Person Signing the Agreement)'] = find_value_after_label(['Relationship to client (Person Signing the Agreement)', 'Relationship'])
-        if not data.get('Home address (Person Signing the Agreement)'):
-            data['Home address (Person Signing the Agreement)'] = find_value_after_label(['Home address (Person Signing the Agreement)'])
-        if not data.get('First name (Primary carer)'):
-            # Look for "First name" label in Primary carer section
-            data['First name (Primary carer)'] = find_value_in_section(['First name'], "primary_carer")
-        if not data.get('Surname (Primary carer)'):
-            # Look for "Surname" label in Primary carer section  
-            data['Surname (Primary carer)'] = find_value_in_section(['Surname'], "primary_carer")
-        if not data.get('Relationship to client (Primary carer)'):
-            data['Relationship to client (Primary carer)'] = find_value_after_label(['Relationship to client (Primary carer)'])
-        if not data.get('Home address (Primary carer)'):
-            data['Home address (Primary carer)'] = find_value_after_label(['Home address (Primary carer)'])
-        if not data.get('Plan management type'):
-            data['Plan management type'] = find_value_after_label(['Plan management type', 'Plan management'])
-        if not data.get('Plan manager name'):
-            data['Plan manager name'] = find_value_after_label(['Plan manager name'])
         
         # Extract support items from Support Items Required section
+        # (skipped entirely when no line mentions a support item)
+        has_support_items = any('support item (' in nl for nl in distinct_lines)
         for i in range(1, 20):
-            key = f'Support item ({i}) (Support Items Required)'
-            if not data.get(key):
+            key = _SUPPORT_ITEM_KEYS[i]
+            if has_support_items and not data.get(key):
                 # Look for "Support item (X)" label and get the value
-                label_pattern = f'Support item ({i})'
-                value = find_value_after_label([label_pattern])
+                value = find_value_after_label([_SUPPORT_ITEM_LABELS[i]])
                 if value:
                     data[key] = value
-        if not data.get('Plan manager postal address'):
-            data['Plan manager postal address'] = find_value_after_label(['Plan manager postal address', 'Plan manager address'])
-        if not data.get('Plan manager phone number'):
-            data['Plan manager phone number'] = find_value_after_label(['Plan manager phone', 'Plan manager phone number'])
-        if not data.get('Plan manager email address'):
-            data['Plan manager email address'] = find_value_after_label(['Plan manager email'])
-        if not data.get('Respondent'):
-            data['Respondent'] = find_value_after_label(['Respondent', 'Neighbourhood Care representative'])
-        if not data.get('Neighbourhood Care representative team'):
-            data['Neighbourhood Care representative team'] = find_value_after_label(['Neighbourhood Care representative team', 'Team'])
-        
-        # Extract establishment fee related fields
-        if not data.get('Is this client new to Neighbourhood Care?'):
-            data['Is this client new to Neighbourhood Care?'] = find_value_after_label(['Is this client new to Neighbourhood Care?', 'Is this client new', 'Is this a new client'])
-        if not data.get('Is Neighbourhood Care delivering 20 or more hours of support per month?'):
-            data['Is Neighbourhood Care delivering 20 or more hours of support per month?'] = find_value_after_label(['Is Neighbourhood Care delivering 20 or more hours of support per month?', 'Is Neighbourhood Care delivering 20', '20 or more hours of support'])
     
-        # Extract consent responses - look for Yes/No patterns
         consent_labels = [
             'I agree to receive services from Neighbourhood Care.',
             'I consent for Neighbourhood Care to create an NDIS portal service booking',
@@ -836,14 +1705,15 @@ def parse_pdf_to_data(pdf_path: str) -> dict:
         
         for consent_label in consent_labels:
             if consent_label not in data:
-                # Look for the consent text and find Yes/No after it
-                for i, line in enumerate(lines):
-                    if normalize_key(consent_label.split('.')[0]) in normalize_key(line):
-                        # Look for Yes/No in nearby lines
-                        for j in range(max(0, i-2), min(len(lines) if lines else i+5, i+5)):
-                            if normalize_key(lines[j]) in ['yes', 'no']:
-                                data[consent_label] = lines[j]
-                        break
+                # Look for the consent text (first matching line) and find Yes/No after it
+                label_lower = normalize_key(consent_label.split('.')[0])
+                match_idxs = [line_index[nl][0] for nl in distinct_lines if label_lower in nl]
+                if match_idxs:
+                    i = min(match_idxs)
+                    # Look for Yes/No in nearby lines
+                    for j in range(max(0, i-2), min(n, i+5)):
+                        if normalized_lines[j] in ('yes', 'no'):
+                            data[consent_label] = lines[j]
     
         # Debug output
         if DEBUG:
@@ -871,8 +1741,266 @@ def get_preferred_contact_details(csv_data):
         # Default to home phone if no clear preference
         return csv_data.get('Home phone (Contact Details of the Client)', 'Home phone (Contact Details of the Client)')
 
-# Signature extraction removed to prevent timeouts
-def _extract_signatures_from_pdf_removed(source_pdf_path):
+def _is_likely_signature(bbox, page_height):
+    """Check image placement: signatures are wide, short and near the bottom of the page"""
+    if bbox is None:
+        return True  # Can't determine - let the caller decide
+    x0, top, x1, bottom = bbox
+    img_width = x1 - x0
+    img_height = bottom - top
+    page_height = page_height or 800  # Default to 800 if unknown
+    return (
+        20 < img_height < 200 and  # Reasonable signature height
+        img_width > 100 and  # Signatures are usually wide
+        bottom > page_height * 0.7  # Near bottom of page (bottom 30%)
+    )
+
+def _filters(obj):
+    """Return an image stream's /Filter entry as a tuple of filter names"""
+    f = obj.get('/Filter', '')
+    return f if isinstance(f, list) else (f,)
+
+def _iter_candidate_images(pdf_path, max_pages=5, max_images=2):
+    """
+    Yield (page_num, bbox, image_bytes, ext) for likely signature images on the
+    last max_pages pages, stopping after max_images.
+    
+    PyMuPDF is preferred; pdfplumber is only opened (once) for pages where
+    PyMuPDF is unavailable or found no images. bbox is (x0, top, x1, bottom)
+    in points from the top-left of the page, or None if unknown. Placement is
+    checked from metadata first so only candidates get their pixels decoded.
+    """
+    yielded = 0
+    fitz_doc = None
+    try:
+        import fitz  # PyMuPDF
+        fitz_doc = fitz.open(pdf_path)
+        logger.debug("Signature extraction: Using PyMuPDF, found %s pages", len(fitz_doc))
+    except ImportError:
+        logger.debug("Signature extraction: PyMuPDF not available, using pdfplumber")
+    except Exception as e:
+        logger.warning("Error using PyMuPDF: %s", e)
+    
+    plumber_pdf = None
+    try:
+        if fitz_doc is not None:
+            total_pages = len(fitz_doc)
+        elif pdfplumber is not None:
+            plumber_pdf = pdfplumber.open(pdf_path)
+            total_pages = len(plumber_pdf.pages)
+        else:
+            return
+        
+        # Only process last max_pages pages (signatures are usually at the end)
+        start_page = max(0, total_pages - max_pages)
+        logger.debug("Signature extraction: Processing pages %s to %s (last %s pages)", start_page + 1, total_pages, max_pages)
+        
+        for page_num in range(start_page, total_pages):
+            found_on_page = False
+            
+            if fitz_doc is not None:
+                try:
+                    page = fitz_doc[page_num]
+                    page_images = page.get_images()
+                    logger.debug("Signature extraction: Page %s has %s images", page_num + 1, len(page_images))
+                    for img in page_images[:10]:  # Max 10 images per page
+                        found_on_page = True
+                        try:
+                            rect = page.get_image_bbox(img)
+                            bbox = (rect.x0, rect.y0, rect.x1, rect.y1)
+                        except Exception:
+                            bbox = None
+                        if not _is_likely_signature(bbox, page.rect.height):
+                            continue
+                        try:
+                            base_image = fitz_doc.extract_image(img[0])
+                        except Exception as e:
+                            logger.warning("Error extracting image %s: %s", img[0], e)
+                            continue
+                        yield page_num, bbox, base_image["image"], base_image["ext"]
+                        yielded += 1
+                        if yielded >= max_images:
+                            return
+                except Exception as e:
+                    logger.warning("Error reading page %s with PyMuPDF: %s", page_num + 1, e)
+            
+            if found_on_page or pdfplumber is None:
+                continue
+            
+            # Fallback: pdfplumber for this page only (better for FlateDecode images)
+            try:
+                if plumber_pdf is None:
+                    plumber_pdf = pdfplumber.open(pdf_path)
+                page = plumber_pdf.pages[page_num]
+                images = page.images
+            except Exception as e:
+                logger.warning("Error reading page %s with pdfplumber: %s", page_num + 1, e)
+                continue
+            if images:
+                logger.debug("Signature extraction: Page %s has %s images (pdfplumber)", page_num + 1, len(images))
+            
+            page_height = getattr(page, 'height', None)
+            for img in images[:10]:  # Max 10 images per page
+                bbox = (img.get('x0', 0) or 0, img.get('top', 0) or 0,
+                        img.get('x1', 0) or 0, img.get('bottom', 0) or 0)
+                if not _is_likely_signature(bbox, page_height):
+                    continue
+                stream = img.get('stream')
+                if not stream:
+                    continue
+                # Determine file extension based on filter up front so JPEG
+                # streams can skip the decompression attempt entirely
+                ext = 'png'  # Default for FlateDecode
+                if hasattr(stream, 'get'):
+                    if '/DCTDecode' in _filters(stream):
+                        ext = 'jpg'
+                
+                try:
+                    # Try to get raw image data
+                    if hasattr(stream, 'get_data'):
+                        image_data = stream.get_data()
+                    elif hasattr(stream, '_data'):
+                        image_data = stream._data
+                    else:
+                        image_data = None
+                        if hasattr(stream, 'raw_bytes'):
+                            raw_bytes = stream.raw_bytes
+                            if ext == 'jpg':
+                                # DCTDecode data is already a complete JPEG file
+                                image_data = raw_bytes
+                            else:
+                                # For FlateDecode, we need to decompress, pre-sizing the
+                                # output buffer from the image dimensions (8-bit RGBA
+                                # upper bound) so large images don't go through
+                                # repeated reallocations
+                                src_width, src_height = img.get('srcsize') or (0, 0)
+                                bufsize = int(src_width * src_height * 4) or len(raw_bytes) * 4
+                                try:
+                                    image_data = zlib.decompress(raw_bytes, zlib.MAX_WBITS, max(bufsize, zlib.DEF_BUF_SIZE))
+                                except:
+                                    image_data = raw_bytes
+                except Exception as e:
+                    logger.warning("Error extracting image data: %s", e)
+                    if _DEBUG:
+                        traceback.print_exc()
+                    continue
+                
+                if not image_data or len(image_data) <= 100:
+                    continue
+                
+                yield page_num, bbox, image_data, ext
+                yielded += 1
+                if yielded >= max_images:
+                    return
+    finally:
+        if fitz_doc is not None:
+            fitz_doc.close()
+        if plumber_pdf is not None:
+            plumber_pdf.close()
+
+# Hard limit for signature extraction - the worker process is killed after this
+SIGNATURE_EXTRACTION_TIMEOUT = 30
+
+# Signature extraction is disabled by default to prevent timeouts.
+# Set ENABLE_SIG_EXTRACTION=1 to turn it back on.
+def _signature_extraction_enabled():
+    return os.environ.get('ENABLE_SIG_EXTRACTION', '').strip().lower() in ('1', 'true', 'yes')
+
+def _extract_signatures_from_pdf(source_pdf_path):
+    """
+    Run signature extraction in a separate process with a hard timeout.
+    A hung or crashing PDF library cannot block the caller past the deadline;
+    on timeout the worker is killed and an empty dict is returned.
+    
+    Returns {} immediately unless ENABLE_SIG_EXTRACTION is set.
+    """
+    if not _signature_extraction_enabled():
+        return {}
+    
+    if not source_pdf_path or not os.path.exists(source_pdf_path):
+        logger.warning("Signature extraction: Source PDF not found: %s", source_pdf_path)
+        return {}
+    
+    import multiprocessing
+    
+    # Spawn rather than fork - this is called from Flask request threads, and a
+    # forked child would inherit whatever locks those threads happen to hold
+    ctx = multiprocessing.get_context('spawn')
+    result_conn, child_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_signature_worker_main, args=(source_pdf_path, child_conn))
+    try:
+        process.start()
+        child_conn.close()
+        if not result_conn.poll(SIGNATURE_EXTRACTION_TIMEOUT):
+            logger.warning("Signature extraction: Timeout reached after %ss, skipping signatures", SIGNATURE_EXTRACTION_TIMEOUT)
+            process.kill()
+            return {}
+        return result_conn.recv()
+    except Exception as e:
+        logger.warning("Error extracting signatures: %s", e)
+        return {}
+    finally:
+        result_conn.close()
+        child_conn.close()
+        if process.pid is not None:
+            process.join()
+
+def _signature_worker_main(source_pdf_path, conn):
+    """Child-process entry point: send the worker's result back to the parent over conn"""
+    try:
+        conn.send(_extract_signatures_worker(source_pdf_path))
+    except Exception as e:
+        logger.warning("Error extracting signatures: %s", e)
+        conn.send({})
+    finally:
+        conn.close()
+
+def _scan_page_images(page, page_num):
+    """Return (images seen, [(name, suffix, data), ...]) for the supported image XObjects on one page"""
+    images_found = 0
+    page_images = []
+    
+    resources = page.get('/Resources', {})
+    if not resources or '/XObject' not in resources:
+        return images_found, page_images
+    xobjects = resources['/XObject']
+    if hasattr(xobjects, 'get_object'):
+        xobjects = xobjects.get_object()
+    if not isinstance(xobjects, dict):
+        return images_found, page_images
+    
+    for obj_name, obj in xobjects.items():
+        # Both signature slots can be filled from this page - skip decoding the rest
+        if len(page_images) >= 2:
+            break
+        try:
+            if not (hasattr(obj, 'get') and obj.get('/Subtype') == '/Image'):
+                continue
+            images_found += 1
+            logger.debug("Signature extraction: Found image object %s on page %s", obj_name, page_num + 1)
+            
+            # Extract image data - try multiple filter types
+            filters = _filters(obj)
+            if '/DCTDecode' in filters:  # JPEG
+                suffix = '.jpg'
+            elif '/FlateDecode' in filters:  # PNG - this is what signatures use!
+                suffix = '.png'
+            elif '/CCITTFaxDecode' in filters:
+                suffix = '.tiff'
+            else:
+                logger.debug("Signature extraction: Image %s has unsupported filter: %s", obj_name, obj.get('/Filter', ''))
+                continue
+            
+            image_data = obj.get_data()
+            # Only keep substantial images
+            if image_data and len(image_data) > 100:
+                page_images.append((obj_name, suffix, image_data))
+        except Exception as e:
+            logger.warning("Error processing image object %s: %s", obj_name, e)
+    
+    return images_found, page_images
+
+def _extract_signatures_worker(source_pdf_path):
     """
     Extract signature images from the source PDF.
     Returns a dictionary with signature images (file paths).
@@ -890,103 +2018,67 @@ def _extract_signatures_from_pdf_removed(source_pdf_path):
     it returns an empty dict and the PDF generation continues without signatures.
     
     OPTIMIZED: Only processes last 5 pages (where signatures usually are) to avoid timeouts.
+    Runs inside the worker process started by _extract_signatures_from_pdf.
     """
-    import signal
-    import time
-    
     signatures = {}
-    if not source_pdf_path or not os.path.exists(source_pdf_path):
-        print(f"Signature extraction: Source PDF not found: {source_pdf_path}")
-        return signatures
+    logger.debug("Signature extraction: Attempting to extract from %s", source_pdf_path)
     
-    print(f"Signature extraction: Attempting to extract from {source_pdf_path}")
-    
-    # Set a maximum processing time (30 seconds)
-    start_time = time.time()
-    MAX_PROCESSING_TIME = 30
     MAX_PAGES_TO_PROCESS = 5  # Only check last 5 pages (signatures are usually at the end)
     
+    # Digests of image bytes already saved - the same XObject is often referenced
+    # more than once (form appearance + rendered page)
+    seen = set()
+    
     try:
-        # Method 1: Try PyMuPDF first (best method, but optional)
+        # Method 1: Embedded images via PyMuPDF, falling back to pdfplumber per page
+        candidates = _iter_candidate_images(source_pdf_path, MAX_PAGES_TO_PROCESS)
         try:
-            import fitz  # PyMuPDF
-            doc = fitz.open(source_pdf_path)
-            image_list = []
-            
-            total_pages = len(doc)
-            print(f"Signature extraction: Using PyMuPDF, found {total_pages} pages")
-            
-            # Only process last MAX_PAGES_TO_PROCESS pages (signatures are usually at the end)
-            start_page = max(0, total_pages - MAX_PAGES_TO_PROCESS)
-            print(f"Signature extraction: Processing pages {start_page + 1} to {total_pages} (last {MAX_PAGES_TO_PROCESS} pages)")
-            
-            for page_num in range(start_page, total_pages):
-                # Check timeout
-                if time.time() - start_time > MAX_PROCESSING_TIME:
-                    print("Signature extraction: Timeout reached during PyMuPDF processing")
-                    break
-                
-                page = doc[page_num]
-                # Get all images on the page
-                page_images = page.get_images()
-                print(f"Signature extraction: Page {page_num + 1} has {len(page_images)} images")
-                # Limit images per page
-                image_list.extend(page_images[:10])  # Max 10 images per page
-            
-            print(f"Signature extraction: Total images found: {len(image_list)}")
-            
-            # Extract images that might be signatures
-            # Look for images at the bottom of pages (where signatures usually are)
-            # Limit to first 20 images total to avoid memory issues
-            for img_index, img in enumerate(image_list[:20]):
-                # Check timeout
-                if time.time() - start_time > MAX_PROCESSING_TIME:
-                    print("Signature extraction: Timeout reached during image extraction")
-                    break
-                
-                # Stop if we already have 2 signatures
-                if len(signatures) >= 2:
-                    break
-                
+            for page_num, bbox, image_bytes, image_ext in candidates:
+                digest = hashlib.blake2b(image_bytes, digest_size=16).digest()
+                if digest in seen:
+                    continue
+                seen.add(digest)
                 try:
-                    # Get image data
-                    xref = img[0]
-                    base_image = doc.extract_image(xref)
-                    image_bytes = base_image["image"]
-                    image_ext = base_image["ext"]
-                    
-                    # Save to temporary file
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=f'.{image_ext}') as tmp_file:
-                        tmp_file.write(image_bytes)
-                        tmp_path = tmp_file.name
+                    # Only accepted candidates reach disk; raw fd from mkstemp, no buffered file object
+                    fd, tmp_path = tempfile.mkstemp(suffix=f'.{image_ext}')
+                    try:
+                        os.write(fd, image_bytes)
+                    finally:
+                        os.close(fd)
                     
-                    print(f"Signature extraction: Extracted image {img_index + 1} ({len(image_bytes)} bytes) to {tmp_path}")
+                    logger.debug("Signature extraction: Saved image from page %s (%s bytes) to %s", page_num + 1, len(image_bytes), tmp_path)
                     
                     # Take first 2 images as potential signatures
-                    if img_index < 2:
-                        key = 'signatory' if img_index == 0 else 'nc_representative'
-                        signatures[key] = tmp_path
-                        print(f"Signature extraction: Assigned image {img_index + 1} as {key}")
+                    key = 'signatory' if not signatures else 'nc_representative'
+                    signatures[key] = tmp_path
+                    logger.debug("Signature extraction: Assigned image as %s", key)
                 except Exception as e:
-                    print(f"Error extracting image {img_index}: {e}")
-            
-            doc.close()
-            if signatures:
-                print(f"Signature extraction: Successfully extracted {len(signatures)} signatures using PyMuPDF")
-                return signatures
-            else:
-                print("Signature extraction: PyMuPDF found images but none were assigned as signatures")
-        except ImportError:
-            # PyMuPDF not available, continue to other methods
-            print("Signature extraction: PyMuPDF not available, trying pypdf methods")
-            pass
-        except Exception as e:
-            print(f"Error using PyMuPDF: {e}")
+                    logger.warning("Error writing image from page %s: %s", page_num + 1, e)
+                
+                # Stop if we already have 2 signatures
+                if len(signatures) >= 2:
+                    break
+        finally:
+            candidates.close()
         
-        # Method 2: Try to extract from signature form fields using pypdf
+        if signatures:
+            logger.info("Signature extraction: Successfully extracted %s signatures from embedded images", len(signatures))
+            return signatures
+        
+        # Read the file once through a large buffer; both pypdf methods share one
+        # lenient (strict=False) reader instead of each re-parsing the PDF
+        pypdf_reader = None
         if PdfReader is not None:
             try:
-                reader = PdfReader(source_pdf_path)
+                with open(source_pdf_path, 'rb', buffering=1 << 20) as pdf_file:
+                    pypdf_reader = PdfReader(io.BytesIO(pdf_file.read()), strict=False)
+            except Exception as e:
+                logger.warning("Error opening PDF with pypdf: %s", e)
+        
+        # Method 2: Try to extract from signature form fields using pypdf
+        if pypdf_reader is not None:
+            try:
+                reader = pypdf_reader
                 
                 if reader.get_fields():
                     for field_name, field in reader.get_fields().items():
@@ -1017,227 +2109,103 @@ def _extract_signatures_from_pdf_removed(source_pdf_path):
                                                         # Would need to parse PDF stream to extract image
                                                         pass
                                             except Exception as e:
-                                                print(f"Error extracting from appearance stream: {e}")
+                                                logger.warning("Error extracting from appearance stream: %s", e)
                             except Exception as e:
-                                print(f"Error extracting signature from field {field_name}: {e}")
-            except Exception as e:
-                print(f"Error reading PDF fields: {e}")
-        
-        # Method 3: Try using pdfplumber to extract images (better for FlateDecode images)
-        if not signatures:
-            try:
-                # Check timeout
-                if time.time() - start_time > MAX_PROCESSING_TIME:
-                    print("Signature extraction: Timeout reached, skipping pdfplumber method")
-                    return signatures
-                
-                print("Signature extraction: Trying pdfplumber image extraction method")
-                import pdfplumber
-                with pdfplumber.open(source_pdf_path) as pdf:
-                    image_count = 0
-                    total_images_found = 0
-                    total_pages = len(pdf.pages)
-                    
-                    # Only process last MAX_PAGES_TO_PROCESS pages (signatures are usually at the end)
-                    start_page = max(0, total_pages - MAX_PAGES_TO_PROCESS)
-                    print(f"Signature extraction: Processing pages {start_page + 1} to {total_pages} (last {MAX_PAGES_TO_PROCESS} pages)")
-                    
-                    for page_num in range(start_page, total_pages):
-                        # Check timeout before processing each page
-                        if time.time() - start_time > MAX_PROCESSING_TIME:
-                            print("Signature extraction: Timeout reached during page processing")
-                            break
-                        
-                        page = pdf.pages[page_num]
-                        images = page.images
-                        if images:
-                            print(f"Signature extraction: Page {page_num + 1} has {len(images)} images")
-                            total_images_found += len(images)
-                            
-                            # Limit number of images processed per page
-                            max_images_per_page = 10
-                            images_to_process = images[:max_images_per_page]
-                            
-                            for img in images_to_process:
-                                # Check timeout before processing each image
-                                if time.time() - start_time > MAX_PROCESSING_TIME:
-                                    print("Signature extraction: Timeout reached during image processing")
-                                    break
-                                
-                                # Stop if we already have 2 signatures
-                                if image_count >= 2:
-                                    break
-                                
-                                try:
-                                    # Check if this looks like a signature (usually at bottom of page, specific size)
-                                    # Signatures are typically wider than tall, and positioned near bottom
-                                    img_height = img.get('height', 0) or 0
-                                    img_width = img.get('width', 0) or 0
-                                    y_position = img.get('y0', 0) or 0
-                                    page_height = getattr(page, 'height', None) or 800  # Default to 800 if None
-                                    
-                                    # Signatures are usually at bottom 20% of page and have reasonable dimensions
-                                    is_likely_signature = (
-                                        img_height and img_height > 20 and img_height < 200 and  # Reasonable signature height
-                                        img_width and img_width > 100 and  # Signatures are usually wide
-                                        page_height and y_position < page_height * 0.3  # Near bottom of page (y0 is from bottom)
-                                    )
-                                    
-                                    if is_likely_signature or image_count < 2:  # Take first 2 images if we can't determine
-                                        stream = img.get('stream')
-                                        if stream:
-                                            try:
-                                                # Try to get raw image data
-                                                if hasattr(stream, 'get_data'):
-                                                    image_data = stream.get_data()
-                                                elif hasattr(stream, '_data'):
-                                                    image_data = stream._data
-                                                else:
-                                                    # Try to extract from the stream object
-                                                    image_data = None
-                                                    try:
-                                                        # For FlateDecode, we need to decompress
-                                                        import zlib
-                                                        if hasattr(stream, 'raw_bytes'):
-                                                            raw_bytes = stream.raw_bytes
-                                                            # Try to decompress if it's compressed
-                                                            try:
-                                                                image_data = zlib.decompress(raw_bytes)
-                                                            except:
-                                                                image_data = raw_bytes
-                                                    except Exception as e:
-                                                        print(f"Error extracting stream data: {e}")
-                                                
-                                                if image_data and len(image_data) > 100:
-                                                    # Determine file extension based on filter
-                                                    suffix = '.png'  # Default for FlateDecode
-                                                    if hasattr(stream, 'get'):
-                                                        filter_type = stream.get('/Filter', '')
-                                                        if '/DCTDecode' in (filter_type if isinstance(filter_type, list) else [filter_type]):
-                                                            suffix = '.jpg'
-                                                    
-                                                    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-                                                        tmp_file.write(image_data)
-                                                        tmp_path = tmp_file.name
-                                                    
-                                                    print(f"Signature extraction: Saved image from page {page_num + 1} ({len(image_data)} bytes) to {tmp_path}")
-                                                    
-                                                    if image_count < 2:
-                                                        key = 'signatory' if image_count == 0 else 'nc_representative'
-                                                        signatures[key] = tmp_path
-                                                        image_count += 1
-                                                        print(f"Signature extraction: Assigned image as {key}")
-                                            except Exception as e:
-                                                print(f"Error extracting image data: {e}")
-                                                import traceback
-                                                traceback.print_exc()
-                                except Exception as e:
-                                    print(f"Error processing image: {e}")
-                    
-                    print(f"Signature extraction: pdfplumber found {total_images_found} total images, extracted {len(signatures)} as signatures")
+                                logger.warning("Error extracting signature from field %s: %s", field_name, e)
             except Exception as e:
-                print(f"Error extracting images with pdfplumber: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.warning("Error reading PDF fields: %s", e)
         
         # Method 4: Try using pypdf to extract images from pages (fallback)
-        if not signatures and PdfReader is not None:
+        if not signatures and pypdf_reader is not None:
             try:
-                print("Signature extraction: Trying pypdf image extraction method (fallback)")
-                reader = PdfReader(source_pdf_path)
-                image_count = 0
+                logger.debug("Signature extraction: Trying pypdf image extraction method (fallback)")
                 total_images_found = 0
                 
-                total_pages = len(reader.pages)
-                # Only process last MAX_PAGES_TO_PROCESS pages
+                total_pages = len(pypdf_reader.pages)
+                # Only process last MAX_PAGES_TO_PROCESS pages, newest first - signatures
+                # live at the end, so the early exit usually fires after one page
                 start_page = max(0, total_pages - MAX_PAGES_TO_PROCESS)
-                print(f"Signature extraction: Processing pages {start_page + 1} to {total_pages} (last {MAX_PAGES_TO_PROCESS} pages)")
+                logger.debug("Signature extraction: Processing pages %s down to %s (last %s pages)", total_pages, start_page + 1, MAX_PAGES_TO_PROCESS)
                 
-                for page_num in range(start_page, total_pages):
-                    # Check timeout
-                    if time.time() - start_time > MAX_PROCESSING_TIME:
-                        print("Signature extraction: Timeout reached during pypdf processing")
-                        break
-                    
+                for page_num in range(total_pages - 1, start_page - 1, -1):
                     # Stop if we already have 2 signatures
                     if len(signatures) >= 2:
                         break
-                    
                     try:
-                        page = reader.pages[page_num]
-                        resources = page.get('/Resources', {})
-                        if resources and '/XObject' in resources:
-                            xobjects = resources['/XObject']
-                            if hasattr(xobjects, 'get_object'):
-                                xobjects = xobjects.get_object()
-                            
-                            if isinstance(xobjects, dict):
-                                for obj_name, obj in xobjects.items():
-                                    try:
-                                        if hasattr(obj, 'get') and obj.get('/Subtype') == '/Image':
-                                            total_images_found += 1
-                                            print(f"Signature extraction: Found image object {obj_name} on page {page_num + 1}")
-                                            
-                                            # Extract image data - try multiple filter types
-                                            filter_type = obj.get('/Filter', '')
-                                            is_supported = False
-                                            
-                                            # Check for JPEG (DCTDecode)
-                                            if filter_type == '/DCTDecode' or (isinstance(filter_type, list) and '/DCTDecode' in filter_type):
-                                                is_supported = True
-                                                suffix = '.jpg'
-                                            # Check for PNG (FlateDecode) - this is what signatures use!
-                                            elif filter_type == '/FlateDecode' or (isinstance(filter_type, list) and '/FlateDecode' in filter_type):
-                                                is_supported = True
-                                                suffix = '.png'
-                                            # Check for other common formats
-                                            elif '/CCITTFaxDecode' in (filter_type if isinstance(filter_type, list) else [filter_type]):
-                                                is_supported = True
-                                                suffix = '.tiff'
-                                            
-                                            if is_supported:
-                                                try:
-                                                    image_data = obj.get_data()
-                                                    if image_data and len(image_data) > 100:  # Only save if it's substantial
-                                                        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-                                                            tmp_file.write(image_data)
-                                                            tmp_path = tmp_file.name
-                                                        
-                                                        print(f"Signature extraction: Saved image {obj_name} ({len(image_data)} bytes) to {tmp_path}")
-                                                        
-                                                        if image_count < 2:
-                                                            key = 'signatory' if image_count == 0 else 'nc_representative'
-                                                            signatures[key] = tmp_path
-                                                            image_count += 1
-                                                            print(f"Signature extraction: Assigned image as {key}")
-                                                except Exception as e:
-                                                    print(f"Error writing image {obj_name} to temp file: {e}")
-                                            else:
-                                                print(f"Signature extraction: Image {obj_name} has unsupported filter: {filter_type}")
-                                    except Exception as e:
-                                        print(f"Error processing image object {obj_name}: {e}")
+                        page_images_found, page_images = _scan_page_images(pypdf_reader.pages[page_num], page_num)
                     except Exception as e:
-                        print(f"Error processing page {page_num}: {e}")
+                        logger.warning("Error processing page %s: %s", page_num, e)
                         continue
-                
-                print(f"Signature extraction: pypdf found {total_images_found} total images, extracted {len(signatures)} as signatures")
+                    total_images_found += page_images_found
+                    
+                    for obj_name, suffix, image_data in page_images:
+                        digest = hashlib.blake2b(image_data, digest_size=16).digest()
+                        if digest in seen:
+                            continue
+                        seen.add(digest)
+                        try:
+                            fd, tmp_path = tempfile.mkstemp(suffix=suffix)
+                            try:
+                                os.write(fd, image_data)
+                            finally:
+                                os.close(fd)
+                            
+                            logger.debug("Signature extraction: Saved image %s (%s bytes) to %s", obj_name, len(image_data), tmp_path)
+                            
+                            key = 'signatory' if not signatures else 'nc_representative'
+                            signatures[key] = tmp_path
+                            logger.debug("Signature extraction: Assigned image as %s", key)
+                            if len(signatures) >= 2:
+                                break
+                        except Exception as e:
+                            logger.warning("Error writing image %s to temp file: %s", obj_name, e)
+                
+                logger.debug("Signature extraction: pypdf found %s total images, extracted %s as signatures", total_images_found, len(signatures))
             except Exception as e:
-                print(f"Error extracting images with pypdf: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.warning("Error extracting images with pypdf: %s", e)
+                if _DEBUG:
+                    traceback.print_exc()
                 
     except Exception as e:
-        print(f"Error extracting signatures: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.warning("Error extracting signatures: %s", e)
+        if _DEBUG:
+            traceback.print_exc()
         # Return empty dict on error - don't break the build
     
     if signatures:
-        print(f"Signature extraction: Successfully extracted {len(signatures)} signatures: {list(signatures.keys())}")
+        logger.info("Signature extraction: Successfully extracted %s signatures: %s", len(signatures), list(signatures.keys()))
     else:
-        print("Signature extraction: No signatures were extracted")
+        logger.info("Signature extraction: No signatures were extracted")
     
-    return {}  # Always return empty - signature extraction disabled
+    return signatures
+
+def _load_signature_flowables(signatures):
+    """Validate extracted signature files once and wrap the readable ones as Image flowables"""
+    flowables = {}
+    for key, path in (signatures or {}).items():
+        try:
+            # Extracted streams aren't always complete image files - check it decodes
+            ImageReader(path).getSize()
+        except Exception as e:
+            logger.warning("Signature %s at %s is not a readable image, skipping: %s", key, path, e)
+            continue
+        flowables[key] = Image(path, width=2*inch, height=0.5*inch)
+    return flowables
+
+def _append_signature(story, signatures, key, label, text):
+    """Append a signature block: name/date text, then the signature image (or an empty placeholder)"""
+    story.append(Paragraph(text, SA_NORMAL_NO_SPACE_STYLE))
+    # Signatures arrive pre-validated as Image flowables (see _load_signature_flowables)
+    sig_flowable = signatures.get(key) if signatures else None
+    if sig_flowable is not None:
+        logger.debug("Adding %s signature from: %s", label, sig_flowable.filename)
+        story.append(Spacer(1, 6))
+        story.append(sig_flowable)
+    else:
+        logger.debug("%s signature not found. Available signatures: %s", label, list(signatures) if signatures else 'none')
+        # Empty placeholder where the signature image would go
+        story.append(Paragraph("", SA_NORMAL_NO_SPACE_STYLE))
+    story.append(Spacer(1, 12))
 
 def create_service_agreement_from_data(csv_data, output_path, contact_name=None, source_pdf_path=None, ndis_items=None, active_users=None):
     """
@@ -1245,9 +2213,10 @@ def create_service_agreement_from_data(csv_data, output_path, contact_name=None,
     
     Args:
         csv_data: Dictionary containing form data
-        output_path: Path where the PDF should be saved
+        output_path: Path where the PDF should be saved, or a writable binary file object
+            (e.g. io.BytesIO) to stream the PDF without touching disk
         contact_name: Optional name to use for Key Contact lookup
-        source_pdf_path: Optional path to source PDF for signature extraction
+        source_pdf_path: Optional path to source PDF for signature extraction (only used when ENABLE_SIG_EXTRACTION is set)
         ndis_items: Optional pre-loaded NDIS items (for performance)
         active_users: Optional pre-loaded active users (for performance)
     """
@@ -1258,19 +2227,67 @@ def create_service_agreement_from_data(csv_data, output_path, contact_name=None,
     # Get team value to determine which active users CSV to use
     team_value = csv_data.get('Neighbourhood Care representative team', '')
     # Clean up checkbox characters
-    team_value = team_value.replace('\uf0d7', '').replace('•', '').replace('●', '').replace('☐', '').replace('☑', '').replace('✓', '').strip()
+    team_value = _clean_checkboxes(team_value)
     
     # Load active users based on team if not provided
     if active_users is None:
         active_users = load_active_users(team_value)
     
-    # Signature extraction removed to prevent timeouts
-    signatures = {}
+    # Signature extraction is off unless ENABLE_SIG_EXTRACTION is set (returns {} without touching the PDF)
+    signatures = _load_signature_flowables(_extract_signatures_from_pdf(source_pdf_path))
     
     # Create PDF document
     doc = SimpleDocTemplate(output_path, pagesize=A4)
     _build_service_agreement_content(doc, csv_data, ndis_items, active_users, contact_name, signatures)
 
+# NDIS catalogue loaded once per batch worker process by _init_batch_worker
+_BATCH_NDIS_ITEMS = None
+
+def _init_batch_worker():
+    """Load the NDIS support items once per batch worker process"""
+    global _BATCH_NDIS_ITEMS
+    _BATCH_NDIS_ITEMS = load_ndis_support_items()
+
+def _write_pdf_bytes(output_path, buffer):
+    """Write a rendered PDF buffer to output_path without copying it to bytes first"""
+    with open(output_path, 'wb') as file:
+        file.write(buffer.getbuffer())
+
+def _render_agreement_job(csv_data, output_path):
+    """Render a single service agreement inside a batch worker"""
+    buffer = io.BytesIO()
+    create_service_agreement_from_data(csv_data, buffer, ndis_items=_BATCH_NDIS_ITEMS)
+    _write_pdf_bytes(output_path, buffer)
+    return output_path
+
+def _batch_output_path(out_dir, title, index, csv_data):
+    """Output PDF path for one batch row, named after the participant"""
+    name = _join_nonempty(csv_data.get(_KEY_FIRST_NAME, '').strip(), csv_data.get(_KEY_SURNAME, '').strip())
+    name = re.sub(r'[\\/:*?"<>|]', '', name) or 'Participant'
+    return os.path.join(out_dir, f"{title} {index} - {name}.pdf")
+
+def render_agreements_batch(rows, out_dir, workers=None):
+    """
+    Render one service agreement per participant across worker processes.
+    
+    Args:
+        rows: Iterable of form data dictionaries (as returned by parse_pdf_to_data)
+        out_dir: Directory the PDFs are written to (created if missing)
+        workers: Number of worker processes (defaults to the CPU count)
+    
+    Returns:
+        list: Output PDF paths, in the same order as rows
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [(csv_data, _batch_output_path(out_dir, "Service Agreement", index, csv_data))
+            for index, csv_data in enumerate(rows, start=1)]
+    
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=_init_batch_worker) as executor:
+        futures = [executor.submit(_render_agreement_job, csv_data, output_path) for csv_data, output_path in jobs]
+        return [future.result() for future in futures]
+
 def create_service_agreement():
     # Load NDIS support items
     ndis_items = load_ndis_support_items()
@@ -1297,11 +2314,14 @@ def create_service_agreement():
         last_err = None
         for candidate in csv_candidates:
             try:
-                with open(candidate, 'r', encoding='utf-8') as file:
-                    reader = csv.DictReader(file)
-                    for row in reader:
-                        csv_data = row
-                        break
+                # Only the first data row is used, so zip it against the header
+                # instead of building a dict per row with DictReader
+                with open(candidate, 'r', encoding='utf-8', newline='') as file:
+                    reader = csv.reader(file)
+                    headers = next(reader, None)
+                    row = next((row for row in reader if row), None)
+                    if headers and row:
+                        csv_data = dict(zip(map(sys.intern, headers), row))
                 print(f"Successfully loaded CSV: {candidate}")
                 break
             except Exception as e:
@@ -1313,7 +2333,7 @@ def create_service_agreement():
     # Get team value to determine which active users CSV to use
     team_value = csv_data.get('Neighbourhood Care representative team', '')
     # Clean up checkbox characters
-    team_value = team_value.replace('\uf0d7', '').replace('•', '').replace('●', '').replace('☐', '').replace('☑', '').replace('✓', '').strip()
+    team_value = _clean_checkboxes(team_value)
     
     # Load active users based on team
     active_users = load_active_users(team_value)
@@ -1322,13 +2342,14 @@ def create_service_agreement():
     doc = SimpleDocTemplate("Service Agreement - FINAL TABLES.pdf", pagesize=A4)
     _build_service_agreement_content(doc, csv_data, ndis_items, active_users)
 
+# Footer drawn on every page
+_FOOTER_COLOR = colors.HexColor('#7F7F7F')  # Gray
+_FOOTER_TEXT = "Neighbourhood Care | Suite 103, 19 Ogilvie Road, Mount Pleasant, WA 6153 | ABN 40 634 832 607"
+
 def _add_header_footer(canvas_obj, doc):
     """Add header and footer to PDF pages"""
-    # Footer color (gray)
-    footer_color = colors.HexColor('#7F7F7F')
-    
-    # Footer text
-    footer_text = "Neighbourhood Care | Suite 103, 19 Ogilvie Road, Mount Pleasant, WA 6153 | ABN 40 634 832 607"
+    footer_color = _FOOTER_COLOR
+    footer_text = _FOOTER_TEXT
     
     # Get page number
     page_num = canvas_obj.getPageNumber()
@@ -1354,9 +2375,15 @@ def _add_header_footer(canvas_obj, doc):
     
     canvas_obj.restoreState()
 
-def _add_first_page_header(canvas_obj, doc):
-    """Add header with image to first page only"""
-    # Add the image to the right side of header
+# Resolved header image as (ImageReader or absolute path, aspect ratio), looked up once per process
+_HEADER_IMG_CACHE = None
+
+def _get_header_image():
+    """Find the header image and its aspect ratio, caching the result after the first lookup"""
+    global _HEADER_IMG_CACHE
+    if _HEADER_IMG_CACHE is not None:
+        return _HEADER_IMG_CACHE
+    
     image_filename = 'image.png'
     
     # Get the script directory (where this file is located)
@@ -1365,74 +2392,86 @@ def _add_first_page_header(canvas_obj, doc):
     except:
         script_dir = os.getcwd()
     
-    # Search for the image file
+    # Search for the image file - the exact filename is the common case, so probe
+    # each directory for it before listing any of them
     image_path = None
     search_dirs = [script_dir, os.getcwd(), '.']
     
     for search_dir in search_dirs:
-        if os.path.exists(search_dir):
+        test_path = os.path.join(search_dir, image_filename)
+        try:
+            os.stat(test_path)
+        except OSError:
+            continue
+        image_path = os.path.abspath(test_path)
+        print(f"DEBUG: Found image file: {image_filename}")
+        break
+    
+    if not image_path:
+        # Fallback: search for any PNG file with "image" in the name
+        for search_dir in search_dirs:
             try:
-                # Try exact filename first
-                test_path = os.path.join(search_dir, image_filename)
-                if os.path.exists(test_path):
-                    image_path = os.path.abspath(test_path)
-                    print(f"DEBUG: Found image file: {image_filename}")
-                    break
-                
-                # Fallback: search for any file with "image" in the name
-                for filename in os.listdir(search_dir):
-                    if filename.lower() == image_filename.lower() or (filename.lower().startswith('image') and filename.lower().endswith('.png')):
-                        full_path = os.path.join(search_dir, filename)
-                        if os.path.exists(full_path):
-                            image_path = os.path.abspath(full_path)
-                            print(f"DEBUG: Found image file: {filename}")
+                with os.scandir(search_dir) as entries:
+                    for entry in entries:
+                        name = entry.name.lower()
+                        if name.startswith('image') and name.endswith('.png') and entry.is_file():
+                            image_path = os.path.abspath(entry.path)
+                            print(f"DEBUG: Found image file: {entry.name}")
                             break
-                if image_path:
-                    break
-            except Exception as e:
+            except OSError as e:
                 print(f"DEBUG: Error searching in {search_dir}: {e}")
                 continue
+            if image_path:
+                break
+    
+    if not image_path:
+        # Don't cache a miss - the image may be deployed later
+        print(f"ERROR: Image file not found: {image_filename}")
+        print(f"DEBUG: Current working directory: {os.getcwd()}")
+        print(f"DEBUG: Script directory: {script_dir}")
+        return None
     
-    print(f"DEBUG: Looking for image: {image_filename}")
-    print(f"DEBUG: Image found: {image_path}")
-    print(f"DEBUG: Image exists: {os.path.exists(image_path) if image_path else False}")
+    # Decode the image once and keep the reader, so each PDF doesn't reopen and
+    # re-decode the file; fall back to the path if it can't be read here
+    image = image_path
+    aspect_ratio = 1.5  # Default aspect ratio
+    try:
+        reader = ImageReader(image_path)
+        img_width_orig, img_height_orig = reader.getSize()
+        reader.getRGBData()  # Decoded pixels are cached on the reader
+        image = reader
+        aspect_ratio = img_width_orig / img_height_orig
+        print(f"DEBUG: Image dimensions: {img_width_orig}x{img_height_orig}")
+    except Exception as pil_error:
+        print(f"DEBUG: Could not decode image, using default aspect ratio. Error: {pil_error}")
+    
+    _HEADER_IMG_CACHE = (image, aspect_ratio)
+    return _HEADER_IMG_CACHE
+
+def _add_first_page_header(canvas_obj, doc):
+    """Add header with image to first page only"""
+    # Add the image to the right side of header
+    header_image = _get_header_image()
     
-    if os.path.exists(image_path):
+    if header_image:
+        image, aspect_ratio = header_image
         try:
             # Image size - doubled from original size
             # Body text is 11pt, so image height around 80 points for better visibility
             img_height = 80  # Doubled size for better visibility
+            img_width = img_height * aspect_ratio
             
             # Position on right side of header
             # ReportLab uses bottom-left as origin (0,0), so y increases upward
             page_width = A4[0]  # 595.27 points
             page_height = A4[1]  # 841.89 points
             img_y = page_height - 70  # Top of page with margin (from bottom)
-            
-            # Try to get image dimensions to calculate aspect ratio
-            img_width = img_height * 1.5  # Default aspect ratio
-            try:
-                from PIL import Image as PILImage
-                pil_img = PILImage.open(image_path)
-                img_width_orig, img_height_orig = pil_img.size
-                aspect_ratio = img_width_orig / img_height_orig
-                img_width = img_height * aspect_ratio
-                print(f"DEBUG: Image dimensions: {img_width_orig}x{img_height_orig}, scaled to: {img_width:.1f}x{img_height}")
-            except Exception as pil_error:
-                print(f"DEBUG: PIL not available, using default aspect ratio. Error: {pil_error}")
-            
             img_x = page_width - img_width - 50  # Right side with margin
-            print(f"DEBUG: Drawing image at position: x={img_x:.1f}, y={img_y}, size: {img_width:.1f}x{img_height}")
-            print(f"DEBUG: Page dimensions: {page_width}x{page_height}")
             
             canvas_obj.saveState()
-            # Use absolute path for drawImage
-            abs_image_path = os.path.abspath(image_path)
-            print(f"DEBUG: Using absolute image path: {abs_image_path}")
-            
             # Draw the image
             canvas_obj.drawImage(
-                abs_image_path, 
+                image, 
                 img_x, 
                 img_y, 
                 width=img_width, 
@@ -1440,15 +2479,10 @@ def _add_first_page_header(canvas_obj, doc):
                 preserveAspectRatio=True
             )
             canvas_obj.restoreState()
-            print("DEBUG: Image drawn successfully")
         except Exception as e:
             print(f"ERROR: Could not add header image: {e}")
-            import traceback
-            traceback.print_exc()
-    else:
-        print(f"ERROR: Image file not found at: {image_path}")
-        print(f"DEBUG: Current working directory: {os.getcwd()}")
-        print(f"DEBUG: Script directory: {os.path.dirname(os.path.abspath(__file__)) if '__file__' in globals() else 'unknown'}")
+            if _DEBUG:
+                traceback.print_exc()
     
     # Also add footer for first page
     _add_header_footer(canvas_obj, doc)
@@ -1456,174 +2490,33 @@ def _add_first_page_header(canvas_obj, doc):
 def _build_service_agreement_content(doc, csv_data, ndis_items, active_users, contact_name=None, signatures=None):
     """Build the service agreement PDF content"""
     story = []
-    styles = getSampleStyleSheet()
-    
-    # Create custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Title'],
-        fontSize=18,
-        textColor=BLUE_COLOR,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leftIndent=0
-    )
-    
-    normal_style = ParagraphStyle(
-        'CustomNormal',
-        parent=styles['Normal'],
-        fontSize=11,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leading=14,
-        leftIndent=0
-    )
-    
-    # Style with no space after for immediate following text
-    normal_no_space_style = ParagraphStyle(
-        'CustomNormalNoSpace',
-        parent=styles['Normal'],
-        fontSize=11,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leading=14,
-        leftIndent=0
-    )
-    
-    # Style for headings that should have no space after
-    heading_no_space_style = ParagraphStyle(
-        'CustomHeadingNoSpace',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=BLUE_COLOR,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leftIndent=0
-    )
-    
-    # Style for black headings with no space after
-    black_heading_no_space_style = ParagraphStyle(
-        'BlackHeadingNoSpace',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.black,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leftIndent=0
-    )
-    
-    # Style for bold headings (questions) with no space after
-    bold_heading_no_space_style = ParagraphStyle(
-        'BoldHeadingNoSpace',
-        parent=styles['Normal'],
-        fontSize=11,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leading=14,
-        leftIndent=0
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=BLUE_COLOR,
-        alignment=TA_LEFT,
-        spaceAfter=12,
-        leftIndent=0
-    )
-    
-    black_heading_style = ParagraphStyle(
-        'BlackHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.black,
-        alignment=TA_LEFT,
-        spaceAfter=12,
-        leftIndent=0
-    )
-    
-    table_text_style = ParagraphStyle(
-        'TableText',
-        wordWrap='CJK',  # Enable word wrapping
-        parent=styles['Normal'],
-        fontSize=8,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leading=10,
-        leftIndent=0
-    )
-    
-    bullet_style = ParagraphStyle(
-        'BulletStyle',
-        parent=styles['Normal'],
-        fontSize=11,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leftIndent=20,
-        bulletIndent=10,
-        leading=14
-    )
+    add = story.append
     
     # Get team value early for price determination
     team_value = csv_data.get('Neighbourhood Care representative team', '[To be filled in]')
     # Clean up checkbox characters that appear as black boxes
-    team_value = team_value.replace('\uf0d7', '').replace('•', '').replace('●', '').replace('☐', '').replace('☑', '').replace('✓', '').strip()
+    team_value = _clean_checkboxes(team_value)
     
     # Title
-    story.append(Paragraph("Service Agreement", title_style))
-    story.append(Spacer(1, 12))  # Add one line space after title
+    add(Paragraph("Service Agreement", SA_TITLE_STYLE))
+    add(Spacer(1, 12))  # Add one line space after title
     
     # Introduction
-    intro1 = "Thank you for choosing Neighbourhood Care. We look forward to working with you to help you achieve your goals."
-    story.append(Paragraph(intro1, normal_no_space_style))
-    story.append(Spacer(1, 12))
-    
-    intro2 = "This document is a written agreement between you and Neighbourhood Care that outlines the supports we will provide and how they will be delivered."
-    story.append(Paragraph(intro2, normal_no_space_style))
-    story.append(Spacer(1, 12))
-    
-    intro3 = "<b>Please make sure you have read and understood our Agreements, Promises and Terms of Service before completing this document.</b>"
-    story.append(Paragraph(intro3, normal_no_space_style))
-    story.append(Spacer(1, 12))
-    
-    intro4 = "If you are unsure about any part of this document please speak to your Neighbourhood Care representative."
-    story.append(Paragraph(intro4, normal_no_space_style))
-    story.append(Spacer(1, 12))
-    
-    intro5 = "This Service Agreement must then be signed for us to start delivering services."
-    story.append(Paragraph(intro5, normal_no_space_style))
-    story.append(Spacer(1, 12))
+    for text in _SA_INTRO_PARAGRAPHS:
+        add(Paragraph(text, SA_NORMAL_NO_SPACE_STYLE))
+        add(Spacer(1, 12))
     
     # What makes up your service
-    what_makes_up_heading_style = ParagraphStyle(
-        'WhatMakesUpHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=BLUE_COLOR,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leftIndent=0
-    )
-    story.append(Paragraph("What makes up your service?", what_makes_up_heading_style))
+    add(Paragraph("What makes up your service?", SA_WHAT_MAKES_UP_HEADING_STYLE))
     
     service_text = "Please note that your service is made up of face to face and some non face to face supports. Services that may be charged as part of your service are:"
-    story.append(Paragraph(service_text, normal_no_space_style))
-    story.append(Spacer(1, 12))
-    
-    service_bullets = [
-        "Transporting you during a shift (this is a $1 cost per km and is billed out of your core budget).",
-        "Communication by phone or email or in a face to face meeting with key people in your network - when this is not part of your rostered shift.",
-        "Travel for support workers or therapists when they are coming directly from the office or from another participant or travelling back to the office at the end of the shift.",
-        "Preparing some reports that are required for the NDIS such as creating your Support Plan.",
-        "Costs for when we are supporting you in the community such as parking, public transport and so forth.",
-        "For <i>new</i> participants, receiving Core supports, the one off Establishment fee is applied."
-    ]
+    add(Paragraph(service_text, SA_NORMAL_NO_SPACE_STYLE))
+    add(Spacer(1, 12))
     
-    for bullet in service_bullets:
-        story.append(Paragraph(f"• {bullet}", bullet_style))
+    for bullet in _SA_SERVICE_BULLETS:
+        add(Paragraph(f"• {bullet}", SA_BULLET_STYLE))
     
-    story.append(Spacer(1, 12))
+    add(Spacer(1, 12))
     
     # Calculate Establishment Fee
     establishment_fee_amount = get_establishment_fee(csv_data, ndis_items, team_value)
@@ -1640,111 +2533,34 @@ def _build_service_agreement_content(doc, csv_data, ndis_items, active_users, co
                 ]
                 
                 establishment_table = Table(establishment_data, colWidths=[3*inch, 2*inch])
-                establishment_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (0, 0), BLUE_COLOR),
-                    ('TEXTCOLOR', (0, 0), (0, 0), colors.white),
-                    ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
-                    ('BACKGROUND', (1, 0), (1, 0), colors.white),
-                    ('TEXTCOLOR', (1, 0), (1, 0), colors.black),
-                    ('FONTNAME', (1, 0), (1, 0), 'Helvetica'),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 11),
-                    ('TOPPADDING', (0, 0), (-1, -1), 8),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 6),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')
-                ]))
-                story.append(establishment_table)
-                story.append(Spacer(1, 12))
+                establishment_table.setStyle(_SA_ESTABLISHMENT_TABLE_STYLE)
+                add(establishment_table)
+                add(Spacer(1, 12))
         except (ValueError, AttributeError):
             # If we can't parse the fee, don't show the table
             pass
     
     # Schedule of Supports
-    schedule_heading_style = ParagraphStyle(
-        'ScheduleHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=BLUE_COLOR,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leftIndent=0
-    )
-    story.append(Paragraph("Schedule of Supports", schedule_heading_style))
+    add(Paragraph("Schedule of Supports", SA_SCHEDULE_HEADING_STYLE))
     
     # Core and Capacity Building
-    core_capacity_heading_style = ParagraphStyle(
-        'CoreCapacityHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.black,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leftIndent=0
-    )
-    story.append(Paragraph("Core and Capacity Building", core_capacity_heading_style))
-    # Create white bold text style for table cells
-    white_bold_table_text_style = ParagraphStyle(
-        'WhiteBoldTableText',
-        parent=styles['Normal'],
-        fontSize=8,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leading=10,
-        leftIndent=0,
-        textColor=colors.white,
-        fontName='Helvetica-Bold'
-    )
+    add(Paragraph("Core and Capacity Building", SA_CORE_CAPACITY_HEADING_STYLE))
     
     core_data = [
-        [Paragraph('Core Budget Allocated to Neighbourhood Care', white_bold_table_text_style), Paragraph(csv_data.get('Total core budget to allocate to Neighbourhood Care', 'Total core budget to allocate to Neighbourhood Care (NDIS Information)'), table_text_style)],
-        [Paragraph('Capacity Building Budget Allocated to Neighbourhood Care', white_bold_table_text_style), Paragraph(csv_data.get('Total capacity building budget to allocate to Neighbourhood Care', 'Total capacity building budget to allocate to Neighbourhood Care (NDIS Information)'), table_text_style)]
+        [Paragraph('Core Budget Allocated to Neighbourhood Care', SA_WHITE_BOLD_TABLE_TEXT_STYLE), Paragraph(csv_data.get('Total core budget to allocate to Neighbourhood Care', 'Total core budget to allocate to Neighbourhood Care (NDIS Information)'), SA_TABLE_TEXT_STYLE)],
+        [Paragraph('Capacity Building Budget Allocated to Neighbourhood Care', SA_WHITE_BOLD_TABLE_TEXT_STYLE), Paragraph(csv_data.get('Total capacity building budget to allocate to Neighbourhood Care', 'Total capacity building budget to allocate to Neighbourhood Care (NDIS Information)'), SA_TABLE_TEXT_STYLE)]
     ]
     
     core_table = Table(core_data, colWidths=[3.5*inch, 2*inch])
-    core_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, 0), BLUE_COLOR),
-        ('TEXTCOLOR', (0, 0), (0, 0), colors.white),
-        ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
-        ('BACKGROUND', (1, 0), (1, 0), colors.white),
-        ('TEXTCOLOR', (1, 0), (1, 0), colors.black),
-        ('FONTNAME', (1, 0), (1, 0), 'Helvetica'),
-        ('BACKGROUND', (0, 1), (0, 1), BLUE_COLOR),
-        ('TEXTCOLOR', (0, 1), (0, 1), colors.white),
-        ('FONTNAME', (0, 1), (0, 1), 'Helvetica-Bold'),
-        ('BACKGROUND', (1, 1), (1, 1), colors.white),
-        ('TEXTCOLOR', (1, 1), (1, 1), colors.black),
-        ('FONTNAME', (1, 1), (1, 1), 'Helvetica'),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP')
-    ]))
-    story.append(core_table)
+    core_table.setStyle(_SA_CORE_TABLE_STYLE)
+    add(core_table)
     
     # Support Items
-    support_items_heading_style = ParagraphStyle(
-        'SupportItemsHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.black,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leftIndent=0
-    )
-    story.append(Paragraph("Support Items", support_items_heading_style))
-    support_data = [['Category', 'Name', 'Number', 'Unit', 'Price']]
-    
+    add(Paragraph("Support Items", SA_SUPPORT_ITEMS_HEADING_STYLE))
     # Extract support items from the PDF data - look for "Support item (X) (Support Items Required)"
     support_items_from_pdf = []
     for i in range(1, 20):  # Check up to 20 support items
-        key = f'Support item ({i}) (Support Items Required)'
+        key = _SUPPORT_ITEM_KEYS[i]
         item_name = csv_data.get(key, '').strip()
         if item_name:
             support_items_from_pdf.append((i, item_name))
@@ -1753,466 +2569,172 @@ def _build_service_agreement_content(doc, csv_data, ndis_items, active_users, co
     # Determine which state's price to use based on team
     price_state = get_price_state(team_value)
     price_key = 'wa_price' if price_state == 'WA' else 'qld_price'
+    get_price = operator.itemgetter(price_key)
     
-    for item_num, item_name in support_items_from_pdf:
-        item_details = lookup_support_item(ndis_items, item_name)
-        # Check if item was actually found (not the placeholder)
-        item_found = item_name in ndis_items or any(
-            item_name.lower() in key.lower() or key.lower() in item_name.lower() 
-            for key in ndis_items.keys()
-        )
+    support_data = [_SUPPORT_HEADER_ROW] + [None] * len(support_items_from_pdf)
+    for row_index, (item_num, item_name) in enumerate(support_items_from_pdf, start=1):
+        item_key = find_support_item_key(ndis_items, item_name)
         # If item not found, show [Not Found] for all fields
-        if item_found:
-            support_data.append([
-                Paragraph(f'Support item ({item_num})', table_text_style),
-                Paragraph(item_name, table_text_style),
-                Paragraph(item_details.get('number', ''), table_text_style),
-                Paragraph(item_details.get('unit', ''), table_text_style),
-                Paragraph(item_details.get(price_key, ''), table_text_style)
-            ])
-        else:
-            support_data.append([
-                Paragraph(f'Support item ({item_num})', table_text_style),
-                Paragraph(item_name, table_text_style),
-                Paragraph('[Not Found]', table_text_style),
-                Paragraph('[Not Found]', table_text_style),
-                Paragraph('[Not Found]', table_text_style)
-            ])
+        item_details = ndis_items[item_key] if item_key is not None else _NOT_FOUND_DETAILS
+        support_data[row_index] = [
+            Paragraph(_SUPPORT_ITEM_LABELS[item_num], SA_TABLE_TEXT_STYLE),
+            Paragraph(item_name, SA_TABLE_TEXT_STYLE),
+            Paragraph(item_details.get('number', ''), SA_TABLE_TEXT_STYLE),
+            Paragraph(item_details.get('unit', ''), SA_TABLE_TEXT_STYLE),
+            Paragraph(get_price(item_details) if price_key in item_details else '', SA_TABLE_TEXT_STYLE)
+        ]
     
     # Adjust column widths to prevent text overflow - A4 width is ~8.27 inches, leave some margin
     support_table = Table(support_data, colWidths=[0.7*inch, 3.5*inch, 1.1*inch, 0.7*inch, 0.9*inch])
-    support_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), BLUE_COLOR),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP')
-    ]))
-    story.append(support_table)
-    story.append(Spacer(1, 12))
+    support_table.setStyle(_SA_SUPPORT_TABLE_STYLE)
+    add(support_table)
+    add(Spacer(1, 12))
     
     # Consents
-    consents_heading_style = ParagraphStyle(
-        'ConsentsHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=BLUE_COLOR,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leftIndent=0
-    )
-    story.append(Paragraph("Consents", consents_heading_style))
-    consent_data = []
-    
-    consents = [
-        'I agree to receive services from Neighbourhood Care.',
-        'I consent for Neighbourhood Care to create an NDIS portal service booking on my behalf if my budget/s are Agency Managed.',
-        'I understand that if at any time I (The Participant) require emergency medical assistance, Neighbourhood Care staff will call an ambulance to attend, and that I (The Participant) will be liable for any expenses incurred for Ambulance attendance.',
-        'I agree that Neighbourhood Care staff may administer simple first aid to me (The Participant), if the need arises.',
-        'I consent for Neighbourhood Care to discuss relevant information about my case with other providers involved in my care and support, for example GP, support coordinator.',
-        'I agree not to smoke inside the home whilst Neighbourhood Care staff are present.',
-        'I understand that an Emergency Response Plan will be developed with me by Neighbourhood Care to help keep me safe in the event of an emergency.',
-        'I consent for Neighbourhood Care for I (The Participant) to be photographed/recorded for therapeutic and/or training purposes.',
-        'I give authority for my details or information to be shared with an external auditor who will assess Neighbourhood Care against the NDIS Quality and Safeguards Framework.'
-    ]
-    
-    for consent in consents:
-        consent_data.append([Paragraph(consent, white_bold_table_text_style), csv_data.get(consent, 'Yes')])
+    add(Paragraph("Consents", SA_CONSENTS_HEADING_STYLE))
+    consent_data = [[Paragraph(consent, SA_WHITE_BOLD_TABLE_TEXT_STYLE), csv_data.get(consent, 'Yes')] for consent in _SA_CONSENTS]
     
     consent_table = Table(consent_data, colWidths=[4.2*inch, 0.8*inch])
-    consent_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), BLUE_COLOR),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.white),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('BACKGROUND', (1, 0), (1, -1), colors.white),
-        ('TEXTCOLOR', (1, 0), (1, -1), colors.black),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 7),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP')
-    ]))
-    story.append(consent_table)
-    story.append(Spacer(1, 12))
+    consent_table.setStyle(_SA_CONSENT_TABLE_STYLE)
+    add(consent_table)
+    add(Spacer(1, 12))
     
     # Agreements, Promises and Terms of Service
-    agreements_heading_style = ParagraphStyle(
-        'AgreementsHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=BLUE_COLOR,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leftIndent=0
-    )
-    story.append(Paragraph("<b>Agreements, Promises and Terms of Service</b>", agreements_heading_style))
-    
-    story.append(Paragraph("Our Agreements, Promises and Terms of Service outline how we deliver services. It outlines our rights and responsibilities as a service provider, and the rights and responsibilities of the people we provide services to.", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    
-    story.append(Paragraph("<b>What can you expect from Neighbourhood Care?</b>", bold_heading_no_space_style))
-    story.append(Paragraph("We agree to:", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    
-    nc_agreements = [
-        "Review your care and service plan every 6 months with you.",
-        "Maintain a service that works for you, so times of appointments meet your needs and we are in tune with each other. We call this Attunement.",
-        "At all times communicate openly and honestly in a timely manner.",
-        "At all times treat you with dignity and respect and being mindful of any cultural differences.",
-        "Be open and transparent about managing complaints or disagreements and provide you the opportunity to provide feedback to us and to the NDIS.",
-        "Ensure your privacy and any information is held in confidence and not shared without your permission.",
-        "Work together at every step on your journey towards reaching your goals.",
-        "Operate within the National Disability Insurance Scheme Act 2013 and associated Business Rules."
-    ]
-    
-    for agreement in nc_agreements:
-        story.append(Paragraph(f"• {agreement}", bullet_style))
-    
-    story.append(Spacer(1, 12))
-    
-    story.append(Paragraph("<b>What is expected of you as an NDIS participant?</b>", normal_style))
-    story.append(Paragraph("You agree to:", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    
-    participant_agreements = [
-        "Inform Neighbourhood Care about how you wish your supports to be provided and how they should be offered to meet your needs.",
-        "Treat Neighbourhood Care staff with courtesy and respect in the same way you want to be treated.",
-        "Talk to Neighbourhood Care if you have any concerns about Plan Management or Financial Administration being provided.",
-        "Give your care and support team the required notice if you need to end this Service Agreement. There is a notice period of 4 weeks to end this service.",
-        "Advise your care and support team immediately if your plan is suspended or replaced by a new NDIS Plan or where you stop being an active participant in the NDIS."
-    ]
-    
-    for agreement in participant_agreements:
-        story.append(Paragraph(f"• {agreement}", bullet_style))
-    
-    story.append(Spacer(1, 12))
-    
-    story.append(Paragraph("<b>Cancellations</b>", normal_style))
-    story.append(Paragraph("If a make-up shift with that support worker cannot be scheduled, the NDIS considers this a Short Notice Cancellation, and Neighbourhood Care may charge 100% of the agreed hourly rate.", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    
-    story.append(Paragraph("<b>How will services be provided to you?</b>", bold_heading_no_space_style))
-    story.append(Paragraph("Services will be provided at your place of residence and in other locations as deemed necessary and suitable by you, your family, the Support Coordinator and the Neighbourhood Care Team charged with your safety whilst in the service.", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    
-    story.append(Paragraph("<b>When will services be provided?</b>", bold_heading_no_space_style))
-    story.append(Paragraph("All services will be provided in attunement to your needs and subject to availability by others who may have an impact to your availability.", normal_no_space_style))
-    story.append(Paragraph("From the commencement of the service agreement: Direct support provided as per the support and/or Therapy support plan, subject to change/increase, upon confirmation with you and/or your family.", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    
-    story.append(Paragraph("<b>How long will services be provided?</b>", bold_heading_no_space_style))
-    story.append(Paragraph("Services will be provided for the length of the service agreement plan unless otherwise ceased at the discretion by by you or your team, in accordance with Neighbourhood Care's Policy and Procedures.", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    
-    story.append(Paragraph("<b>How to make changes?</b>", bold_heading_no_space_style))
-    story.append(Paragraph("If changes to the supports or their delivery are required, you and your Neighbourhood Care team (the parties) agree to discuss and review this Service Agreement. The Parties agree that any changes to this Service Agreement will be in writing, signed, and dated by the Parties.", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    
-    story.append(Paragraph("<b>How to end the Agreement?</b>", bold_heading_no_space_style))
-    story.append(Paragraph("Should either Party wish to end this Service Agreement they must give 4 weeks written notice to their care and support team. If either Party seriously breaches this Service Agreement the requirement of notice will be waived.", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    
-    story.append(Paragraph("<b>Pricing Changes</b>", bold_heading_no_space_style))
-    story.append(Paragraph("Neighbourhood Care's services are charged in accordance with the NDIS Pricing Arrangements and Price Limits Guide. The prices set out in this Service Agreement will change in accordance with updates to the NDIS Pricing Arrangements and Price Limits Guide. This typically updates on the 1st of July each year but may be updated at other times.", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    
-    story.append(Paragraph("<b>What to do if there is a problem?</b>", bold_heading_no_space_style))
-    story.append(Paragraph("If there is a problem with anything related to your service or this agreement, you can contact:", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    story.append(Paragraph("Your Neighbourhood Care contact person (please refer to the front page of your Service Agreement) or 1800 292 273.", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    story.append(Paragraph("Alternatively, you can email your concern or query to: ask@nhcare.com.au.", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    story.append(Paragraph("If you don't feel that your problem was resolved please speak to your support coordinator, Local Area Coordinator or you can just contact the National Disability Insurance Agency (NDIA)", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    
-    story.append(Paragraph("<b>Collection of your personal information</b>", bold_heading_no_space_style))
-    story.append(Paragraph("Neighbourhood Care will use your information to support your involvement in the NDIS.", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    story.append(Paragraph("Neighbourhood Care will NOT use any of your personal information for any other purpose or disclose your personal information to any other organisations or individuals (including overseas recipients) unless authorised by law or you provide consent for us to do so.", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    story.append(Paragraph("You can also ask to see what personal information (if any) we hold about you at any time and you can seek correction if the information is incorrect.", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    story.append(Paragraph("<b>Neighbourhood Care's privacy policy describes:</b>", normal_no_space_style))
-    
-    privacy_bullets = [
-        "How we use your personal information",
-        "Why some personal information may be given to other organisations from time to time",
-        "How you can access the personal information we have about you on our system",
-        "How you can complain about a privacy breach, and how Neighbourhood Care deals with the complaint.",
-        "How you can get your personal information corrected if it is wrong."
-    ]
-    
-    for bullet in privacy_bullets:
-        story.append(Paragraph(f"• {bullet}", bullet_style))
-    
-    story.append(Spacer(1, 12))
-    story.append(Paragraph("You can find the policy by enquiring at Neighbourhood Care.", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    story.append(Paragraph("Please note that Neighbourhood Care is required to release information about service users (without identifying you by full name or address) to the Australian Institute of Health and Welfare, to enable statistics about disability services and their clients to be compiled. This information will be kept confidential. This information is used for statistical purposes only and will not be used to affect your entitlements or your access to services. You have the right to access your own files and to update or correct information included in the Disability Services National Minimum Data Set collection.", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    
-    story.append(Paragraph("<b>Goods and Services Tax</b>", normal_style))
-    story.append(Paragraph("Most services provided under the NDIS will not include GST. However, GST will apply to some services. Neighbourhood Care will apply GST when it is required.", normal_no_space_style))
-    story.append(Spacer(1, 12))
-    
-    # For your information text (comes before Signatures heading)
-    for_your_info_text = 'For your information: "A supply of supports under this Service Agreement is a supply of one or more reasonable and necessary supports specified in the statement of supports included, under subsection 33(2) of the National Disability Insurance Scheme Act 2013 (NDIS Act), in the participant\'s NDIS Plan currently in effect under section 37 of the NDIS Act."'
-    story.append(Paragraph(for_your_info_text, normal_no_space_style))
-    story.append(Spacer(1, 12))
+    for item in _SA_AGREEMENTS_SECTION:
+        add(Spacer(1, 12) if item is None else Paragraph(*item))
     
     # Signatures
-    signatures_heading_style = ParagraphStyle(
-        'SignaturesHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=BLUE_COLOR,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leftIndent=0
-    )
-    story.append(Paragraph("Signatures", signatures_heading_style))
+    add(Paragraph("Signatures", SA_SIGNATURES_HEADING_STYLE))
     signatory_name = f"{csv_data.get('First name (Person Signing the Agreement)', 'First name (Person Signing the Agreement)')} {csv_data.get('Surname (Person Signing the Agreement)', 'Surname (Person Signing the Agreement)')}"
     signatory_text = f"<b>Signatory:</b><br/><b>Name:</b> {signatory_name}<br/><b>Date:</b> <br/><b>Signed:</b>"
-    story.append(Paragraph(signatory_text, normal_no_space_style))
-    
-    # Add signatory signature image if available
-    if signatures and 'signatory' in signatures:
-        try:
-            sig_img = signatures['signatory']
-            # Check if it's a file path (string) or already an image object
-            if isinstance(sig_img, str) and os.path.exists(sig_img):
-                print(f"Adding signatory signature from: {sig_img}")
-                story.append(Spacer(1, 6))
-                story.append(Image(sig_img, width=2*inch, height=0.5*inch))
-            else:
-                print(f"Signatory signature path invalid or doesn't exist: {sig_img}")
-                story.append(Paragraph("", normal_no_space_style))
-        except Exception as e:
-            print(f"Error adding signatory signature: {e}")
-            import traceback
-            traceback.print_exc()
-            story.append(Paragraph("", normal_no_space_style))
-    else:
-        print(f"Signatory signature not found. Available signatures: {list(signatures.keys()) if signatures else 'none'}")
-        story.append(Paragraph("", normal_no_space_style))
-    
-    story.append(Spacer(1, 12))
+    _append_signature(story, signatures, 'signatory', 'Signatory', signatory_text)
     
     # Neighbourhood Care Representative
     nc_rep_name = contact_name if contact_name else ""
     nc_rep_text = f"<b>Neighbourhood Care Representative:</b><br/><b>Name:</b> {nc_rep_name}<br/><b>Date:</b> <br/><b>Signed:</b>"
-    story.append(Paragraph(nc_rep_text, normal_no_space_style))
-    
-    # Add NC representative signature image if available
-    if signatures and 'nc_representative' in signatures:
-        try:
-            sig_img = signatures['nc_representative']
-            # Check if it's a file path (string) or already an image object
-            if isinstance(sig_img, str) and os.path.exists(sig_img):
-                print(f"Adding NC representative signature from: {sig_img}")
-                story.append(Spacer(1, 6))
-                story.append(Image(sig_img, width=2*inch, height=0.5*inch))
-            else:
-                print(f"NC representative signature path invalid or doesn't exist: {sig_img}")
-                story.append(Paragraph("", normal_no_space_style))
-        except Exception as e:
-            print(f"Error adding NC representative signature: {e}")
-            import traceback
-            traceback.print_exc()
-            story.append(Paragraph("", normal_no_space_style))
-    else:
-        print(f"NC representative signature not found. Available signatures: {list(signatures.keys()) if signatures else 'none'}")
-        story.append(Paragraph("", normal_no_space_style))
-    
-    story.append(Spacer(1, 12))
+    _append_signature(story, signatures, 'nc_representative', 'NC representative', nc_rep_text)
     
     # Participant - FIXED with all missing fields
-    story.append(Paragraph("Appendix", black_heading_style))
-    story.append(Paragraph("Participant", black_heading_no_space_style))
+    add(Paragraph("Appendix", SA_BLACK_HEADING_STYLE))
+    add(Paragraph("Participant", SA_BLACK_HEADING_NO_SPACE_STYLE))
+    _g = csv_data.get
+    # Client name and DOB are read once here and reused for the Neighbourhood Care ID below
+    first_name = _g(_KEY_FIRST_NAME, '').strip()
+    middle_name = _g('Middle name (Details of the Client)', '').strip()
+    surname = _g(_KEY_SURNAME, '').strip()
+    client_dob = _g(_KEY_DOB, '').strip()
+    
     # Participant Name: First name + Middle name + Surname (from Details of the Client)
-    first_name = csv_data.get('First name (Details of the Client)', '').strip()
-    middle_name = csv_data.get('Middle name (Details of the Client)', '').strip()
-    surname = csv_data.get('Surname (Details of the Client)', '').strip()
-    participant_name_parts = [p for p in [first_name, middle_name, surname] if p]
-    participant_name = ' '.join(participant_name_parts) if participant_name_parts else ''
+    participant_name = _join_nonempty(first_name, middle_name, surname)
     
     # Emergency Contact: First name + Surname (from Emergency contact)
-    emergency_first = csv_data.get('First name (Emergency contact)', '').strip()
-    emergency_surname = csv_data.get('Surname (Emergency contact)', '').strip()
-    emergency_contact_parts = [p for p in [emergency_first, emergency_surname] if p]
-    emergency_contact = ' '.join(emergency_contact_parts) if emergency_contact_parts else get_emergency_contact(csv_data)
+    emergency_first = _g('First name (Emergency contact)', '').strip()
+    emergency_surname = _g('Surname (Emergency contact)', '').strip()
+    emergency_contact = _join_nonempty(emergency_first, emergency_surname) or get_emergency_contact(csv_data)
     
     # Get all values, using empty string if not found
-    home_address = csv_data.get('Home address (Contact Details of the Client)', '').strip()
-    home_phone = csv_data.get('Home phone (Contact Details of the Client)', '').strip()
-    mobile_phone = csv_data.get('Mobile phone (Contact Details of the Client)', '').strip()
-    email_address = csv_data.get('Email address (Contact Details of the Client)', '').strip()
-    dob = csv_data.get('Date of birth (Details of the Client)', '').strip() or csv_data.get('Date of birth', '').strip()
-    ndis_num = csv_data.get('NDIS number (Details of the Client)', '').strip() or csv_data.get('NDIS number', '').strip()
-    plan_start = csv_data.get('Plan start date', '').strip()
-    plan_end = csv_data.get('Plan end date', '').strip()
-    service_start = csv_data.get('Service start date', '').strip() or csv_data.get('Service start', '').strip()
-    service_end = csv_data.get('Service end date', '').strip() or csv_data.get('Service end', '').strip()
-    preferred_contact = csv_data.get('Preferred method of contact', '').strip()
+    home_address = _g('Home address (Contact Details of the Client)', '').strip()
+    home_phone = _g('Home phone (Contact Details of the Client)', '').strip()
+    mobile_phone = _g('Mobile phone (Contact Details of the Client)', '').strip()
+    email_address = _g('Email address (Contact Details of the Client)', '').strip()
+    dob = client_dob or _first_nonempty(csv_data, 'Date of birth')
+    ndis_num = _first_nonempty(csv_data, 'NDIS number (Details of the Client)', 'NDIS number')
+    plan_start = _g('Plan start date', '').strip()
+    plan_end = _g('Plan end date', '').strip()
+    service_start = _first_nonempty(csv_data, 'Service start date', 'Service start')
+    service_end = _first_nonempty(csv_data, 'Service end date', 'Service end')
+    preferred_contact = _g('Preferred method of contact', '').strip()
     # Clean up checkbox characters that appear as black boxes
-    preferred_contact = preferred_contact.replace('\uf0d7', '').replace('•', '').replace('●', '').replace('☐', '').replace('☑', '').replace('✓', '').strip()
+    preferred_contact = _clean_checkboxes(preferred_contact)
     
     participant_data = [
-        ['Participant Name', Paragraph(participant_name, table_text_style)],
-        ['Date of Birth', dob],
-        ['NDIS Number', ndis_num],
-        ['Plan Duration', f"{plan_start} - {plan_end}" if (plan_start or plan_end) else ''],
-        ['Address', Paragraph(home_address, table_text_style)],
-        ['Home phone', home_phone],
-        ['Mobile phone', mobile_phone],
-        ['Email address', Paragraph(email_address, table_text_style)],
-        ['Preferred contact method', preferred_contact],
-        ['Emergency Contact', Paragraph(emergency_contact, table_text_style)],
-        ['Service Agreement Duration', f"{service_start} - {service_end}" if (service_start or service_end) else '']
+        ('Participant Name', Paragraph(participant_name, SA_TABLE_TEXT_STYLE)),
+        ('Date of Birth', dob),
+        ('NDIS Number', ndis_num),
+        ('Plan Duration', f"{plan_start} - {plan_end}" if (plan_start or plan_end) else ''),
+        ('Address', Paragraph(home_address, SA_TABLE_TEXT_STYLE)),
+        ('Home phone', home_phone),
+        ('Mobile phone', mobile_phone),
+        ('Email address', Paragraph(email_address, SA_TABLE_TEXT_STYLE)),
+        ('Preferred contact method', preferred_contact),
+        ('Emergency Contact', Paragraph(emergency_contact, SA_TABLE_TEXT_STYLE)),
+        ('Service Agreement Duration', f"{service_start} - {service_end}" if (service_start or service_end) else '')
     ]
     
-    participant_table = Table(participant_data, colWidths=[2.5*inch, 3*inch])
-    participant_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.white),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP')
-    ]))
-    story.append(participant_table)
-    story.append(Spacer(1, 12))
+    participant_table = Table(participant_data, colWidths=_APPENDIX_COLWIDTHS)
+    participant_table.setStyle(_SA_TWO_COL_APPENDIX_STYLE)
+    add(participant_table)
+    add(Spacer(1, 12))
     
     # Signatory (detailed) - FIXED with all missing fields
-    story.append(Paragraph("Signatory", black_heading_no_space_style))
-    # Get signatory contact details based on who is signing (preferred method only)
-    signatory_contact = get_signatory_contact_details(csv_data)
+    add(Paragraph("Signatory", SA_BLACK_HEADING_NO_SPACE_STYLE))
+    # Resolve the signatory fields based on who is signing (preferred contact method only)
+    signatory = build_signatory_view(csv_data)
     
     signatory_detailed_data = [
-        ['Name', Paragraph(get_signatory_name(csv_data), table_text_style)],
-        ['Relationship to Participant', get_signatory_relationship(csv_data)],
-        ['Address', Paragraph(get_signatory_address(csv_data), table_text_style)],
-        ['Contact Details', Paragraph(signatory_contact, table_text_style)]
+        ('Name', Paragraph(signatory['name'], SA_TABLE_TEXT_STYLE)),
+        ('Relationship to Participant', signatory['relationship']),
+        ('Address', Paragraph(signatory['address'], SA_TABLE_TEXT_STYLE)),
+        ('Contact Details', Paragraph(signatory['contact'], SA_TABLE_TEXT_STYLE))
     ]
     
-    signatory_detailed_table = Table(signatory_detailed_data, colWidths=[2.5*inch, 3*inch])
-    signatory_detailed_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.white),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP')
-    ]))
-    story.append(signatory_detailed_table)
-    story.append(Spacer(1, 12))
+    signatory_detailed_table = Table(signatory_detailed_data, colWidths=_APPENDIX_COLWIDTHS)
+    signatory_detailed_table.setStyle(_SA_TWO_COL_APPENDIX_STYLE)
+    add(signatory_detailed_table)
+    add(Spacer(1, 12))
     
     # Plan Manager
-    story.append(Paragraph("Plan Manager", black_heading_no_space_style))
+    add(Paragraph("Plan Manager", SA_BLACK_HEADING_NO_SPACE_STYLE))
+    plan_manager = get_plan_manager_info(csv_data)
     plan_manager_data = [
-        ['Name', get_plan_manager_name(csv_data)],
-        ['Postal Address', Paragraph(get_plan_manager_address(csv_data), table_text_style)],
-        ['Phone', get_plan_manager_phone(csv_data)],
-        ['Email Address', Paragraph(get_plan_manager_email(csv_data), table_text_style)]
+        ('Name', plan_manager['name']),
+        ('Postal Address', Paragraph(plan_manager['address'], SA_TABLE_TEXT_STYLE)),
+        ('Phone', plan_manager['phone']),
+        ('Email Address', Paragraph(plan_manager['email'], SA_TABLE_TEXT_STYLE))
     ]
     
-    plan_manager_table = Table(plan_manager_data, colWidths=[2.5*inch, 3*inch])
-    plan_manager_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.white),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP')
-    ]))
-    story.append(plan_manager_table)
-    story.append(Spacer(1, 12))
+    plan_manager_table = Table(plan_manager_data, colWidths=_APPENDIX_COLWIDTHS)
+    plan_manager_table.setStyle(_SA_TWO_COL_APPENDIX_STYLE)
+    add(plan_manager_table)
+    add(Spacer(1, 12))
     
     # My Neighbourhood Care Key Contact
-    story.append(Paragraph("My Neighbourhood Care Key Contact", black_heading_no_space_style))
+    add(Paragraph("My Neighbourhood Care Key Contact", SA_BLACK_HEADING_NO_SPACE_STYLE))
     
     # Get contact name from parameter or fallback to Respondent field
-    contact_name_to_use = contact_name or csv_data.get('Respondent', '')
+    contact_name_to_use = contact_name or _g('Respondent', '')
     user_data = lookup_user_data(active_users, contact_name_to_use) if contact_name_to_use else {'name': '', 'mobile': '', 'email': ''}
     
     # Calculate My Neighbourhood Care ID: First name + Surname + Year of Date of birth
-    first_name = csv_data.get('First name (Details of the Client)', '').strip()
-    surname = csv_data.get('Surname (Details of the Client)', '').strip()
-    dob = csv_data.get('Date of birth (Details of the Client)', '').strip()
-    
     # Extract year from date of birth (handle formats like DD/MM/YYYY or YYYY-MM-DD)
     year = ''
-    if dob:
+    if client_dob:
         # Try to extract year from common date formats
-        year_match = re.search(r'\b(19|20)\d{2}\b', dob)
+        year_match = _YEAR_RE.search(client_dob)
         if year_match:
             year = year_match.group(0)
     
     # Build ID: First name + Surname + Year (with spaces)
-    name_parts = [p for p in [first_name, surname] if p]
-    neighbourhood_care_id = ' '.join(name_parts) + ' ' + year if name_parts and year else '[To be filled in]'
+    client_name = _join_nonempty(first_name, surname)
+    neighbourhood_care_id = client_name + ' ' + year if client_name and year else '[To be filled in]'
     
     # Get team value and clean checkbox characters
-    team_value = csv_data.get('Neighbourhood Care representative team', '[To be filled in]')
+    team_value = _g('Neighbourhood Care representative team', '[To be filled in]')
     # Clean up checkbox characters that appear as black boxes
-    team_value = team_value.replace('\uf0d7', '').replace('•', '').replace('●', '').replace('☐', '').replace('☑', '').replace('✓', '').strip()
+    team_value = _clean_checkboxes(team_value)
     
     key_contact_data = [
-        ['My Neighbourhood Care ID', neighbourhood_care_id],
-        ['Team', team_value],
-        ['Key Contact', Paragraph(contact_name_to_use if contact_name_to_use else user_data.get('name', '[To be filled in]'), table_text_style)],
-        ['Phone', user_data.get('mobile', '[To be filled in]')],
-        ['Email Address', Paragraph(user_data.get('email', '[To be filled in]'), table_text_style)],
-        ['Neighbourhood Care Office', 'Phone: 1800 292 273']
+        ('My Neighbourhood Care ID', neighbourhood_care_id),
+        ('Team', team_value),
+        ('Key Contact', Paragraph(contact_name_to_use if contact_name_to_use else user_data.get('name', '[To be filled in]'), SA_TABLE_TEXT_STYLE)),
+        ('Phone', user_data.get('mobile', '[To be filled in]')),
+        ('Email Address', Paragraph(user_data.get('email', '[To be filled in]'), SA_TABLE_TEXT_STYLE)),
+        ('Neighbourhood Care Office', 'Phone: 1800 292 273')
     ]
     
-    key_contact_table = Table(key_contact_data, colWidths=[2.5*inch, 3*inch])
-    key_contact_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.white),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP')
-    ]))
-    story.append(key_contact_table)
+    key_contact_table = Table(key_contact_data, colWidths=_APPENDIX_COLWIDTHS)
+    key_contact_table.setStyle(_SA_TWO_COL_APPENDIX_STYLE)
+    add(key_contact_table)
     
     # Build PDF with headers and footers
     doc.build(story, onFirstPage=_add_first_page_header, onLaterPages=_add_header_footer)
@@ -2222,148 +2744,154 @@ def get_emergency_contact(csv_data):
     """Get emergency contact based on the logic specified"""
     is_primary_carer = csv_data.get('Is the primary carer also the emergency contact for the participant?', '').strip()
     # Clean checkbox characters and check if it's "yes"
-    is_primary_carer_clean = is_primary_carer.replace('\uf0d7', '').replace('•', '').replace('●', '').replace('☐', '').replace('☑', '').replace('✓', '').strip().lower()
+    is_primary_carer_clean = _clean_checkboxes(is_primary_carer).lower()
     
     if 'yes' in is_primary_carer_clean:
         first_name = csv_data.get('First name (Primary carer)', '').strip()
         surname = csv_data.get('Surname (Primary carer)', '').strip()
-        name_parts = [p for p in [first_name, surname] if p]
-        return ' '.join(name_parts) if name_parts else ''
+        return _join_nonempty(first_name, surname)
     else:
         first_name = csv_data.get('First name (Emergency contact)', '').strip()
         surname = csv_data.get('Surname (Emergency contact)', '').strip()
-        name_parts = [p for p in [first_name, surname] if p]
-        return ' '.join(name_parts) if name_parts else ''
+        return _join_nonempty(first_name, surname)
+
+def _signatory_fields(section, name_keys, relationship_key, preferred_keys):
+    """Field names to read for one kind of signatory, keyed by the form section suffix"""
+    # Interned to match the interned keys of the form data
+    return {
+        'name_keys': tuple(map(sys.intern, name_keys)),
+        'relationship_key': relationship_key and sys.intern(relationship_key),
+        'address_key': sys.intern(f'Home address ({section})'),
+        'preferred_keys': tuple(map(sys.intern, preferred_keys)),
+        # Keyed by the _CONTACT_METHOD_RE match
+        'contact_keys': {
+            'home phone': sys.intern(f'Home phone ({section})'),
+            'mobile': sys.intern(f'Mobile phone ({section})'),
+            'email': sys.intern(f'Email address ({section})'),
+            'work phone': sys.intern(f'Work phone ({section})'),
+        },
+    }
+
+# Every contact method named in a preferred method of contact, including overlapping
+# mentions; when several are named the lowest _CONTACT_METHOD_PRIORITY wins
+_CONTACT_METHOD_RE = re.compile(r'(?=(home phone|mobile|email|work phone))')
+_CONTACT_METHOD_PRIORITY = {'home phone': 0, 'mobile': 1, 'email': 2, 'work phone': 3}
+
+# Signatory field names by the lowercased 'Person signing the agreement' value
+_SIGNATORY_FIELDS = {
+    'participant': _signatory_fields(
+        'Contact Details of the Client',
+        (_KEY_FIRST_NAME, 'Middle name (Details of the Client)', _KEY_SURNAME),
+        None,
+        ('Preferred method of contact',)),
+    'primary carer': _signatory_fields(
+        'Primary carer',
+        ('First name (Primary carer)', 'Surname (Primary carer)'),
+        'Relationship to client (Primary carer)',
+        ('Preferred method of contact (Primary carer)', 'Preferred method of contact')),
+}
+_SIGNATORY_FIELDS_DEFAULT = _signatory_fields(
+    'Person Signing the Agreement',
+    ('First name (Person Signing the Agreement)', 'Surname (Person Signing the Agreement)'),
+    'Relationship to client (Person Signing the Agreement)',
+    ('Preferred method of contact (Person Signing the Agreement)', 'Preferred method of contact'))
+
+def build_signatory_view(csv_data):
+    """Resolve the signatory's name, relationship, address and contact details in one pass"""
+    person_signing = csv_data.get(_KEY_PERSON_SIGNING, '').strip().lower()
+    fields = _SIGNATORY_FIELDS.get(person_signing, _SIGNATORY_FIELDS_DEFAULT)
+    
+    relationship_key = fields['relationship_key']
+    # The participant is the client, so there is no relationship field to read
+    relationship = csv_data.get(relationship_key, '').strip() if relationship_key else 'Participant'
+    
+    # Clean up checkbox characters to get the actual preferred method
+    preferred_contact = _clean_checkboxes(_first_nonempty(csv_data, *fields['preferred_keys']))
+    methods = _CONTACT_METHOD_RE.findall(preferred_contact.lower())
+    if methods:
+        method = min(methods, key=_CONTACT_METHOD_PRIORITY.__getitem__)
+        contact = csv_data.get(fields['contact_keys'][method], '').strip()
+    else:
+        # Fallback: the preferred method itself if we can't find the actual value
+        contact = preferred_contact
+    
+    return {
+        'name': _join_nonempty(*(csv_data.get(key, '').strip() for key in fields['name_keys'])),
+        'relationship': relationship,
+        'address': csv_data.get(fields['address_key'], '').strip(),
+        'contact': contact,
+    }
 
 def get_signatory_name(csv_data):
     """Get signatory name based on who is signing"""
-    person_signing = csv_data.get('Person signing the agreement', '').strip()
-    if person_signing.lower() == 'participant':
-        # Participant is the client - use First name + Middle name + Surname from Details of the Client
-        first_name = csv_data.get('First name (Details of the Client)', '').strip()
-        middle_name = csv_data.get('Middle name (Details of the Client)', '').strip()
-        surname = csv_data.get('Surname (Details of the Client)', '').strip()
-        name_parts = [p for p in [first_name, middle_name, surname] if p]
-        return ' '.join(name_parts) if name_parts else ''
-    elif person_signing.lower() == 'primary carer':
-        first_name = csv_data.get('First name (Primary carer)', '').strip()
-        surname = csv_data.get('Surname (Primary carer)', '').strip()
-        name_parts = [p for p in [first_name, surname] if p]
-        return ' '.join(name_parts) if name_parts else ''
-    else:
-        first_name = csv_data.get('First name (Person Signing the Agreement)', '').strip()
-        surname = csv_data.get('Surname (Person Signing the Agreement)', '').strip()
-        name_parts = [p for p in [first_name, surname] if p]
-        return ' '.join(name_parts) if name_parts else ''
+    return build_signatory_view(csv_data)['name']
 
 def get_signatory_relationship(csv_data):
     """Get signatory relationship based on who is signing"""
-    person_signing = csv_data.get('Person signing the agreement', '').strip()
-    if person_signing.lower() == 'participant':
-        return 'Participant'
-    elif person_signing.lower() == 'primary carer':
-        return csv_data.get('Relationship to client (Primary carer)', '').strip()
-    else:
-        return csv_data.get('Relationship to client (Person Signing the Agreement)', '').strip()
+    return build_signatory_view(csv_data)['relationship']
 
 def get_signatory_address(csv_data):
     """Get signatory address based on who is signing"""
-    person_signing = csv_data.get('Person signing the agreement', '').strip()
-    if person_signing.lower() == 'participant':
-        return csv_data.get('Home address (Contact Details of the Client)', '').strip()
-    elif person_signing.lower() == 'primary carer':
-        return csv_data.get('Home address (Primary carer)', '').strip()
-    else:
-        return csv_data.get('Home address (Person Signing the Agreement)', '').strip()
+    return build_signatory_view(csv_data)['address']
 
 def get_signatory_contact_details(csv_data):
     """Get actual contact detail value for signatory based on preferred method and who is signing"""
-    person_signing = csv_data.get('Person signing the agreement', '').strip()
-    
-    # Get preferred method of contact
-    preferred_contact = ''
-    if person_signing.lower() == 'participant':
-        # Use participant's preferred method of contact
-        preferred_contact = csv_data.get('Preferred method of contact', '').strip()
-    elif person_signing.lower() == 'primary carer':
-        # Use primary carer's preferred method of contact (if available)
-        preferred_contact = csv_data.get('Preferred method of contact (Primary carer)', '').strip() or csv_data.get('Preferred method of contact', '').strip()
-    else:
-        # Use Person Signing the Agreement preferred method of contact (if available)
-        preferred_contact = csv_data.get('Preferred method of contact (Person Signing the Agreement)', '').strip() or csv_data.get('Preferred method of contact', '').strip()
-    
-    # Clean up checkbox characters to get the actual preferred method
-    if preferred_contact:
-        preferred_contact = preferred_contact.replace('\uf0d7', '').replace('•', '').replace('●', '').replace('☐', '').replace('☑', '').replace('✓', '').strip()
-    
-    # Get the actual contact value based on preferred method
-    preferred_contact_lower = preferred_contact.lower()
-    
-    if person_signing.lower() == 'participant':
-        # Get participant's contact details
-        if 'home phone' in preferred_contact_lower:
-            return csv_data.get('Home phone (Contact Details of the Client)', '').strip()
-        elif 'mobile phone' in preferred_contact_lower or 'mobile' in preferred_contact_lower:
-            return csv_data.get('Mobile phone (Contact Details of the Client)', '').strip()
-        elif 'email' in preferred_contact_lower:
-            return csv_data.get('Email address (Contact Details of the Client)', '').strip()
-        elif 'work phone' in preferred_contact_lower:
-            return csv_data.get('Work phone (Contact Details of the Client)', '').strip()
-    elif person_signing.lower() == 'primary carer':
-        # Get primary carer's contact details
-        if 'home phone' in preferred_contact_lower:
-            return csv_data.get('Home phone (Primary carer)', '').strip()
-        elif 'mobile phone' in preferred_contact_lower or 'mobile' in preferred_contact_lower:
-            return csv_data.get('Mobile phone (Primary carer)', '').strip()
-        elif 'email' in preferred_contact_lower:
-            return csv_data.get('Email address (Primary carer)', '').strip()
-        elif 'work phone' in preferred_contact_lower:
-            return csv_data.get('Work phone (Primary carer)', '').strip()
-    else:
-        # Get Person Signing the Agreement's contact details
-        if 'home phone' in preferred_contact_lower:
-            return csv_data.get('Home phone (Person Signing the Agreement)', '').strip()
-        elif 'mobile phone' in preferred_contact_lower or 'mobile' in preferred_contact_lower:
-            return csv_data.get('Mobile phone (Person Signing the Agreement)', '').strip()
-        elif 'email' in preferred_contact_lower:
-            return csv_data.get('Email address (Person Signing the Agreement)', '').strip()
-        elif 'work phone' in preferred_contact_lower:
-            return csv_data.get('Work phone (Person Signing the Agreement)', '').strip()
-    
-    # Fallback: return preferred method if we can't find the actual value
-    return preferred_contact
+    return build_signatory_view(csv_data)['contact']
+
+# Plan management types with no plan manager to list
+_MANAGED_TYPES = frozenset({'NDIA Agency Managed', 'Insurance Commission of WA'})
+
+_EMPTY_PLAN_MANAGER = {'name': '', 'address': '', 'phone': '', 'email': ''}
+
+def get_plan_manager_info(csv_data):
+    """Get plan manager name, address, phone and email based on plan management type"""
+    if csv_data.get('Plan management type', '') in _MANAGED_TYPES:
+        return dict(_EMPTY_PLAN_MANAGER)
+    return {
+        'name': csv_data.get('Plan manager name', 'Plan manager name (Support Items Required)'),
+        'address': csv_data.get('Plan manager postal address', 'Plan manager postal address (Support Items Required)'),
+        'phone': csv_data.get('Plan manager phone number', 'Plan manager phone number (Support Items Required)'),
+        'email': csv_data.get('Plan manager email address', 'Plan manager email address (Support Items Required)'),
+    }
 
 def get_plan_manager_name(csv_data):
     """Get plan manager name based on plan management type"""
-    plan_type = csv_data.get('Plan management type', '')
-    if plan_type in ['NDIA Agency Managed', 'Insurance Commission of WA']:
-        return ''
-    else:
-        return csv_data.get('Plan manager name', 'Plan manager name (Support Items Required)')
+    return get_plan_manager_info(csv_data)['name']
 
 def get_plan_manager_address(csv_data):
     """Get plan manager address based on plan management type"""
-    plan_type = csv_data.get('Plan management type', '')
-    if plan_type in ['NDIA Agency Managed', 'Insurance Commission of WA']:
-        return ''
-    else:
-        return csv_data.get('Plan manager postal address', 'Plan manager postal address (Support Items Required)')
+    return get_plan_manager_info(csv_data)['address']
 
 def get_plan_manager_phone(csv_data):
     """Get plan manager phone based on plan management type"""
-    plan_type = csv_data.get('Plan management type', '')
-    if plan_type in ['NDIA Agency Managed', 'Insurance Commission of WA']:
-        return ''
-    else:
-        return csv_data.get('Plan manager phone number', 'Plan manager phone number (Support Items Required)')
+    return get_plan_manager_info(csv_data)['phone']
 
 def get_plan_manager_email(csv_data):
     """Get plan manager email based on plan management type"""
-    plan_type = csv_data.get('Plan management type', '')
-    if plan_type in ['NDIA Agency Managed', 'Insurance Commission of WA']:
-        return ''
-    else:
-        return csv_data.get('Plan manager email address', 'Plan manager email address (Support Items Required)')
+    return get_plan_manager_info(csv_data)['email']
+
+# Numeric date with a consistent '-', '/' or '.' separator, e.g. 2023-12-25 or 25/12/2023
+_DATE_RE = re.compile(r'([0-9]{1,4})([-/.])([0-9]{1,2})\2([0-9]{1,4})')
+
+# Common date formats, tried in order when _DATE_RE does not match
+_DATE_FORMATS = (
+    '%Y-%m-%d',      # 2023-12-25
+    '%d/%m/%Y',      # 25/12/2023
+    '%m/%d/%Y',      # 12/25/2023
+    '%d-%m-%Y',      # 25-12-2023
+    '%Y/%m/%d',      # 2023/12/25
+    '%d.%m.%Y',      # 25.12.2023
+)
+
+# First three runs of digits anywhere in a date string
+_DATE_NUM_RE = re.compile(r'(\d+)\D+(\d+)\D+(\d+)')
+
+# (year, month, day) positions to try for each separator, in _DATE_FORMATS order
+_DATE_ORDERS = {
+    '-': ((0, 1, 2), (2, 1, 0)),
+    '/': ((2, 1, 0), (2, 0, 1), (0, 1, 2)),
+    '.': ((2, 1, 0),),
+}
 
 def format_date_for_display(date_str):
     """Format date string to DD/MM/YYYY format"""
@@ -2374,48 +2902,41 @@ def format_date_for_display(date_str):
     if not date_str:
         return ""
     
-    from datetime import datetime
-    
-    # Try to parse common date formats
-    date_formats = [
-        '%Y-%m-%d',      # 2023-12-25
-        '%d/%m/%Y',      # 25/12/2023
-        '%m/%d/%Y',      # 12/25/2023
-        '%d-%m-%Y',      # 25-12-2023
-        '%Y/%m/%d',      # 2023/12/25
-        '%d.%m.%Y',      # 25.12.2023
-    ]
-    
-    for fmt in date_formats:
-        try:
-            dt = datetime.strptime(date_str, fmt)
-            return dt.strftime('%d/%m/%Y')
-        except ValueError:
-            continue
+    # Common case: three numeric fields, resolved without raising for each failed format
+    match = _DATE_RE.fullmatch(date_str)
+    if match:
+        first, sep, second, third = match.groups()
+        parts = (first, second, third)
+        for year_pos, month_pos, day_pos in _DATE_ORDERS[sep]:
+            if len(parts[year_pos]) != 4 or len(parts[month_pos]) > 2 or len(parts[day_pos]) > 2:
+                continue
+            year, month, day = int(parts[year_pos]), int(parts[month_pos]), int(parts[day_pos])
+            if year >= 1 and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]:
+                return f"{day:02}/{month:02}/{year}"
+    else:
+        # Anything else (e.g. space-padded days) still goes through strptime
+        for fmt in _DATE_FORMATS:
+            try:
+                dt = datetime.strptime(date_str, fmt)
+                return dt.strftime('%d/%m/%Y')
+            except ValueError:
+                continue
     
-    # If no format matched, try to extract numbers
-    try:
-        numbers = re.findall(r'\d+', date_str)
-        if len(numbers) >= 3:
-            if len(numbers[0]) == 4:
-                year, month, day = numbers[0], numbers[1], numbers[2]
-            elif len(numbers[-1]) == 4:
-                day, month, year = numbers[0], numbers[1], numbers[2]
-            else:
-                day, month, year = numbers[0], numbers[1], numbers[2]
-            
-            day = day.zfill(2)
-            month = month.zfill(2)
-            return f"{day}/{month}/{year}"
-    except (ValueError, IndexError, AttributeError):
-        pass
+    # If no format matched, use the first three numbers: year first if it has
+    # four digits, otherwise day first
+    match = _DATE_NUM_RE.search(date_str)
+    if match:
+        first, month, third = match.groups()
+        if len(first) == 4:
+            year, day = first, third
+        else:
+            day, year = first, third
+        return f"{day.zfill(2)}/{month.zfill(2)}/{year}"
     
     return date_str
 
 def get_emergency_contact_phone(csv_data):
     """Get emergency contact phone numbers (Home phone + Mobile phone + Work phone)"""
-    phones = []
-    
     # ONLY get emergency contact phone fields - no fallback to primary carer
     home_phone = csv_data.get('Home phone (Emergency contact)', '').strip()
     mobile_phone = csv_data.get('Mobile phone (Emergency contact)', '').strip()
@@ -2425,23 +2946,15 @@ def get_emergency_contact_phone(csv_data):
     def clean_phone(phone):
         if not phone:
             return ''
-        # Remove any special unicode characters that might render as black squares
-        cleaned = phone.replace('\uf0d7', '').replace('•', '').replace('●', '').replace('☐', '').replace('☑', '').replace('✓', '')
-        # Remove semicolons and any other problematic characters
-        cleaned = cleaned.replace(';', '').replace(',', '')  # Remove semicolons and commas from phone numbers
-        # Keep only printable characters and common phone characters
-        cleaned = ''.join(c for c in cleaned if c.isprintable() or c in [' ', '-', '(', ')', '+'])
+        # Remove unicode characters that might render as black squares, plus semicolons and commas
+        cleaned = phone.translate(_PHONE_STRIP)
+        # Keep only printable characters (common phone characters are all printable)
+        if not cleaned.isprintable():
+            cleaned = ''.join(filter(str.isprintable, cleaned))
         return cleaned.strip()
     
-    if home_phone:
-        phones.append(clean_phone(home_phone))
-    if mobile_phone:
-        phones.append(clean_phone(mobile_phone))
-    if work_phone:
-        phones.append(clean_phone(work_phone))
-    
     # Join with semicolons (but semicolons are removed from individual phone numbers)
-    return '; '.join(phones) if phones else ''
+    return '; '.join(map(clean_phone, filter(None, (home_phone, mobile_phone, work_phone))))
 
 def get_emergency_contact_relationship(csv_data):
     """Get emergency contact relationship to client"""
@@ -2453,20 +2966,24 @@ def get_emergency_contact_relationship(csv_data):
 
 def get_client_phone_numbers(csv_data):
     """Get client phone numbers (Home phone + Mobile phone + Work phone)"""
-    phones = []
-    
     home_phone = csv_data.get('Home phone (Contact Details of the Client)', '').strip()
     mobile_phone = csv_data.get('Mobile phone (Contact Details of the Client)', '').strip()
     work_phone = csv_data.get('Work phone (Contact Details of the Client)', '').strip()
     
-    if home_phone:
-        phones.append(home_phone)
-    if mobile_phone:
-        phones.append(mobile_phone)
-    if work_phone:
-        phones.append(work_phone)
-    
-    return '; '.join(phones) if phones else ''
+    return '; '.join(filter(None, (home_phone, mobile_phone, work_phone)))
+
+# Text width of a 2 inch emergency contacts column, less cell padding
+_ED_CONTACT_TEXT_WIDTH = 2*inch - 8
+
+def _ed_contact_cell(text):
+    """Emergency contact cell: plain string when it fits on one line, otherwise a Paragraph"""
+    if not text:
+        return ''
+    if ('<' in text or '&' in text or ' '.join(text.split()) != text
+            or pdfmetrics.stringWidth(text, 'Helvetica', 11) > _ED_CONTACT_TEXT_WIDTH):
+        return Paragraph(text, ED_TABLE_TEXT_STYLE)
+    # Table draws plain strings at the same baseline as a one-line Paragraph
+    return text
 
 def create_emergency_disaster_plan_from_data(csv_data, output_path, contact_name=None, active_users=None):
     """
@@ -2474,14 +2991,15 @@ def create_emergency_disaster_plan_from_data(csv_data, output_path, contact_name
     
     Args:
         csv_data: Dictionary containing form data
-        output_path: Path where the PDF should be saved
+        output_path: Path where the PDF should be saved, or a writable binary file object
+            (e.g. io.BytesIO) to stream the PDF without touching disk
         contact_name: Optional name to use for Team member lookup
         active_users: Optional pre-loaded active users (for performance)
     """
     # Get team value to determine which active users CSV to use
     team_value = csv_data.get('Neighbourhood Care representative team', '')
     # Clean up checkbox characters
-    team_value = team_value.replace('\uf0d7', '').replace('•', '').replace('●', '').replace('☐', '').replace('☑', '').replace('✓', '').strip()
+    team_value = _clean_checkboxes(team_value)
     
     # Load active users based on team if not provided
     if active_users is None:
@@ -2499,52 +3017,9 @@ def create_emergency_disaster_plan_from_data(csv_data, output_path, contact_name
     # Create PDF document
     doc = SimpleDocTemplate(output_path, pagesize=A4)
     story = []
-    styles = getSampleStyleSheet()
-    
-    # Create custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Title'],
-        fontSize=16,
-        textColor=BLUE_COLOR,
-        alignment=TA_LEFT,
-        spaceAfter=12,
-        leftIndent=0
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor=BLUE_COLOR,
-        alignment=TA_LEFT,
-        spaceAfter=8,
-        spaceBefore=12,
-        leftIndent=0
-    )
-    
-    normal_style = ParagraphStyle(
-        'CustomNormal',
-        parent=styles['Normal'],
-        fontSize=11,
-        alignment=TA_LEFT,
-        spaceAfter=6,
-        leading=14,
-        leftIndent=0
-    )
-    
-    table_text_style = ParagraphStyle(
-        'TableText',
-        parent=styles['Normal'],
-        fontSize=11,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leading=12,
-        leftIndent=0
-    )
     
     # Title
-    story.append(Paragraph("Emergency and Disaster Plan for Participants", title_style))
+    story.append(Paragraph("Emergency and Disaster Plan for Participants", ED_TITLE_STYLE))
     story.append(Spacer(1, 0.2*inch))
     
     # Introductory text
@@ -2552,44 +3027,26 @@ def create_emergency_disaster_plan_from_data(csv_data, output_path, contact_name
                   "yourself and the people who support you. Your Neighbourhood Care Support Team will assist you to fill "
                   "this form out. Please refer to other relevant plans before completing this plan; such as support plan, "
                   "risk assessment, individual COVID-19 response plan & mediation assistance plan (if applicable).")
-    story.append(Paragraph(intro_text, normal_style))
+    story.append(Paragraph(intro_text, ED_NORMAL_STYLE))
     story.append(Spacer(1, 0.2*inch))
     
     # Section 1 heading
-    story.append(Paragraph("1. Contact Information", heading_style))
+    story.append(Paragraph("1. Contact Information", ED_HEADING_STYLE))
     
     # General Information table
-    first_name = csv_data.get('First name (Details of the Client)', '').strip()
-    surname = csv_data.get('Surname (Details of the Client)', '').strip()
-    client_name = ' '.join([p for p in [first_name, surname] if p]).strip() or ''
+    first_name = csv_data.get(_KEY_FIRST_NAME, '').strip()
+    surname = csv_data.get(_KEY_SURNAME, '').strip()
+    client_name = _join_nonempty(first_name, surname)
     client_phone = get_client_phone_numbers(csv_data)
     
     general_info_data = [
-        [Paragraph("<b>General Information</b>", ParagraphStyle('TableHeading', parent=table_text_style, fontSize=11, textColor=colors.white, alignment=TA_CENTER))],
-        ['Your name', Paragraph(client_name, table_text_style)],
-        ['Your phone number', Paragraph(client_phone, table_text_style)]
+        [Paragraph("<b>General Information</b>", ED_WHITE_CENTERED_TABLE_TEXT_STYLE)],
+        ['Your name', Paragraph(client_name, ED_TABLE_TEXT_STYLE)],
+        ['Your phone number', Paragraph(client_phone, ED_TABLE_TEXT_STYLE)]
     ]
     
     general_info_table = Table(general_info_data, colWidths=[2.5*inch, 3.5*inch])
-    general_info_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), BLUE_COLOR),  # Heading row
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 1), (1, -1), 'LEFT'),
-        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 1), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('SPAN', (0, 0), (-1, 0))  # Span heading across all columns
-    ]))
+    general_info_table.setStyle(_ED_GENERAL_INFO_TABLE_STYLE)
     
     story.append(general_info_table)
     story.append(Spacer(1, 0.2*inch))
@@ -2599,31 +3056,27 @@ def create_emergency_disaster_plan_from_data(csv_data, output_path, contact_name
     emergency_first = csv_data.get('First name (Emergency contact)', '').strip()
     emergency_surname = csv_data.get('Surname (Emergency contact)', '').strip()
     
-    emergency_name = ' '.join([p for p in [emergency_first, emergency_surname] if p]).strip() or ''
+    emergency_name = _join_nonempty(emergency_first, emergency_surname)
     emergency_phone = get_emergency_contact_phone(csv_data)
     emergency_relationship = get_emergency_contact_relationship(csv_data)
     
     # Ensure phone is a clean plain string (not Paragraph) - strip all special characters
     emergency_phone_clean = str(emergency_phone) if emergency_phone else ''
-    # Remove any problematic unicode characters that render as black squares
-    emergency_phone_clean = emergency_phone_clean.replace('\uf0d7', '').replace('•', '').replace('●', '').replace('☐', '').replace('☑', '').replace('✓', '')
-    # Remove semicolons - they shouldn't be in phone numbers
-    emergency_phone_clean = emergency_phone_clean.replace(';', '')
-    # Keep only printable ASCII characters and common phone characters (no semicolons)
-    emergency_phone_clean = ''.join(c for c in emergency_phone_clean if (c.isprintable() and ord(c) < 128) or c in [' ', '-', '(', ')', '+', ','])
-    emergency_phone_clean = emergency_phone_clean.strip()
+    # Keep only printable ASCII characters (no semicolons); this also drops the unicode
+    # characters that render as black squares
+    emergency_phone_clean = _PHONE_DROP_RE.sub('', emergency_phone_clean).strip()
     
     # Ensure relationship is displayed correctly
     emergency_relationship_clean = emergency_relationship if emergency_relationship else ''
     
     emergency_contacts_data = [
-        [Paragraph("<b>Key Emergency Contacts</b>", ParagraphStyle('TableHeading', parent=table_text_style, fontSize=11, textColor=colors.white, alignment=TA_CENTER))],
-        [Paragraph("<b>Name</b>", ParagraphStyle('TableHeader', parent=table_text_style, fontSize=11, textColor=colors.white, alignment=TA_CENTER)),
-         Paragraph("<b>Phone</b>", ParagraphStyle('TableHeader', parent=table_text_style, fontSize=11, textColor=colors.white, alignment=TA_CENTER)),
-         Paragraph("<b>Relationship</b>", ParagraphStyle('TableHeader', parent=table_text_style, fontSize=11, textColor=colors.white, alignment=TA_CENTER))],
-        [Paragraph(emergency_name, table_text_style) if emergency_name else '', 
+        [Paragraph("<b>Key Emergency Contacts</b>", ED_WHITE_CENTERED_TABLE_TEXT_STYLE)],
+        [Paragraph("<b>Name</b>", ED_WHITE_CENTERED_TABLE_TEXT_STYLE),
+         Paragraph("<b>Phone</b>", ED_WHITE_CENTERED_TABLE_TEXT_STYLE),
+         Paragraph("<b>Relationship</b>", ED_WHITE_CENTERED_TABLE_TEXT_STYLE)],
+        [_ed_contact_cell(emergency_name),
          emergency_phone_clean,  # Plain string, not Paragraph - already cleaned
-         Paragraph(emergency_relationship_clean, table_text_style) if emergency_relationship_clean else '']
+         _ed_contact_cell(emergency_relationship_clean)]
     ]
     
     # Add 5 empty rows
@@ -2631,165 +3084,41 @@ def create_emergency_disaster_plan_from_data(csv_data, output_path, contact_name
         emergency_contacts_data.append(['', '', ''])
     
     emergency_contacts_table = Table(emergency_contacts_data, colWidths=[2*inch, 2*inch, 2*inch])
-    emergency_contacts_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), BLUE_COLOR),  # Heading row
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('BACKGROUND', (0, 1), (-1, 1), BLUE_COLOR),  # Header row
-        ('TEXTCOLOR', (0, 1), (-1, 1), colors.white),
-        ('BACKGROUND', (0, 2), (-1, -1), colors.white),  # All data rows (including empty ones)
-        ('TEXTCOLOR', (0, 2), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('ALIGN', (0, 1), (-1, 1), 'CENTER'),
-        ('ALIGN', (0, 2), (-1, -1), 'LEFT'),  # All data rows left-aligned
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('SPAN', (0, 0), (-1, 0))  # Span heading across all columns
-    ]))
+    emergency_contacts_table.setStyle(_ED_EMERGENCY_CONTACTS_TABLE_STYLE)
     
     story.append(emergency_contacts_table)
     story.append(Spacer(1, 0.2*inch))
     
     # My Important Contacts table
     important_contacts_data = [
-        [Paragraph("<b>My Important Contacts</b>", ParagraphStyle('TableHeading', parent=table_text_style, fontSize=11, textColor=colors.white, alignment=TA_CENTER))],
-        ['Advocate', ''],
-        ['Power of Attorney/Guardian', ''],
-        ['Solicitor', ''],
-        ['Insurer (home)', ''],
-        ['Insurer (vehicle)', ''],
-        ['Childcare/School Contact', ''],
-        ['Workplace/Volunteer Contact', ''],
-        ['Doctor', ''],
-        ['Specialist Practitioner', ''],
-        ['Private Health Cover', '']
+        [Paragraph("<b>My Important Contacts</b>", ED_WHITE_CENTERED_TABLE_TEXT_STYLE)],
+        *_ED_IMPORTANT_CONTACTS_ROWS
     ]
-    
-    important_contacts_table = Table(important_contacts_data, colWidths=[2.5*inch, 3.5*inch])
-    important_contacts_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), BLUE_COLOR),  # Heading row
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (0, 0), 'CENTER'),
-        ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 1), (1, -1), 'LEFT'),
-        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 1), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('SPAN', (0, 0), (-1, 0))  # Span heading across all columns
-    ]))
-    
-    story.append(important_contacts_table)
+    story.append(Table(important_contacts_data, colWidths=[2.5*inch, 3.5*inch], style=_ED_IMPORTANT_CONTACTS_TABLE_STYLE))
     story.append(Spacer(1, 0.2*inch))
     
     # What are the main risks in your community table
-    risks = [
-        'Heatwave', 'Storm', 'Cyclone', 'Bushfire', 'Flood', 'Earthquake',
-        'Landslide', 'Tsunami', 'Assault', 'Power outage', 'Gas outage',
-        'Health emergency', 'House fire', 'Burglary/break-in'
-    ]
-    
-    risks_data = []
-    for risk in risks:
-        # Use plain ASCII characters for checkbox - avoid any unicode that might render as black squares
-        risks_data.append([risk, '[ ]'])  # Simple ASCII brackets - no unicode characters
-    
-    risks_table = Table(risks_data, colWidths=[2.5*inch, 3.5*inch])
-    risks_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.white),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP')
-    ]))
-    
-    story.append(Paragraph("2. Identify Risks", heading_style))
-    story.append(Paragraph("<i>What are the main risks in your community?</i>", normal_style))
-    story.append(risks_table)
+    story.append(Paragraph("2. Identify Risks", ED_HEADING_STYLE))
+    story.append(Paragraph("<i>What are the main risks in your community?</i>", ED_NORMAL_STYLE))
+    story.append(Table(_ED_RISKS_DATA, colWidths=[2.5*inch, 3.5*inch], style=_ED_RISKS_TABLE_STYLE))
     story.append(Spacer(1, 0.2*inch))
     
     # How would the emergency affect you? table
-    emergency_types = [
-        'Heatwave', 'Storm', 'Cyclone', 'Bushfire', 'Flood', 'Earthquake',
-        'Landslide', 'Tsunami', 'Assault', 'Power outage', 'Gas outage',
-        'Health emergency', 'House fire', 'Burglary/break-in'
-    ]
-    
+    story.append(Paragraph("<i>How would the emergency affect you?</i>", ED_ITALIC_HEADING_STYLE))
     emergency_affect_data = [
-        [Paragraph("<b>Emergency Type</b>", ParagraphStyle('TableHeader', parent=table_text_style, fontSize=11, textColor=colors.white, alignment=TA_CENTER)),
-         Paragraph("<b>How you're affected</b>", ParagraphStyle('TableHeader', parent=table_text_style, fontSize=11, textColor=colors.white, alignment=TA_CENTER))]
+        [Paragraph("<b>Emergency Type</b>", ED_WHITE_CENTERED_TABLE_TEXT_STYLE),
+         Paragraph("<b>How you're affected</b>", ED_WHITE_CENTERED_TABLE_TEXT_STYLE)],
+        *[[Paragraph(label, ED_TABLE_TEXT_STYLE), ''] for label in _ED_EMERGENCY_TYPE_LABELS]
     ]
-    
-    # Add rows for each emergency type - make them bold
-    for emergency_type in emergency_types:
-        emergency_affect_data.append([Paragraph(f"<b>{emergency_type}</b>", table_text_style), ''])
-    
-    # Define gray color for backgrounds
-    GRAY_COLOR = colors.HexColor('#d9d9d9')
-    
-    emergency_affect_table = Table(emergency_affect_data, colWidths=[2.5*inch, 3.5*inch])
-    emergency_affect_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), BLUE_COLOR),  # Header row
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('BACKGROUND', (0, 1), (0, -1), GRAY_COLOR),  # Left column (except header) - gray background
-        ('BACKGROUND', (1, 1), (1, -1), colors.white),  # Right column - white
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 1), (1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),  # Header row bold
-        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),  # Left column bold
-        ('FONTNAME', (1, 1), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP')
-    ]))
-    
-    story.append(Paragraph("<i>How would the emergency affect you?</i>", ParagraphStyle('ItalicHeading', parent=normal_style, fontSize=11, textColor=colors.black)))
-    story.append(emergency_affect_table)
+    story.append(Table(emergency_affect_data, colWidths=[2.5*inch, 3.5*inch], style=_ED_EMERGENCY_AFFECT_TABLE_STYLE))
     story.append(Spacer(1, 0.2*inch))
     
     # Section 3 heading
-    story.append(Paragraph("3. My Emergency & Disaster Plan", heading_style))
-    story.append(Paragraph("<i>Complete all applicable sections & if not applicable, mark as \"N/A\".</i>", normal_style))
+    story.append(Paragraph("3. My Emergency & Disaster Plan", ED_HEADING_STYLE))
+    story.append(Paragraph("<i>Complete all applicable sections & if not applicable, mark as \"N/A\".</i>", ED_NORMAL_STYLE))
     
     # Complete all applicable sections table
     # Define content for each section - bullet points go in LEFT column, field text goes in RIGHT column
-    # Create a style for bold section names
-    bold_text_style = ParagraphStyle(
-        'BoldText',
-        parent=table_text_style,
-        fontSize=11,
-        fontName='Helvetica-Bold',
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leading=12,
-        leftIndent=0
-    )
-    
     communication_left = (
         "<b>Communication</b><br/><br/>"
         "[ ] I have my phone, computer, or tablet to be able to stay in touch with people or call people in an emergency.<br/><br/>"
@@ -2853,90 +3182,36 @@ def create_emergency_disaster_plan_from_data(csv_data, output_path, contact_name
     )
     social_right = "Write any notes here:\n\n\n"
     
-    sections_data = [
-        [Paragraph('<b>My Emergency & Disaster Plan</b>', ParagraphStyle('TableTextBlue', parent=table_text_style, fontSize=11, textColor=colors.white)), ''],
-        [Paragraph(communication_left, table_text_style), Paragraph(communication_right, table_text_style)],
-        [Paragraph(health_left, table_text_style), Paragraph(health_right, table_text_style)],
-        [Paragraph(at_left, table_text_style), Paragraph(at_right, table_text_style)],
-        [Paragraph(support_left, table_text_style), Paragraph(support_right, table_text_style)],
-        [Paragraph(pets_left, table_text_style), Paragraph(pets_right, table_text_style)],
-        [Paragraph(transport_left, table_text_style), Paragraph(transport_right, table_text_style)],
-        [Paragraph(living_left, table_text_style), Paragraph(living_right, table_text_style)],
-        [Paragraph(social_left, table_text_style), Paragraph(social_right, table_text_style)],
-        [Paragraph("<b>Other</b>", table_text_style), Paragraph("Write any notes here:\n\n\n\n", table_text_style)]
-    ]
-    
-    sections_table = Table(sections_data, colWidths=[2.5*inch, 3.5*inch])
-    # Define gray color for backgrounds
-    GRAY_COLOR = colors.HexColor('#d9d9d9')
-    
-    sections_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, 0), BLUE_COLOR),  # First row first column - blue
-        ('TEXTCOLOR', (0, 0), (0, 0), colors.white),
-        ('BACKGROUND', (1, 0), (1, 0), colors.white),  # First row second column
-        ('BACKGROUND', (0, 1), (0, -1), GRAY_COLOR),  # Left column (except first row) - gray
-        ('BACKGROUND', (1, 1), (1, -1), colors.white),  # Right column - white
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),  # All left column bold
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP')
-    ]))
-    
+    sections_data = [
+        [Paragraph('<b>My Emergency & Disaster Plan</b>', ED_WHITE_TABLE_TEXT_STYLE), ''],
+        [Paragraph(communication_left, ED_TABLE_TEXT_STYLE), Paragraph(communication_right, ED_TABLE_TEXT_STYLE)],
+        [Paragraph(health_left, ED_TABLE_TEXT_STYLE), Paragraph(health_right, ED_TABLE_TEXT_STYLE)],
+        [Paragraph(at_left, ED_TABLE_TEXT_STYLE), Paragraph(at_right, ED_TABLE_TEXT_STYLE)],
+        [Paragraph(support_left, ED_TABLE_TEXT_STYLE), Paragraph(support_right, ED_TABLE_TEXT_STYLE)],
+        [Paragraph(pets_left, ED_TABLE_TEXT_STYLE), Paragraph(pets_right, ED_TABLE_TEXT_STYLE)],
+        [Paragraph(transport_left, ED_TABLE_TEXT_STYLE), Paragraph(transport_right, ED_TABLE_TEXT_STYLE)],
+        [Paragraph(living_left, ED_TABLE_TEXT_STYLE), Paragraph(living_right, ED_TABLE_TEXT_STYLE)],
+        [Paragraph(social_left, ED_TABLE_TEXT_STYLE), Paragraph(social_right, ED_TABLE_TEXT_STYLE)],
+        [Paragraph("<b>Other</b>", ED_TABLE_TEXT_STYLE), Paragraph("Write any notes here:\n\n\n\n", ED_TABLE_TEXT_STYLE)]
+    ]
+    
+    sections_table = Table(sections_data, colWidths=[2.5*inch, 3.5*inch])
+    sections_table.setStyle(_ED_SECTIONS_TABLE_STYLE)
+    
     story.append(sections_table)
     story.append(Spacer(1, 0.2*inch))
     
     # Final table with signatures (4 columns, 3 rows)
     # Date field left empty as requested
-    from datetime import datetime
-    mod_date = ''  # Empty date as requested
-    
     final_data = [
-        [Paragraph("<b>Client's Name</b>", ParagraphStyle('TableHeader', parent=table_text_style, fontSize=11, textColor=colors.white)), Paragraph(client_name, table_text_style), Paragraph("<b>Team member's name</b>", ParagraphStyle('TableHeader', parent=table_text_style, fontSize=11, textColor=colors.white)), Paragraph(team_member_name, table_text_style)],
-        [Paragraph("<b>Signature</b>", ParagraphStyle('TableHeader', parent=table_text_style, fontSize=11, textColor=colors.white)), '', Paragraph("<b>Signature</b>", ParagraphStyle('TableHeader', parent=table_text_style, fontSize=11, textColor=colors.white)), ''],
-        [Paragraph("<b>Date</b>", ParagraphStyle('TableHeader', parent=table_text_style, fontSize=11, textColor=colors.white)), mod_date, Paragraph("<b>Date</b>", ParagraphStyle('TableHeader', parent=table_text_style, fontSize=11, textColor=colors.white)), mod_date]
+        (Paragraph(_ED_SIGN_OFF_CLIENT_LABEL, ED_WHITE_TABLE_TEXT_STYLE), Paragraph(client_name, ED_TABLE_TEXT_STYLE),
+         Paragraph(_ED_SIGN_OFF_TEAM_MEMBER_LABEL, ED_WHITE_TABLE_TEXT_STYLE), Paragraph(team_member_name, ED_TABLE_TEXT_STYLE)),
+        *[(Paragraph(label, ED_WHITE_TABLE_TEXT_STYLE), '', Paragraph(label, ED_WHITE_TABLE_TEXT_STYLE), '')
+          for label in _ED_SIGN_OFF_ROW_LABELS]
     ]
     
     final_table = Table(final_data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-    final_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, 0), BLUE_COLOR),  # Client's Name
-        ('BACKGROUND', (2, 0), (2, 0), BLUE_COLOR),  # Team member's name
-        ('BACKGROUND', (0, 1), (0, 1), BLUE_COLOR),  # Signature (left)
-        ('BACKGROUND', (2, 1), (2, 1), BLUE_COLOR),  # Signature (right)
-        ('BACKGROUND', (0, 2), (0, 2), BLUE_COLOR),  # Date (left)
-        ('BACKGROUND', (2, 2), (2, 2), BLUE_COLOR),  # Date (right)
-        ('TEXTCOLOR', (0, 0), (0, 0), colors.white),
-        ('TEXTCOLOR', (2, 0), (2, 0), colors.white),
-        ('TEXTCOLOR', (0, 1), (0, 1), colors.white),
-        ('TEXTCOLOR', (2, 1), (2, 1), colors.white),
-        ('TEXTCOLOR', (0, 2), (0, 2), colors.white),
-        ('TEXTCOLOR', (2, 2), (2, 2), colors.white),
-        ('BACKGROUND', (1, 0), (1, -1), colors.white),  # Data columns - white
-        ('BACKGROUND', (3, 0), (3, -1), colors.white),
-        ('TEXTCOLOR', (1, 0), (1, -1), colors.black),
-        ('TEXTCOLOR', (3, 0), (3, -1), colors.black),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('ALIGN', (2, 0), (2, -1), 'LEFT'),
-        ('ALIGN', (3, 0), (3, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTNAME', (3, 0), (3, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP')
-    ]))
+    final_table.setStyle(_ED_SIGN_OFF_TABLE_STYLE)
     
     story.append(final_table)
     
@@ -2944,6 +3219,78 @@ def create_emergency_disaster_plan_from_data(csv_data, output_path, contact_name
     doc.build(story, onFirstPage=_add_first_page_header, onLaterPages=_add_header_footer)
     print("Emergency & Disaster Plan PDF created successfully!")
 
+# Active users by team, handed to each emergency plan batch worker once by
+# _init_emergency_plan_worker
+_BATCH_ACTIVE_USERS = None
+
+def _init_emergency_plan_worker(active_users_by_team):
+    """Keep the batch's active users in the worker process"""
+    global _BATCH_ACTIVE_USERS
+    _BATCH_ACTIVE_USERS = active_users_by_team
+
+def _render_emergency_plan_job(csv_data, output_path, team_value):
+    """Render a single emergency & disaster plan inside a batch worker"""
+    buffer = io.BytesIO()
+    create_emergency_disaster_plan_from_data(csv_data, buffer, active_users=_BATCH_ACTIVE_USERS[team_value])
+    _write_pdf_bytes(output_path, buffer)
+    return output_path
+
+def render_emergency_plans_batch(rows, out_dir, workers=None):
+    """
+    Render one emergency & disaster plan per participant across worker processes.
+    
+    Args:
+        rows: Iterable of form data dictionaries (as returned by parse_pdf_to_data)
+        out_dir: Directory the PDFs are written to (created if missing)
+        workers: Number of worker processes (defaults to the CPU count)
+    
+    Returns:
+        list: Output PDF paths, in the same order as rows
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    os.makedirs(out_dir, exist_ok=True)
+    # Active users are loaded here, once per team, and sent to each worker once at
+    # start-up rather than pickled with every job
+    active_users_by_team = {}
+    jobs = []
+    for index, csv_data in enumerate(rows, start=1):
+        team_value = _clean_checkboxes(csv_data.get('Neighbourhood Care representative team', ''))
+        if team_value not in active_users_by_team:
+            active_users_by_team[team_value] = load_active_users(team_value)
+        jobs.append((csv_data, _batch_output_path(out_dir, "Emergency and Disaster Plan", index, csv_data),
+                     team_value))
+    
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=_init_emergency_plan_worker,
+                             initargs=(active_users_by_team,)) as executor:
+        futures = [executor.submit(_render_emergency_plan_job, *job) for job in jobs]
+        return [future.result() for future in futures]
+
+# Time descriptors found in support item names, most specific first
+_TIME_PATTERNS = (
+    'Weekday Daytime',
+    'Weekday Night',
+    'Weekday Evening',
+    'Night-Time Sleepover',
+    'Saturday',
+    'Sunday',
+    'Public Holiday',
+    'Weekend',
+    'After Hours',
+    'Daytime',
+    'Evening',
+    'Night'
+)
+
+# Every time pattern in an item name, including overlapping ones; when several
+# match, the one earliest in _TIME_PATTERNS wins
+_TIME_RE = re.compile('(?=(%s))' % '|'.join(map(re.escape, _TIME_PATTERNS)))
+_TIME_PRIORITY = {pattern: index for index, pattern in enumerate(_TIME_PATTERNS)}
+
+# Words that mark the last ' - ' part of an item name as a time descriptor
+_TIME_WORD_RE = re.compile('Day|Night|Evening|Weekend|Holiday|Saturday|Sunday')
+
+@lru_cache(maxsize=2048)
 def extract_time_from_item_name(item_name):
     """
     Extract time information from support item name.
@@ -2956,37 +3303,24 @@ def extract_time_from_item_name(item_name):
     if not item_name:
         return ''
     
-    # Common time patterns
-    time_patterns = [
-        'Weekday Daytime',
-        'Weekday Night',
-        'Weekday Evening',
-        'Night-Time Sleepover',
-        'Saturday',
-        'Sunday',
-        'Public Holiday',
-        'Weekend',
-        'After Hours',
-        'Daytime',
-        'Evening',
-        'Night'
-    ]
-    
     # Check if any time pattern is in the name
-    for pattern in time_patterns:
-        if pattern in item_name:
-            return pattern
+    patterns = _TIME_RE.findall(item_name)
+    if patterns:
+        return min(patterns, key=_TIME_PRIORITY.__getitem__)
     
     # If no pattern found, try to extract the last part after the last dash
     parts = item_name.split(' - ')
     if len(parts) > 1:
         last_part = parts[-1].strip()
         # If the last part looks like a time descriptor, return it
-        if any(word in last_part for word in ['Day', 'Night', 'Evening', 'Weekend', 'Holiday', 'Saturday', 'Sunday']):
+        if _TIME_WORD_RE.search(last_part):
             return last_part
     
     return ''
 
+# Service estimate CSV columns
+SERVICE_ESTIMATE_FIELDS = ('Name', 'Category', 'Number', 'Unit', 'Price', 'Variable', 'Time')
+
 def create_service_estimate_csv(csv_data, output_path, contact_name=None, ndis_items=None):
     """
     Create a Service Estimate CSV file from provided data dictionary.
@@ -3001,211 +3335,325 @@ def create_service_estimate_csv(csv_data, output_path, contact_name=None, ndis_i
     if ndis_items is None:
         ndis_items = load_ndis_support_items()
     
-    # Also load the full NDIS CSV to get the actual item names (which contain time info)
-    ndis_item_names = {}
+    # Also index the actual item names from the full NDIS CSV (which contain time info);
+    # built once and shared between calls
+    ndis_name_index = None
     try:
-        with open('outputs/other/NDIS Support Items - NDIS Support Items.csv', 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                item_name = row['Support Item Name'].strip()
-                # Store mapping from normalized name to full name
-                normalized_name = item_name.lower().strip()
-                ndis_item_names[normalized_name] = item_name
+        ndis_name_index = _ndis_name_index()
     except Exception as e:
         print(f"Error loading NDIS item names: {e}")
     
     # Get team value to determine which state's price to use
     team_value = csv_data.get('Neighbourhood Care representative team', '')
     # Clean up checkbox characters
-    team_value = team_value.replace('\uf0d7', '').replace('•', '').replace('●', '').replace('☐', '').replace('☑', '').replace('✓', '').strip()
+    team_value = _clean_checkboxes(team_value)
     
     # Determine which state's price to use
     price_state = get_price_state(team_value)
     price_key = 'wa_price' if price_state == 'WA' else 'qld_price'
     
-    # Extract support items 1-8 from Support Items Required section
+    # Extract support items 1-8 from Support Items Required section, as rows in
+    # SERVICE_ESTIMATE_FIELDS order
     support_items_data = []
     for i in range(1, 9):  # Support items 1-8
-        key = f'Support item ({i}) (Support Items Required)'
+        key = _SUPPORT_ITEM_KEYS[i]
         item_name = csv_data.get(key, '').strip()
         
         if item_name:
-            # Look up the item in NDIS items
-            item_details = lookup_support_item(ndis_items, item_name)
+            # Look up the item in NDIS items (read-only here, so the placeholder is shared)
+            item_key = find_support_item_key(ndis_items, item_name)
+            item_details = ndis_items[item_key] if item_key is not None else _PLACEHOLDER_DETAILS
             
-            # Find the matching NDIS item name (which has time info)
+            # Find the matching NDIS item name (which has time info); an exact
+            # catalogue name is its own match
             matched_ndis_name = item_name
-            item_found = False
-            if item_name in ndis_items:
-                matched_ndis_name = item_name
-                item_found = True
-            else:
-                # Try to find a match in ndis_item_names
-                item_name_lower = item_name.lower().strip()
-                for ndis_name_lower, ndis_name_full in ndis_item_names.items():
-                    if item_name_lower in ndis_name_lower or ndis_name_lower in item_name_lower:
-                        matched_ndis_name = ndis_name_full
-                        item_found = True
-                        break
+            item_found = item_key == item_name
+            if not item_found:
+                # Try to find a match in the NDIS item names
+                ndis_name_full = None
+                if ndis_name_index:
+                    ndis_name_full = _match_ndis_item_name(ndis_name_index, item_name.lower().strip())
+                if ndis_name_full is not None:
+                    matched_ndis_name = ndis_name_full
+                    item_found = True
             
-            # Extract time from the matched NDIS item name (which has the time info)
+            # Extract time from the matched NDIS item name (which has the time info);
+            # an item that wasn't found falls back to its original name
             time = extract_time_from_item_name(matched_ndis_name)
             
-            # Get the price based on state
-            price = item_details.get(price_key, '')
+            # Item not found - still add it but with placeholder values
+            if not item_found:
+                item_details = _NOT_FOUND_DETAILS
             
-            if item_found:
-                support_items_data.append({
-                    'Name': item_name,
-                    'Category': 'Core',
-                    'Number': item_details.get('number', ''),
-                    'Unit': item_details.get('unit', ''),
-                    'Price': price,
-                    'Variable': 'TRUE',
-                    'Time': time
-                })
-            else:
-                # Item not found - still add it but with placeholder values
-                # Try to extract time from the original item name as fallback
-                time = extract_time_from_item_name(item_name)
-                support_items_data.append({
-                    'Name': item_name,
-                    'Category': 'Core',
-                    'Number': '[Not Found]',
-                    'Unit': '[Not Found]',
-                    'Price': '[Not Found]',
-                    'Variable': 'TRUE',
-                    'Time': time
-                })
-    
-    # Column order: Name, Category, Number, Unit, Price, Variable, Time
-    fieldnames = ['Name', 'Category', 'Number', 'Unit', 'Price', 'Variable', 'Time']
-    
-    # Write CSV file
+            # The price column is the state's price (price_key)
+            support_items_data.append((item_name, 'Core', item_details.get('number', ''), item_details.get('unit', ''),
+                                       item_details.get(price_key, ''), 'TRUE', time))
+    
+    # Format the CSV in memory and write the file in one go (just the headers if
+    # no items were found)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(SERVICE_ESTIMATE_FIELDS)
+    writer.writerows(support_items_data)
+    with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+        csvfile.write(buffer.getvalue())
+    
     if support_items_data:
-        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(support_items_data)
         print(f"Service Estimate CSV created successfully with {len(support_items_data)} items!")
     else:
-        # Create empty CSV with headers if no items found
-        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
         print("Service Estimate CSV created successfully (empty - no support items found)!")
 
-def create_risk_assessment_from_data(csv_data, output_path, contact_name=None, active_users=None):
+@lru_cache(maxsize=1)
+def _risk_assessment_styles():
     """
-    Create a Risk Assessment PDF from provided data dictionary.
+    Build the risk assessment paragraph styles once, on first use.
     
-    Args:
-        csv_data: Dictionary containing form data
-        output_path: Path where the PDF should be saved
-        contact_name: Optional name for "Person Completing this assessment"
-        active_users: Optional pre-loaded active users (for performance, not currently used but kept for consistency)
+    They need the Calibri fonts, so they can't be module constants without
+    registering fonts at import time.
     """
-    from datetime import datetime
-    
-    # Create PDF document
-    doc = SimpleDocTemplate(output_path, pagesize=A4)
-    story = []
-    styles = getSampleStyleSheet()
+    regular_font = get_calibri_font()
+    bold_font = get_calibri_bold_font()
     
-    # Create custom styles
     title_style = ParagraphStyle(
         'CustomTitle',
-        parent=styles['Title'],
+        parent=_SAMPLE_STYLES['Title'],
         fontSize=16,
         textColor=BLUE_COLOR,
         alignment=TA_LEFT,
         spaceAfter=0,
         leftIndent=0,
-        fontName=get_calibri_bold_font()
+        fontName=bold_font
     )
     
     heading_style = ParagraphStyle(
         'CustomHeading',
-        parent=styles['Heading2'],
+        parent=_SAMPLE_STYLES['Heading2'],
         fontSize=11,
         textColor=BLUE_COLOR,
         alignment=TA_LEFT,
         spaceAfter=8,
         spaceBefore=12,
         leftIndent=0,
-        fontName=get_calibri_font()
+        fontName=regular_font
     )
     
     normal_style = ParagraphStyle(
         'CustomNormal',
-        parent=styles['Normal'],
+        parent=_SAMPLE_STYLES['Normal'],
         fontSize=11,
         alignment=TA_LEFT,
         spaceAfter=6,
         leading=14,
         leftIndent=0,
-        fontName=get_calibri_font()
+        fontName=regular_font
     )
     
     table_text_style = ParagraphStyle(
         'TableText',
-        parent=styles['Normal'],
+        parent=_SAMPLE_STYLES['Normal'],
         fontSize=11,
         alignment=TA_LEFT,
         spaceAfter=0,
         leading=12,
         leftIndent=0,
-        fontName=get_calibri_font()
+        fontName=regular_font
     )
     
-    # Title
-    story.append(Paragraph("PRO025 - Client Risk Assessment", title_style))
-    
-    # First table: Participant, Person Completing, Role, Date
-    first_name = csv_data.get('First name (Details of the Client)', '').strip()
-    surname = csv_data.get('Surname (Details of the Client)', '').strip()
-    participant_name = ' '.join([p for p in [first_name, surname] if p]).strip() or ''
-    person_completing = contact_name or ''
-    role = 'Support Worker'
-    assessment_date = ''  # Empty date as requested
-    
-    # Create style for white text labels (bold)
+    # White text labels (bold)
     white_label_style = ParagraphStyle(
         'WhiteLabel',
         parent=table_text_style,
         textColor=colors.white,
-        fontName=get_calibri_bold_font()
+        fontName=bold_font
     )
     
-    # Create style for table headers (bold)
+    # Table headers (bold)
     table_header_style = ParagraphStyle(
         'TableHeader',
         parent=table_text_style,
         fontSize=11,
         textColor=colors.white,
         alignment=TA_CENTER,
-        fontName=get_calibri_bold_font()
+        fontName=bold_font
     )
     
-    first_table_data = [
-        [Paragraph('Participant', white_label_style), Paragraph(participant_name + '\n\n', table_text_style)],
-        [Paragraph('Person Completing this assessment', white_label_style), Paragraph(person_completing + '\n\n', table_text_style)],
-        [Paragraph('Role', white_label_style), Paragraph(role + '\n\n', table_text_style)],
-        [Paragraph('Date of Assessment', white_label_style), Paragraph(assessment_date + '\n\n', table_text_style)]
-    ]
-    
-    # Define custom colors for Risk Assessment
-    FIRST_TABLE_HEADER_COLOR = colors.HexColor('#027bc4')
-    FIRST_TABLE_VALUE_COLOR = colors.HexColor('#d3dfee')
-    ENV_HAZARDS_COLOR = colors.HexColor('#00b050')
-    MEDICATION_COLOR = colors.HexColor('#943734')
-    LIVING_ALONE_COLOR = colors.HexColor('#5f497a')
-    LIVING_ALONE_FIELD_COLOR = colors.HexColor('#d3dfee')
+    # Bold text for the Violence/Abuse section
+    bold_text_style = ParagraphStyle(
+        'BoldText',
+        parent=table_text_style,
+        fontName=bold_font
+    )
     
-    first_table = Table(first_table_data, colWidths=[2.8*inch, 3.2*inch])
-    first_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), FIRST_TABLE_HEADER_COLOR),  # Left column (labels)
-        ('BACKGROUND', (1, 0), (1, -1), FIRST_TABLE_VALUE_COLOR),  # Right column (values)
+    return (title_style, heading_style, normal_style, table_text_style,
+            white_label_style, table_header_style, bold_text_style)
+
+# Risk assessment checklist rows, each followed by empty cells to fill in by hand
+_RA_COMMON_HAZARDS = (
+    'Lifting, supporting and transferring',
+    'Personal care (e.g. manual handling, slip trips and falls, biological hazards, humidity etc during showering, sponging and toileting)',
+    'Using equipment or assistive technology',
+    'Client behaviours of concern that may harm themselves (is there a Behaviour Support Plan (BSP) in place?)',
+    'Client behaviours of concern that may harm others (BSP)?',
+    'Other people\'s behaviours of concern that may harm client of worker',
+    'Are there any restrictive practices in place? (BSP?)',
+    'Client\'s ability to communicate needs and wants clearly, including in emergencies. Is English their second language?',
+    'Limited informal supports',
+    'Limited formal supports or access to formal supports',
+    'Reduced choice and control',
+    'Reduced opportunities for independence',
+    'Social isolation',
+    'Dignity',
+    'Self esteem',
+    'Health conditions and wellbeing (e.g. epilepsy, heart condition etc)',
+    'Other'
+)
+
+_RA_ENVIRONMENTAL_HAZARDS = (
+    'Slips, trips and falls risks',
+    'Air quality (including cigarette smoke)',
+    'Pets or other animals that could be dangerous to client, worker or others',
+    'High crime area',
+    'Hazardous materials/liquids',
+    'Hot water',
+    'Sharp objects',
+    'Temperature',
+    'Are there smoke alarms?',
+    'Are there fire extinguishers?',
+    'Are there RCDs (safety fuses)?',
+    'Stairs',
+    'Lighting',
+    'Is there mobile phone reception and/or working landline?',
+    'Are there any other occupants or visitors likely to be present during home visits?',
+    'Other (e.g. weapons, firearms)',
+    'Other'
+)
+
+_RA_LIVING_ALONE_FIELDS = (
+    'Do you feel safe at home, work, in the community?',
+    'Are there any places you don\'t feel safe?',
+    'Do you have any plans in place for emergency situations (e.g. fire, illness, injury, severe weather)?',
+    'Do you have safety equipment at home (e.g. fire extinguisher, fire blanket)?',
+    'Do you feel safe at home, work, in the community?',
+    'Do you have any plans in place for emergency situations (e.g. fire, illness, injury, severe weather)?',
+    'Have you ever been injured, fallen etc?',
+    'Informal supports: family and friends - who visits and how often?',
+    'Paid supports - which services are engaged, number of services and support workers, number of visitors per week estimate',
+    'What is your ability to contact people if you need their help (e.g. family, friends, staff by phone or by other method)?'
+)
+
+_RA_VIOLENCE_ABUSE_FIELDS = (
+    'Have you ever been hurt by anyone?',
+    'Has anyone ever taken advantage of you?',
+    'Does anyone yell or curse at you?',
+    'If yes to any of the above questions: if so, who did you tell?',
+    'What was done to address your concerns?'
+)
+
+_RA_EMPTY_CELLS = ('\n\n',) * 4
+# Blank medication row, repeated for entries filled in by hand
+_RA_MEDICATION_EMPTY_ROW = ('\n\n',) * 5
+
+# Risk assessment table colours
+_RA_HEADER_COLOR = colors.HexColor('#027bc4')
+_RA_VALUE_COLOR = colors.HexColor('#d3dfee')
+_RA_ENV_HAZARDS_COLOR = colors.HexColor('#00b050')
+_RA_MEDICATION_COLOR = colors.HexColor('#943734')
+_RA_LIVING_ALONE_COLOR = colors.HexColor('#5f497a')
+_RA_LIVING_ALONE_FIELD_COLOR = colors.HexColor('#d3dfee')
+
+# Rows spanning the whole living alone table: Violence/Abuse comes after the title,
+# header and _RA_LIVING_ALONE_FIELDS rows, and the note after its one question
+_RA_VIOLENCE_ROW = 2 + len(_RA_LIVING_ALONE_FIELDS)
+_RA_NOTE_ROW = _RA_VIOLENCE_ROW + 2
+
+# Risk assessment table styles - built once and shared by every document
+_RA_COMMON_HAZARDS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _RA_HEADER_COLOR),  # Header row - #027bc4
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 1), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), CALIBRI_BOLD_FONT),
+    ('FONTNAME', (0, 1), (-1, -1), CALIBRI_FONT),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP')
+])
+
+_RA_ENV_HAZARDS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _RA_ENV_HAZARDS_COLOR),  # Header row
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 1), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), CALIBRI_BOLD_FONT),
+    ('FONTNAME', (0, 1), (-1, -1), CALIBRI_FONT),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP')
+])
+
+_RA_MEDICATION_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _RA_MEDICATION_COLOR),  # Header row
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), CALIBRI_BOLD_FONT),
+    ('FONTNAME', (0, 1), (-1, -1), CALIBRI_FONT),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP')
+])
+
+_RA_LIVING_ALONE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _RA_LIVING_ALONE_COLOR),  # Title row
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('SPAN', (0, 0), (-1, 0)),  # Merge title row across all columns
+    ('BACKGROUND', (0, 1), (-1, 1), _RA_LIVING_ALONE_COLOR),  # Header row
+    ('TEXTCOLOR', (0, 1), (-1, 1), colors.white),
+    ('BACKGROUND', (0, 2), (-1, -1), _RA_LIVING_ALONE_FIELD_COLOR),  # All data rows
+    ('TEXTCOLOR', (0, 2), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('ALIGN', (0, 1), (-1, 1), 'CENTER'),
+    ('ALIGN', (0, 2), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 2), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 1), CALIBRI_BOLD_FONT),
+    ('FONTNAME', (0, 2), (-1, -1), CALIBRI_FONT),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('SPAN', (0, _RA_VIOLENCE_ROW), (-1, _RA_VIOLENCE_ROW)),  # Merge Violence/Abuse row
+    ('SPAN', (0, _RA_NOTE_ROW), (-1, _RA_NOTE_ROW))  # Merge note row
+])
+
+@lru_cache(maxsize=1)
+def _risk_assessment_details_table_style():
+    """Participant details table style, built on first use as it needs the Calibri fonts"""
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), _RA_HEADER_COLOR),  # Left column (labels)
+        ('BACKGROUND', (1, 0), (1, -1), _RA_VALUE_COLOR),  # Right column (values)
         ('TEXTCOLOR', (0, 0), (0, -1), colors.white),  # White text for labels
         ('TEXTCOLOR', (1, 0), (1, -1), colors.black),  # Black text for values
         ('ALIGN', (0, 0), (0, -1), 'LEFT'),
@@ -3219,32 +3667,50 @@ def create_risk_assessment_from_data(csv_data, output_path, contact_name=None, a
         ('RIGHTPADDING', (0, 0), (-1, -1), 4),
         ('GRID', (0, 0), (-1, -1), 1, colors.black),
         ('VALIGN', (0, 0), (-1, -1), 'TOP')
-    ]))
+    ])
+
+def create_risk_assessment_from_data(csv_data, output_path, contact_name=None, active_users=None):
+    """
+    Create a Risk Assessment PDF from provided data dictionary.
+    
+    Args:
+        csv_data: Dictionary containing form data
+        output_path: Path where the PDF should be saved
+        contact_name: Optional name for "Person Completing this assessment"
+        active_users: Optional pre-loaded active users (for performance, not currently used but kept for consistency)
+    """
+    # Create PDF document
+    doc = SimpleDocTemplate(output_path, pagesize=A4)
+    story = []
+    
+    (title_style, heading_style, normal_style, table_text_style,
+     white_label_style, table_header_style, bold_text_style) = _risk_assessment_styles()
+    
+    # Title
+    story.append(Paragraph("PRO025 - Client Risk Assessment", title_style))
+    
+    # First table: Participant, Person Completing, Role, Date
+    first_name = csv_data.get(_KEY_FIRST_NAME, '').strip()
+    surname = csv_data.get(_KEY_SURNAME, '').strip()
+    participant_name = _join_nonempty(first_name, surname)
+    person_completing = contact_name or ''
+    role = 'Support Worker'
+    assessment_date = ''  # Empty date as requested
+    
+    first_table_data = [
+        [Paragraph('Participant', white_label_style), Paragraph(participant_name + '\n\n', table_text_style)],
+        [Paragraph('Person Completing this assessment', white_label_style), Paragraph(person_completing + '\n\n', table_text_style)],
+        [Paragraph('Role', white_label_style), Paragraph(role + '\n\n', table_text_style)],
+        [Paragraph('Date of Assessment', white_label_style), Paragraph(assessment_date + '\n\n', table_text_style)]
+    ]
+    
+    first_table = Table(first_table_data, colWidths=[2.8*inch, 3.2*inch])
+    first_table.setStyle(_risk_assessment_details_table_style())
     
     story.append(first_table)
     story.append(Spacer(1, 0.3*inch))
     
     # Common Hazards table
-    common_hazards = [
-        'Lifting, supporting and transferring',
-        'Personal care (e.g. manual handling, slip trips and falls, biological hazards, humidity etc during showering, sponging and toileting)',
-        'Using equipment or assistive technology',
-        'Client behaviours of concern that may harm themselves (is there a Behaviour Support Plan (BSP) in place?)',
-        'Client behaviours of concern that may harm others (BSP)?',
-        'Other people\'s behaviours of concern that may harm client of worker',
-        'Are there any restrictive practices in place? (BSP?)',
-        'Client\'s ability to communicate needs and wants clearly, including in emergencies. Is English their second language?',
-        'Limited informal supports',
-        'Limited formal supports or access to formal supports',
-        'Reduced choice and control',
-        'Reduced opportunities for independence',
-        'Social isolation',
-        'Dignity',
-        'Self esteem',
-        'Health conditions and wellbeing (e.g. epilepsy, heart condition etc)',
-        'Other'
-    ]
-    
     common_hazards_data = [
         [Paragraph('Common Hazards', table_header_style),
          Paragraph('Risk Identified', table_header_style),
@@ -3253,59 +3719,16 @@ def create_risk_assessment_from_data(csv_data, output_path, contact_name=None, a
          Paragraph('Implemented (Date)', table_header_style)]
     ]
     
-    for hazard in common_hazards:
-        common_hazards_data.append([
-            Paragraph(hazard + '\n\n', table_text_style),
-            '\n\n',
-            '\n\n',
-            '\n\n',
-            '\n\n'
-        ])
+    common_hazards_data += [[Paragraph(hazard + '\n\n', table_text_style), *_RA_EMPTY_CELLS]
+                            for hazard in _RA_COMMON_HAZARDS]
     
     common_hazards_table = Table(common_hazards_data, colWidths=[1.8*inch, 1.2*inch, 1.2*inch, 1.8*inch, 1*inch])
-    common_hazards_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), FIRST_TABLE_HEADER_COLOR),  # Header row - #027bc4
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 1), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), CALIBRI_BOLD_FONT),
-        ('FONTNAME', (0, 1), (-1, -1), CALIBRI_FONT),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP')
-    ]))
+    common_hazards_table.setStyle(_RA_COMMON_HAZARDS_TABLE_STYLE)
     
     story.append(common_hazards_table)
     story.append(Spacer(1, 0.3*inch))
     
     # Environmental Hazards table
-    environmental_hazards = [
-        'Slips, trips and falls risks',
-        'Air quality (including cigarette smoke)',
-        'Pets or other animals that could be dangerous to client, worker or others',
-        'High crime area',
-        'Hazardous materials/liquids',
-        'Hot water',
-        'Sharp objects',
-        'Temperature',
-        'Are there smoke alarms?',
-        'Are there fire extinguishers?',
-        'Are there RCDs (safety fuses)?',
-        'Stairs',
-        'Lighting',
-        'Is there mobile phone reception and/or working landline?',
-        'Are there any other occupants or visitors likely to be present during home visits?',
-        'Other (e.g. weapons, firearms)',
-        'Other'
-    ]
-    
     environmental_hazards_data = [
         [Paragraph('Environmental Hazards', table_header_style),
          Paragraph('Risk Identified', table_header_style),
@@ -3314,34 +3737,11 @@ def create_risk_assessment_from_data(csv_data, output_path, contact_name=None, a
          Paragraph('Implemented (Date)', table_header_style)]
     ]
     
-    for hazard in environmental_hazards:
-        environmental_hazards_data.append([
-            Paragraph(hazard + '\n\n', table_text_style),
-            '\n\n',
-            '\n\n',
-            '\n\n',
-            '\n\n'
-        ])
+    environmental_hazards_data += [[Paragraph(hazard + '\n\n', table_text_style), *_RA_EMPTY_CELLS]
+                                   for hazard in _RA_ENVIRONMENTAL_HAZARDS]
     
     environmental_hazards_table = Table(environmental_hazards_data, colWidths=[1.8*inch, 1.2*inch, 1.2*inch, 1.8*inch, 1*inch])
-    environmental_hazards_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), ENV_HAZARDS_COLOR),  # Header row
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 1), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), CALIBRI_BOLD_FONT),
-        ('FONTNAME', (0, 1), (-1, -1), CALIBRI_FONT),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP')
-    ]))
+    environmental_hazards_table.setStyle(_RA_ENV_HAZARDS_TABLE_STYLE)
     
     story.append(environmental_hazards_table)
     story.append(Spacer(1, 0.3*inch))
@@ -3356,45 +3756,15 @@ def create_risk_assessment_from_data(csv_data, output_path, contact_name=None, a
     ]
     
     # Add empty rows for medication entries
-    for i in range(5):
-        medication_data.append(['\n\n', '\n\n', '\n\n', '\n\n', '\n\n'])
+    medication_data.extend([_RA_MEDICATION_EMPTY_ROW] * 5)
     
     medication_table = Table(medication_data, colWidths=[1.5*inch, 1.2*inch, 1.5*inch, 1.2*inch, 1.6*inch])
-    medication_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), MEDICATION_COLOR),  # Header row
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), CALIBRI_BOLD_FONT),
-        ('FONTNAME', (0, 1), (-1, -1), CALIBRI_FONT),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP')
-    ]))
+    medication_table.setStyle(_RA_MEDICATION_TABLE_STYLE)
     
     story.append(medication_table)
     story.append(Spacer(1, 0.3*inch))
     
     # Living Alone Assessment table
-    living_alone_fields = [
-        'Do you feel safe at home, work, in the community?',
-        'Are there any places you don\'t feel safe?',
-        'Do you have any plans in place for emergency situations (e.g. fire, illness, injury, severe weather)?',
-        'Do you have safety equipment at home (e.g. fire extinguisher, fire blanket)?',
-        'Do you feel safe at home, work, in the community?',
-        'Do you have any plans in place for emergency situations (e.g. fire, illness, injury, severe weather)?',
-        'Have you ever been injured, fallen etc?',
-        'Informal supports: family and friends - who visits and how often?',
-        'Paid supports - which services are engaged, number of services and support workers, number of visitors per week estimate',
-        'What is your ability to contact people if you need their help (e.g. family, friends, staff by phone or by other method)?'
-    ]
-    
     living_alone_data = [
         # Title row - merged across all columns
         [Paragraph('Living Alone Assessment (To be completed if the client is living alone)', table_header_style),
@@ -3406,20 +3776,8 @@ def create_risk_assessment_from_data(csv_data, output_path, contact_name=None, a
          Paragraph('Implemented (Date)', table_header_style)]
     ]
     
-    for field in living_alone_fields:
-        living_alone_data.append([
-            Paragraph(field + '\n\n', table_text_style),
-            '\n\n',
-            '\n\n',
-            '\n\n'
-        ])
-    
-    # Create bold style for Violence/Abuse section
-    bold_text_style = ParagraphStyle(
-        'BoldText',
-        parent=table_text_style,
-        fontName=get_calibri_bold_font()
-    )
+    living_alone_data += [[Paragraph(field + '\n\n', table_text_style), *_RA_EMPTY_CELLS[:3]]
+                          for field in _RA_LIVING_ALONE_FIELDS]
     
     # Add Violence, Abuse section - span all columns
     living_alone_data.append([
@@ -3440,52 +3798,11 @@ def create_risk_assessment_from_data(csv_data, output_path, contact_name=None, a
         '', '', ''
     ])
     
-    violence_abuse_fields = [
-        'Have you ever been hurt by anyone?',
-        'Has anyone ever taken advantage of you?',
-        'Does anyone yell or curse at you?',
-        'If yes to any of the above questions: if so, who did you tell?',
-        'What was done to address your concerns?'
-    ]
-    
-    for field in violence_abuse_fields:
-        living_alone_data.append([
-            Paragraph(field + '\n\n', table_text_style),
-            '\n\n',
-            '\n\n',
-            '\n\n'
-        ])
-    
-    # Find rows for Violence/Abuse and note to span across all columns
-    # Violence/Abuse is after the 10 living_alone_fields, so row index (0-based: title=0, header=1, fields=2-11, violence=12)
-    violence_row = 2 + len(living_alone_fields)  # Row index for Violence/Abuse
-    note_row = violence_row + 2  # Row index for the note
+    living_alone_data += [[Paragraph(field + '\n\n', table_text_style), *_RA_EMPTY_CELLS[:3]]
+                          for field in _RA_VIOLENCE_ABUSE_FIELDS]
     
     living_alone_table = Table(living_alone_data, colWidths=[2*inch, 1.5*inch, 2*inch, 1.5*inch])
-    living_alone_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), LIVING_ALONE_COLOR),  # Title row
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('SPAN', (0, 0), (-1, 0)),  # Merge title row across all columns
-        ('BACKGROUND', (0, 1), (-1, 1), LIVING_ALONE_COLOR),  # Header row
-        ('TEXTCOLOR', (0, 1), (-1, 1), colors.white),
-        ('BACKGROUND', (0, 2), (-1, -1), LIVING_ALONE_FIELD_COLOR),  # All data rows
-        ('TEXTCOLOR', (0, 2), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('ALIGN', (0, 1), (-1, 1), 'CENTER'),
-        ('ALIGN', (0, 2), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 2), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 1), CALIBRI_BOLD_FONT),
-        ('FONTNAME', (0, 2), (-1, -1), CALIBRI_FONT),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('SPAN', (0, violence_row), (-1, violence_row)),  # Merge Violence/Abuse row
-        ('SPAN', (0, note_row), (-1, note_row))  # Merge note row
-    ]))
+    living_alone_table.setStyle(_RA_LIVING_ALONE_TABLE_STYLE)
     
     story.append(living_alone_table)
     
@@ -3493,6 +3810,106 @@ def create_risk_assessment_from_data(csv_data, output_path, contact_name=None, a
     doc.build(story, onFirstPage=_add_first_page_header, onLaterPages=_add_header_footer)
     print("Risk Assessment PDF created successfully!")
 
+# Support plan box colour, used for borders, text and the title background
+_SP_BOX_COLOR = colors.HexColor('#256eb7')
+
+# Single-cell table styles for the support plan boxes
+_SP_BOX_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 1, _SP_BOX_COLOR),
+])
+_SP_TITLE_BOX_TABLE_STYLE = TableStyle(
+    [('BACKGROUND', (0, 0), (-1, -1), _SP_BOX_COLOR)],
+    parent=_SP_BOX_TABLE_STYLE
+)
+
+# Support plan paragraph styles
+SP_CENTERED_STYLE = ParagraphStyle(
+    'Centered',
+    parent=_SAMPLE_STYLES['Normal'],
+    fontSize=12,
+    textColor=_SP_BOX_COLOR,
+    alignment=TA_CENTER,
+    spaceAfter=0,
+    leading=14,
+    fontName='Helvetica'
+)
+
+SP_BOX_HEADING_STYLE = ParagraphStyle(
+    'BoxHeading',
+    parent=_SAMPLE_STYLES['Normal'],
+    fontSize=12,
+    textColor=_SP_BOX_COLOR,
+    alignment=TA_LEFT,
+    spaceAfter=6,
+    leading=14,
+    fontName='Helvetica-Bold'
+)
+
+SP_BOX_TEXT_STYLE = ParagraphStyle(
+    'BoxText',
+    parent=_SAMPLE_STYLES['Normal'],
+    fontSize=12,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leading=14,
+    leftIndent=6,
+    rightIndent=6,
+    fontName='Helvetica'
+)
+
+SP_BOX_TEXT_CENTERED_STYLE = ParagraphStyle(
+    'BoxTextCentered',
+    parent=_SAMPLE_STYLES['Normal'],
+    fontSize=12,
+    alignment=TA_CENTER,
+    spaceAfter=0,
+    leading=14,
+    leftIndent=6,
+    rightIndent=6,
+    fontName='Helvetica'
+)
+
+SP_BOX_TEXT_ITALIC_STYLE = ParagraphStyle(
+    'BoxTextItalic',
+    parent=_SAMPLE_STYLES['Normal'],
+    fontSize=12,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leading=14,
+    leftIndent=6,
+    rightIndent=6,
+    fontName='Helvetica-Oblique'
+)
+
+SP_TITLE_STYLE = ParagraphStyle(
+    'Title',
+    parent=_SAMPLE_STYLES['Normal'],
+    fontSize=18,
+    textColor=colors.white,
+    alignment=TA_CENTER,
+    spaceAfter=0,
+    leading=22,
+    fontName='Helvetica-Bold'
+)
+
+# Spacing style for empty lines - with explicit leading to ensure visible spacing
+SP_SPACING_STYLE = ParagraphStyle(
+    'Spacing',
+    parent=_SAMPLE_STYLES['Normal'],
+    fontSize=12,
+    alignment=TA_LEFT,
+    spaceAfter=0,
+    leading=14,
+    leftIndent=6,
+    rightIndent=6,
+    fontName='Helvetica'
+)
+
 def create_support_plan_from_data(csv_data, output_path, contact_name=None, active_users=None):
     """
     Create a Support Plan PDF document from provided data dictionary.
@@ -3504,13 +3921,12 @@ def create_support_plan_from_data(csv_data, output_path, contact_name=None, acti
         active_users: Optional pre-loaded active users (for performance)
     """
     # Define colors
-    border_color = colors.HexColor('#256eb7')  # #256eb7 for borders and text
-    title_bg_color = colors.HexColor('#256eb7')  # #256eb7 for title background
+    border_color = _SP_BOX_COLOR  # #256eb7 for borders and text
     
     # Get team value to determine which active users CSV to use
     team_value = csv_data.get('Neighbourhood Care representative team', '')
     # Clean up checkbox characters
-    team_value = team_value.replace('\uf0d7', '').replace('•', '').replace('●', '').replace('☐', '').replace('☑', '').replace('✓', '').strip()
+    team_value = _clean_checkboxes(team_value)
     
     # Load active users based on team if not provided
     if active_users is None:
@@ -3521,149 +3937,43 @@ def create_support_plan_from_data(csv_data, output_path, contact_name=None, acti
     key_contact_data = lookup_user_data(active_users, key_contact_name_to_use) if key_contact_name_to_use else {'name': '', 'mobile': '', 'email': '', 'team': ''}
     
     # Extract client information
-    first_name = csv_data.get('First name (Details of the Client)', '').strip()
-    surname = csv_data.get('Surname (Details of the Client)', '').strip()
-    dob_str = csv_data.get('Date of birth (Details of the Client)', '').strip()
+    first_name = csv_data.get(_KEY_FIRST_NAME, '').strip()
+    surname = csv_data.get(_KEY_SURNAME, '').strip()
+    dob_str = csv_data.get(_KEY_DOB, '').strip()
     home_address = csv_data.get('Home address (Contact Details of the Client)', '').strip()
     
     # Create PDF document
     doc = SimpleDocTemplate(output_path, pagesize=A4)
     story = []
-    styles = getSampleStyleSheet()
-    
-    # Create custom styles
-    centered_style = ParagraphStyle(
-        'Centered',
-        parent=styles['Normal'],
-        fontSize=12,
-        textColor=border_color,
-        alignment=TA_CENTER,
-        spaceAfter=0,
-        leading=14,
-        fontName='Helvetica'
-    )
-    
-    centered_bold_style = ParagraphStyle(
-        'CenteredBold',
-        parent=styles['Normal'],
-        fontSize=12,
-        textColor=border_color,
-        alignment=TA_CENTER,
-        spaceAfter=0,
-        leading=14,
-        fontName='Helvetica-Bold'
-    )
-    
-    box_heading_style = ParagraphStyle(
-        'BoxHeading',
-        parent=styles['Normal'],
-        fontSize=12,
-        textColor=border_color,
-        alignment=TA_LEFT,
-        spaceAfter=6,
-        leading=14,
-        fontName='Helvetica-Bold'
-    )
-    
-    box_text_style = ParagraphStyle(
-        'BoxText',
-        parent=styles['Normal'],
-        fontSize=12,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leading=14,
-        leftIndent=6,
-        rightIndent=6,
-        fontName='Helvetica'
-    )
-    
-    box_text_centered_style = ParagraphStyle(
-        'BoxTextCentered',
-        parent=styles['Normal'],
-        fontSize=12,
-        alignment=TA_CENTER,
-        spaceAfter=0,
-        leading=14,
-        leftIndent=6,
-        rightIndent=6,
-        fontName='Helvetica'
-    )
-    
-    box_text_italic_style = ParagraphStyle(
-        'BoxTextItalic',
-        parent=styles['Normal'],
-        fontSize=12,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leading=14,
-        leftIndent=6,
-        rightIndent=6,
-        fontName='Helvetica-Oblique'
-    )
-    
-    title_style = ParagraphStyle(
-        'Title',
-        parent=styles['Normal'],
-        fontSize=18,
-        textColor=colors.white,
-        alignment=TA_CENTER,
-        spaceAfter=0,
-        leading=22,
-        fontName='Helvetica-Bold'
-    )
-    
-    # Spacing style for empty lines - with explicit leading to ensure visible spacing
-    spacing_style = ParagraphStyle(
-        'Spacing',
-        parent=styles['Normal'],
-        fontSize=12,
-        alignment=TA_LEFT,
-        spaceAfter=0,
-        leading=14,
-        leftIndent=6,
-        rightIndent=6,
-        fontName='Helvetica'
-    )
-    
     # Helper function to create a boxed section (PDF table)
-    def create_boxed_section(content_paragraphs, bg_color=None):
+    def create_boxed_section(content_paragraphs, table_style=_SP_BOX_TABLE_STYLE):
         """Create a PDF table with one cell that acts as a box"""
         if not content_paragraphs:
-            content_paragraphs = [Paragraph('', box_text_style)]
+            content_paragraphs = [Paragraph('', SP_BOX_TEXT_STYLE)]
         box_data = [[content_paragraphs]]
         box_table = Table(box_data, colWidths=[6*inch])
-        box_style = [
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 1, border_color),
-        ]
-        if bg_color:
-            box_style.append(('BACKGROUND', (0, 0), (-1, -1), bg_color))
-        box_table.setStyle(TableStyle(box_style))
+        box_table.setStyle(table_style)
         return box_table
     
     # Title box - "My Support Plan"
-    title_content = [Paragraph('My Support Plan', title_style)]
-    title_box = create_boxed_section(title_content, bg_color=title_bg_color)
+    title_content = [Paragraph('My Support Plan', SP_TITLE_STYLE)]
+    title_box = create_boxed_section(title_content, _SP_TITLE_BOX_TABLE_STYLE)
     story.append(title_box)
     story.append(Spacer(1, 12))
     
     # Header section - centered text
-    story.append(Paragraph(f'My Name: {first_name} {surname}'.strip() if (first_name or surname) else 'My Name:', centered_style))
-    story.append(Paragraph(f'My Date of Birth: {dob_str}' if dob_str else 'My Date of Birth:', centered_style))
-    story.append(Paragraph(f'My Address: {home_address}' if home_address else 'My Address:', centered_style))
+    story.append(Paragraph(f'My Name: {first_name} {surname}'.strip() if (first_name or surname) else 'My Name:', SP_CENTERED_STYLE))
+    story.append(Paragraph(f'My Date of Birth: {dob_str}' if dob_str else 'My Date of Birth:', SP_CENTERED_STYLE))
+    story.append(Paragraph(f'My Address: {home_address}' if home_address else 'My Address:', SP_CENTERED_STYLE))
     story.append(Spacer(1, 12))
     
     # About this Plan section
     about_plan_content = [
-        Paragraph('<b>About this Plan</b>', box_heading_style),
-        Paragraph('• This plan lets you share information about who you are, what your life is like and your dreams', box_text_centered_style),
-        Paragraph('• You can make this plan by yourself, with your support worker or with someone you choose', box_text_centered_style),
-        Paragraph('• This plan contains your goals and what supports you need to help you achieve them', box_text_centered_style),
-        Paragraph('• This plan has the supports you have now around you and how they can help you achieve your goals', box_text_centered_style),
+        Paragraph('<b>About this Plan</b>', SP_BOX_HEADING_STYLE),
+        Paragraph('• This plan lets you share information about who you are, what your life is like and your dreams', SP_BOX_TEXT_CENTERED_STYLE),
+        Paragraph('• You can make this plan by yourself, with your support worker or with someone you choose', SP_BOX_TEXT_CENTERED_STYLE),
+        Paragraph('• This plan contains your goals and what supports you need to help you achieve them', SP_BOX_TEXT_CENTERED_STYLE),
+        Paragraph('• This plan has the supports you have now around you and how they can help you achieve your goals', SP_BOX_TEXT_CENTERED_STYLE),
     ]
     about_plan_box = create_boxed_section(about_plan_content)
     story.append(about_plan_box)
@@ -3671,24 +3981,24 @@ def create_support_plan_from_data(csv_data, output_path, contact_name=None, acti
     
     # My Support Team section
     support_team_content = [
-        Paragraph(f"My Support Team: {key_contact_data.get('team', '') if key_contact_data.get('team') else ''}", box_text_style),
-        Paragraph(f"My Key Contact: {key_contact_data.get('name', '') if key_contact_data.get('name') and key_contact_data.get('name') != '[Not Found]' else ''}", box_text_style),
-        Paragraph(f"Contact Number: {key_contact_data.get('mobile', '') if key_contact_data.get('mobile') and key_contact_data.get('mobile') != '[Not Found]' else ''}", box_text_style),
-        Paragraph(f"Email: {key_contact_data.get('email', '') if key_contact_data.get('email') and key_contact_data.get('email') != '[Not Found]' else ''}", box_text_style),
+        Paragraph(f"My Support Team: {key_contact_data.get('team', '') if key_contact_data.get('team') else ''}", SP_BOX_TEXT_STYLE),
+        Paragraph(f"My Key Contact: {key_contact_data.get('name', '') if key_contact_data.get('name') and key_contact_data.get('name') != '[Not Found]' else ''}", SP_BOX_TEXT_STYLE),
+        Paragraph(f"Contact Number: {key_contact_data.get('mobile', '') if key_contact_data.get('mobile') and key_contact_data.get('mobile') != '[Not Found]' else ''}", SP_BOX_TEXT_STYLE),
+        Paragraph(f"Email: {key_contact_data.get('email', '') if key_contact_data.get('email') and key_contact_data.get('email') != '[Not Found]' else ''}", SP_BOX_TEXT_STYLE),
     ]
     support_team_box = create_boxed_section(support_team_content)
     story.append(support_team_box)
     story.append(Spacer(1, 12))
     
     # What are some of the things section
-    story.append(Paragraph('What are some of the things that you want the people supporting you to know about you?', centered_style))
+    story.append(Paragraph('What are some of the things that you want the people supporting you to know about you?', SP_CENTERED_STYLE))
     story.append(Spacer(1, 12))
     
     # About Me box
     about_me_content = [
-        Paragraph('<b>About Me</b>', box_heading_style),
-        Paragraph('<i>For example, your living situation, study, friends, family/relationships, your personality, things that are important to you, how you spend your leisure time</i>', box_text_italic_style),
-        Paragraph('<br/><br/><br/><br/><br/>', spacing_style),
+        Paragraph('<b>About Me</b>', SP_BOX_HEADING_STYLE),
+        Paragraph('<i>For example, your living situation, study, friends, family/relationships, your personality, things that are important to you, how you spend your leisure time</i>', SP_BOX_TEXT_ITALIC_STYLE),
+        Paragraph('<br/><br/><br/><br/><br/>', SP_SPACING_STYLE),
     ]
     about_me_box = create_boxed_section(about_me_content)
     story.append(about_me_box)
@@ -3696,11 +4006,11 @@ def create_support_plan_from_data(csv_data, output_path, contact_name=None, acti
     
     # My NDIS Goals box
     ndis_goals_content = [
-        Paragraph('<b>My NDIS Goals</b>', box_heading_style),
-        Paragraph('Short term goals', box_text_style),
-        Paragraph('<br/><br/><br/>', spacing_style),
-        Paragraph('Medium & Long term goals', box_text_style),
-        Paragraph('<br/><br/><br/>', spacing_style),
+        Paragraph('<b>My NDIS Goals</b>', SP_BOX_HEADING_STYLE),
+        Paragraph('Short term goals', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/><br/><br/>', SP_SPACING_STYLE),
+        Paragraph('Medium & Long term goals', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/><br/><br/>', SP_SPACING_STYLE),
     ]
     ndis_goals_box = create_boxed_section(ndis_goals_content)
     story.append(ndis_goals_box)
@@ -3708,17 +4018,17 @@ def create_support_plan_from_data(csv_data, output_path, contact_name=None, acti
     
     # Gift of the Head, Heart & Hand box
     gift_content = [
-        Paragraph('<b>Gift of the Head, Heart & Hand</b>', box_heading_style),
-        Paragraph('<br/>', box_text_style),
-        Paragraph('<b>GIFTS OF THE HEAD</b>', box_heading_style),
-        Paragraph('(What special knowledge, expertise, life experience do you have that you can share with others?)', box_text_style),
-        Paragraph('<br/><br/><br/>', spacing_style),
-        Paragraph('<b>GIFTS OF THE HEART</b>', box_heading_style),
-        Paragraph('(What things are really important to you, that you deeply care about and would welcome to share with others?)', box_text_style),
-        Paragraph('<br/><br/><br/>', spacing_style),
-        Paragraph('<b>GIFTS OF THE HAND</b>', box_heading_style),
-        Paragraph('(What practical skill do you bring with you, that you are good at, proud of and you may wish to share with others?)', box_text_style),
-        Paragraph('<br/><br/><br/>', spacing_style),
+        Paragraph('<b>Gift of the Head, Heart & Hand</b>', SP_BOX_HEADING_STYLE),
+        Paragraph('<br/>', SP_BOX_TEXT_STYLE),
+        Paragraph('<b>GIFTS OF THE HEAD</b>', SP_BOX_HEADING_STYLE),
+        Paragraph('(What special knowledge, expertise, life experience do you have that you can share with others?)', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/><br/><br/>', SP_SPACING_STYLE),
+        Paragraph('<b>GIFTS OF THE HEART</b>', SP_BOX_HEADING_STYLE),
+        Paragraph('(What things are really important to you, that you deeply care about and would welcome to share with others?)', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/><br/><br/>', SP_SPACING_STYLE),
+        Paragraph('<b>GIFTS OF THE HAND</b>', SP_BOX_HEADING_STYLE),
+        Paragraph('(What practical skill do you bring with you, that you are good at, proud of and you may wish to share with others?)', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/><br/><br/>', SP_SPACING_STYLE),
     ]
     gift_box = create_boxed_section(gift_content)
     story.append(gift_box)
@@ -3726,8 +4036,8 @@ def create_support_plan_from_data(csv_data, output_path, contact_name=None, acti
     
     # My Dreams box
     dreams_content = [
-        Paragraph('<b>My Dreams</b>', box_heading_style),
-        Paragraph('<br/><br/><br/><br/><br/>', spacing_style),
+        Paragraph('<b>My Dreams</b>', SP_BOX_HEADING_STYLE),
+        Paragraph('<br/><br/><br/><br/><br/>', SP_SPACING_STYLE),
     ]
     dreams_box = create_boxed_section(dreams_content)
     story.append(dreams_box)
@@ -3735,8 +4045,8 @@ def create_support_plan_from_data(csv_data, output_path, contact_name=None, acti
     
     # People in My Life box
     people_content = [
-        Paragraph('<b>People in My Life</b>', box_heading_style),
-        Paragraph('<br/><br/><br/><br/><br/>', spacing_style),
+        Paragraph('<b>People in My Life</b>', SP_BOX_HEADING_STYLE),
+        Paragraph('<br/><br/><br/><br/><br/>', SP_SPACING_STYLE),
     ]
     people_box = create_boxed_section(people_content)
     story.append(people_box)
@@ -3751,12 +4061,12 @@ def create_support_plan_from_data(csv_data, output_path, contact_name=None, acti
     
     week_table_data = []
     # Header row
-    header_row = [Paragraph('', box_text_centered_style)] + [Paragraph(f'<b>{day}</b>', box_text_centered_style) for day in days[1:]]
+    header_row = [Paragraph('', SP_BOX_TEXT_CENTERED_STYLE)] + [Paragraph(f'<b>{day}</b>', SP_BOX_TEXT_CENTERED_STYLE) for day in days[1:]]
     week_table_data.append(header_row)
     
     # Time rows
     for time in times:
-        row = [Paragraph(f'<b>{time}</b>', box_text_centered_style)] + [Paragraph('', box_text_centered_style) for _ in range(7)]
+        row = [Paragraph(f'<b>{time}</b>', SP_BOX_TEXT_CENTERED_STYLE)] + [Paragraph('', SP_BOX_TEXT_CENTERED_STYLE) for _ in range(7)]
         week_table_data.append(row)
     
     week_table = Table(week_table_data, colWidths=[1*inch] + [0.7*inch]*7)
@@ -3772,10 +4082,10 @@ def create_support_plan_from_data(csv_data, output_path, contact_name=None, acti
     
     # Create box with header and description
     week_content = [
-        Paragraph('<b>My Week</b>', box_heading_style),
-        Paragraph('<br/>', box_text_style),
-        Paragraph(week_description_text, box_text_style),
-        Paragraph('<br/>', box_text_style),
+        Paragraph('<b>My Week</b>', SP_BOX_HEADING_STYLE),
+        Paragraph('<br/>', SP_BOX_TEXT_STYLE),
+        Paragraph(week_description_text, SP_BOX_TEXT_STYLE),
+        Paragraph('<br/>', SP_BOX_TEXT_STYLE),
     ]
     week_box = create_boxed_section(week_content)
     story.append(week_box)
@@ -3797,9 +4107,9 @@ def create_support_plan_from_data(csv_data, output_path, contact_name=None, acti
     
     # My Safety box
     safety_content = [
-        Paragraph('<b>My Safety</b>', box_heading_style),
-        Paragraph('Following on from the risk assessment, were there people, places or times that you feel unsafe? What changes need to be made and what support is needed so that you feel safe? Is there a formal safety plan in place? Is one needed?', box_text_style),
-        Paragraph('<br/><br/><br/><br/><br/>', spacing_style),
+        Paragraph('<b>My Safety</b>', SP_BOX_HEADING_STYLE),
+        Paragraph('Following on from the risk assessment, were there people, places or times that you feel unsafe? What changes need to be made and what support is needed so that you feel safe? Is there a formal safety plan in place? Is one needed?', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/><br/><br/><br/><br/>', SP_SPACING_STYLE),
     ]
     safety_box = create_boxed_section(safety_content)
     story.append(safety_box)
@@ -3807,9 +4117,9 @@ def create_support_plan_from_data(csv_data, output_path, contact_name=None, acti
     
     # My Medications box
     med_content = [
-        Paragraph('<b>My Medications and how I manage them</b>', box_heading_style),
-        Paragraph('Do you need assistance with organising and taking your medication?', box_text_style),
-        Paragraph('<br/><br/><br/><br/><br/>', spacing_style),
+        Paragraph('<b>My Medications and how I manage them</b>', SP_BOX_HEADING_STYLE),
+        Paragraph('Do you need assistance with organising and taking your medication?', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/><br/><br/><br/><br/>', SP_SPACING_STYLE),
     ]
     med_box = create_boxed_section(med_content)
     story.append(med_box)
@@ -3817,9 +4127,9 @@ def create_support_plan_from_data(csv_data, output_path, contact_name=None, acti
     
     # My special supports box
     special_content = [
-        Paragraph('<b>My special supports</b>', box_heading_style),
-        Paragraph('Do you have any support needs or equipment and do you have plans already to help make sure your support workers know how to care for you such as:', box_text_style),
-        Paragraph('<br/><br/><br/><br/><br/>', spacing_style),
+        Paragraph('<b>My special supports</b>', SP_BOX_HEADING_STYLE),
+        Paragraph('Do you have any support needs or equipment and do you have plans already to help make sure your support workers know how to care for you such as:', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/><br/><br/><br/><br/>', SP_SPACING_STYLE),
     ]
     special_box = create_boxed_section(special_content)
     story.append(special_box)
@@ -3827,24 +4137,24 @@ def create_support_plan_from_data(csv_data, output_path, contact_name=None, acti
     
     # My Goals box
     goals_content = [
-        Paragraph('<b>My Goals</b>', box_heading_style),
-        Paragraph('<br/>', box_text_style),
-        Paragraph('My SMART Goal 1', box_text_style),
-        Paragraph('<br/>', box_text_style),
-        Paragraph('Strategies - What will help me achieve my goal? Who will help me achieve my goal? What supports will I need?', box_text_style),
-        Paragraph('<br/><br/><br/>', spacing_style),
-        Paragraph('My SMART Goal 2', box_text_style),
-        Paragraph('<br/>', box_text_style),
-        Paragraph('Strategies - What will help me achieve my goal? Who will help me achieve my goal? What supports will I need?', box_text_style),
-        Paragraph('<br/><br/><br/>', spacing_style),
-        Paragraph('My SMART Goal 3', box_text_style),
-        Paragraph('<br/>', box_text_style),
-        Paragraph('Strategies - What will help me achieve my goal? Who will help me achieve my goal? What supports will I need?', box_text_style),
-        Paragraph('<br/><br/><br/>', spacing_style),
-        Paragraph('My SMART Goal 4', box_text_style),
-        Paragraph('<br/>', box_text_style),
-        Paragraph('Strategies - What will help me achieve my goal? Who will help me achieve my goal? What supports will I need?', box_text_style),
-        Paragraph('<br/><br/><br/>', spacing_style),
+        Paragraph('<b>My Goals</b>', SP_BOX_HEADING_STYLE),
+        Paragraph('<br/>', SP_BOX_TEXT_STYLE),
+        Paragraph('My SMART Goal 1', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/>', SP_BOX_TEXT_STYLE),
+        Paragraph('Strategies - What will help me achieve my goal? Who will help me achieve my goal? What supports will I need?', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/><br/><br/>', SP_SPACING_STYLE),
+        Paragraph('My SMART Goal 2', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/>', SP_BOX_TEXT_STYLE),
+        Paragraph('Strategies - What will help me achieve my goal? Who will help me achieve my goal? What supports will I need?', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/><br/><br/>', SP_SPACING_STYLE),
+        Paragraph('My SMART Goal 3', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/>', SP_BOX_TEXT_STYLE),
+        Paragraph('Strategies - What will help me achieve my goal? Who will help me achieve my goal? What supports will I need?', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/><br/><br/>', SP_SPACING_STYLE),
+        Paragraph('My SMART Goal 4', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/>', SP_BOX_TEXT_STYLE),
+        Paragraph('Strategies - What will help me achieve my goal? Who will help me achieve my goal? What supports will I need?', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/><br/><br/>', SP_SPACING_STYLE),
     ]
     goals_box = create_boxed_section(goals_content)
     story.append(goals_box)
@@ -3852,16 +4162,16 @@ def create_support_plan_from_data(csv_data, output_path, contact_name=None, acti
     
     # How I Will Celebrate box
     celebrate_content = [
-        Paragraph('<b>How I Will Celebrate Achieving My Goals</b>', box_heading_style),
-        Paragraph('<br/>', box_text_style),
-        Paragraph('Goal 1', box_text_style),
-        Paragraph('<br/><br/><br/>', spacing_style),
-        Paragraph('Goal 2', box_text_style),
-        Paragraph('<br/><br/><br/>', spacing_style),
-        Paragraph('Goal 3', box_text_style),
-        Paragraph('<br/><br/><br/>', spacing_style),
-        Paragraph('Goal 4', box_text_style),
-        Paragraph('<br/><br/><br/>', spacing_style),
+        Paragraph('<b>How I Will Celebrate Achieving My Goals</b>', SP_BOX_HEADING_STYLE),
+        Paragraph('<br/>', SP_BOX_TEXT_STYLE),
+        Paragraph('Goal 1', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/><br/><br/>', SP_SPACING_STYLE),
+        Paragraph('Goal 2', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/><br/><br/>', SP_SPACING_STYLE),
+        Paragraph('Goal 3', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/><br/><br/>', SP_SPACING_STYLE),
+        Paragraph('Goal 4', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/><br/><br/>', SP_SPACING_STYLE),
     ]
     celebrate_box = create_boxed_section(celebrate_content)
     story.append(celebrate_box)
@@ -3869,10 +4179,10 @@ def create_support_plan_from_data(csv_data, output_path, contact_name=None, acti
     
     # Final signature section
     signature_content = [
-        Paragraph('<b>This Is My Plan</b>', box_heading_style),
-        Paragraph(f'<b>Signature:</b> {first_name} {surname}'.strip() if (first_name or surname) else '<b>Signature:</b>', box_text_style),
-        Paragraph('<br/>', box_text_style),
-        Paragraph('<b>Date:</b>', box_text_style),
+        Paragraph('<b>This Is My Plan</b>', SP_BOX_HEADING_STYLE),
+        Paragraph(f'<b>Signature:</b> {first_name} {surname}'.strip() if (first_name or surname) else '<b>Signature:</b>', SP_BOX_TEXT_STYLE),
+        Paragraph('<br/>', SP_BOX_TEXT_STYLE),
+        Paragraph('<b>Date:</b>', SP_BOX_TEXT_STYLE),
     ]
     signature_box = create_boxed_section(signature_content)
     story.append(signature_box)
@@ -3881,25 +4191,30 @@ def create_support_plan_from_data(csv_data, output_path, contact_name=None, acti
     doc.build(story, onFirstPage=_add_first_page_header, onLaterPages=_add_header_footer)
     print(f"Support Plan PDF created successfully: {output_path}")
 
+# Medication assistance plan colours
+_MP_TEXT_COLOR = colors.HexColor('#007bc4')  # Headings
+_MP_BOX_FILL_COLOR = colors.HexColor('#e0f4ff')  # Box backgrounds
+_MP_BORDER_COLOR = _SP_BOX_COLOR  # Table borders, same #256eb7 as the support plan
+
 def create_medication_assistance_plan_from_data(csv_data, output_path, contact_name=None, active_users=None):
     """
     Create a Medication Assistance Plan PDF document from CSV data
     """
     # Define colors
-    text_color = colors.HexColor('#007bc4')  # #007bc4 for headings
-    box_fill_color = colors.HexColor('#e0f4ff')  # #e0f4ff for box backgrounds
-    border_color = colors.HexColor('#256eb7')  # #256eb7 for table borders
+    text_color = _MP_TEXT_COLOR  # #007bc4 for headings
+    box_fill_color = _MP_BOX_FILL_COLOR  # #e0f4ff for box backgrounds
+    border_color = _MP_BORDER_COLOR  # #256eb7 for table borders
     
     # Extract client information
-    first_name = csv_data.get('First name (Details of the Client)', '').strip()
-    surname = csv_data.get('Surname (Details of the Client)', '').strip()
-    dob_str = csv_data.get('Date of birth (Details of the Client)', '').strip()
+    first_name = csv_data.get(_KEY_FIRST_NAME, '').strip()
+    surname = csv_data.get(_KEY_SURNAME, '').strip()
+    dob_str = csv_data.get(_KEY_DOB, '').strip()
     ndis_number = csv_data.get('NDIS number (Details of the Client)', '').strip()
     medicare_number = csv_data.get('Medicare number (Details of the Client)', '').strip() if csv_data.get('Medicare number (Details of the Client)') else ''
     
     # Get key contact name (similar to service agreement)
     team_value = csv_data.get('Neighbourhood Care representative team', '')
-    team_value = team_value.replace('\uf0d7', '').replace('•', '').replace('●', '').replace('☐', '').replace('☑', '').replace('✓', '').strip()
+    team_value = _clean_checkboxes(team_value)
     contact_name_to_use = contact_name or csv_data.get('Respondent', '')
     if active_users and contact_name_to_use:
         user_data = lookup_user_data(active_users, contact_name_to_use)
@@ -4117,7 +4432,7 @@ def create_medication_assistance_plan_from_data(csv_data, output_path, contact_n
     assistance_items = []
     if communication_assistance:
         assistance_items.append(f'• {communication_assistance}')
-    if medication_assistance_needed and medication_assistance_needed.lower() in ['yes', 'y']:
+    if medication_assistance_needed and medication_assistance_needed.lower() in _YES_VALUES:
         assistance_items.append('• Medication assistance')
     if equipment_assistive:
         assistance_items.append(f'• {equipment_assistive}')